@@ -1578,16 +1578,21 @@ class FreeCADSocketServer:
             "create_sketch": self.sketch_ops.create_sketch,
             "close_sketch": self.sketch_ops.close_sketch,
             "verify_sketch": self.sketch_ops.verify_sketch,
+            "begin_batch": self.sketch_ops.begin_batch,
+            "end_batch": self.sketch_ops.end_batch,
             # Geometry
             "add_line": self.sketch_ops.add_line,
             "add_circle": self.sketch_ops.add_circle,
             "add_rectangle": self.sketch_ops.add_rectangle,
+            "add_rectangles": self.sketch_ops.add_rectangles,
             "add_arc": self.sketch_ops.add_arc,
             "add_polygon": self.sketch_ops.add_polygon,
             "add_slot": self.sketch_ops.add_slot,
+            "add_geometry_batch": self.sketch_ops.add_geometry_batch,
             "add_fillet": self.sketch_ops.add_fillet,
             # Constraints
             "add_constraint": self.sketch_ops.add_constraint,
+            "add_constraints": self.sketch_ops.add_constraints,
             "delete_constraint": self.sketch_ops.delete_constraint,
             "list_constraints": self.sketch_ops.list_constraints,
             # External geometry
@@ -1665,6 +1670,7 @@ class FreeCADSocketServer:
             "get_selection":      self.view_ops.get_selection,
             "hide_object":        self.view_ops.hide_object,
             "show_object":        self.view_ops.show_object,
+            "set_objects_visibility": self.view_ops.set_objects_visibility,
             "delete_object":      self.view_ops.delete_object,
             "undo":               self.view_ops.undo,
             "redo":               self.view_ops.redo,
@@ -712,6 +712,7 @@ class AssemblyOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             assembly, err = self._resolve_assembly(assembly_name, doc)
             if err:
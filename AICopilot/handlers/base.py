@@ -12,6 +12,11 @@ else:
     FreeCADGui = None
 
 
+# Appended to a success message when the caller passed defer_recompute=True,
+# so it knows results aren't computed until the next recompute.
+DEFERRED_NOTE = " (recompute deferred — run view_control(operation='recompute') when done)"
+
+
 def mm_min_to_mm_s(value):
     """Convert a user-supplied feed rate in mm/min to the mm/s value FreeCAD's
     App::PropertySpeed feed/rapid properties expect internally.
@@ -32,6 +37,17 @@ class BaseHandler:
     Provides common utilities and document access patterns.
     """
 
+    # Documents whose recompute was deferred via recompute(doc, defer=True).
+    # Shared by every handler instance on purpose: a deferral made by one
+    # handler is settled by whichever handler next recomputes that document
+    # (or by flush_recomputes()).
+    _pending_recompute = set()
+
+    # (document Name, sketch Name) pairs opened with sketch begin_batch.
+    # Geometry adds into these sketches defer their recompute. Shared like
+    # _pending_recompute so flush_recomputes() from any handler ends them.
+    _batch_sketches = set()
+
     def __init__(self, server=None, log_operation: Optional[Callable] = None, capture_state: Optional[Callable] = None):
         """Initialize handler with optional reference to server.
 
@@ -122,6 +138,10 @@ class BaseHandler:
 
         Tries internal name first (fast, exact), then falls back to label
         search so callers can pass user-visible labels like "LeftTab".
+        Both lookups run inside FreeCAD: doc.getObject is a name-map hit
+        and getObjectsByLabel walks the document in C++, so no Python-side
+        name index is kept here (it would need a document observer to stay
+        correct across renames, deletes and undo).
 
         FreeCAD does NOT enforce uniqueness on Label — multiple objects can
         share the same Label, only Name is guaranteed unique.  When a label
@@ -135,6 +155,10 @@ class BaseHandler:
             object_name: Internal name or Label of the object to find
             doc: Document to search in (uses active document if not specified)
 
+        This is a pure lookup: a document with a deferred recompute stays
+        pending.  Operations that read computed geometry call settle()
+        first.
+
         Returns:
             FreeCAD object, or None if not found.
 
@@ -166,7 +190,7 @@ class BaseHandler:
         return results[0]
 
     def resolve_object(self, object_name: str, doc: FreeCAD.Document = None,
-                        attr=None, noun: str = "Object"):
+                        attr=None, noun: str = "Object", settle: bool = False):
         """Resolve doc + object in one call, replacing the ~10-line
         get_document/get_object/None-check/hasattr-check preamble that was
         hand-copied at 200+ call sites across every handler file.
@@ -184,6 +208,8 @@ class BaseHandler:
                 codebase already use different nouns for the same shape
                 of error, and that distinction is preserved rather than
                 flattened to a single generic wording.
+            settle: settle() the document before the lookup. Callers
+                that go on to read the object's Shape pass True.
 
         Returns:
             (doc, obj, error) — error is None on success. On any failure,
@@ -198,6 +224,8 @@ class BaseHandler:
         if not doc:
             return None, None, "No active document"
 
+        if settle:
+            self.settle(doc)
         obj = self.get_object(object_name, doc)
         if not obj:
             return doc, None, f"{noun} not found: {object_name}"
@@ -210,16 +238,75 @@ class BaseHandler:
 
         return doc, obj, None
 
-    def recompute(self, doc: FreeCAD.Document = None):
+    def recompute(self, doc: FreeCAD.Document = None, defer: bool = False):
         """Recompute the document.
 
         Args:
             doc: Document to recompute (uses active document if not specified)
+            defer: Only mark the document as pending instead of recomputing.
+                A caller creating many objects in a row pays for one
+                recompute at the end instead of one per object.
         """
         if doc is None:
             doc = FreeCAD.ActiveDocument
-        if doc:
-            doc.recompute()
+        if not doc:
+            return
+        if defer:
+            # Drop documents closed since their deferral so the shared set
+            # doesn't keep them alive.
+            self._pending_recompute.intersection_update(FreeCAD.listDocuments().values())
+            self._pending_recompute.add(doc)
+            return
+        self._pending_recompute.discard(doc)
+        doc.recompute()
+
+    def settle(self, doc: FreeCAD.Document):
+        """Run doc's deferred recompute (see recompute(defer=True)) now.
+
+        Operations that read computed results (Shapes, cell values) call
+        this first, so a deferred edit is paid for the first time something
+        needs it, not before. A no-op when nothing is pending.
+        """
+        if doc is not None and doc in self._pending_recompute:
+            self.recompute(doc)
+
+    def recompute_or_defer(self, doc: FreeCAD.Document, args: Dict[str, Any]) -> str:
+        """recompute(doc), deferred when args has a truthy 'defer_recompute'.
+
+        Returns the suffix for the success message: DEFERRED_NOTE when
+        deferred, else ''.
+        """
+        defer = bool(args.get('defer_recompute'))
+        self.recompute(doc, defer=defer)
+        return DEFERRED_NOTE if defer else ''
+
+    def flush_recomputes(self) -> int:
+        """Recompute every document with a deferred recompute, once each.
+
+        Also ends any open sketch batches, whose deferrals this settles.
+
+        Documents closed since their deferral are skipped; a recompute
+        that raises is logged and not counted.
+
+        Returns:
+            Number of documents recomputed.
+        """
+        pending = list(self._pending_recompute)
+        self._pending_recompute.clear()
+        self._batch_sketches.clear()
+        open_docs = list(FreeCAD.listDocuments().values())
+        recomputed = 0
+        for doc in pending:
+            if doc not in open_docs:
+                continue
+            try:
+                doc.recompute()
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(
+                    f"[MCP] Deferred recompute of {doc.Name} failed: {e}\n")
+            else:
+                recomputed += 1
+        return recomputed
 
     def find_font(self, font_file: str = '') -> str:
         """Find a usable .ttf font file, trying the given path then common system locations.
@@ -327,6 +414,11 @@ class BaseHandler:
     def find_body_for_object(self, obj, doc: FreeCAD.Document = None):
         """Find the PartDesign Body containing an object.
 
+        A Body is a GeoFeatureGroup, so the object's own
+        getParentGeoFeatureGroup() back-pointer answers this in O(1) —
+        no walk over doc.Objects and each Body's Group.  The scan is kept
+        only for objects that don't expose the back-pointer.
+
         Args:
             obj: Object to find the body for
             doc: Document to search (uses active document if not specified)
@@ -334,6 +426,12 @@ class BaseHandler:
         Returns:
             PartDesign::Body containing the object, or None
         """
+        get_parent = getattr(obj, 'getParentGeoFeatureGroup', None)
+        if get_parent is not None:
+            parent = get_parent()
+            if getattr(parent, 'TypeId', None) == "PartDesign::Body":
+                return parent
+            return None
         if doc is None:
             doc = FreeCAD.ActiveDocument
         if doc is None:
@@ -377,11 +475,14 @@ class BaseHandler:
         """
         best = None
         best_dist = tolerance
+        # sketch.Geometry rebuilds the whole geometry list on every access;
+        # read it once rather than once per index.
+        geometry = sketch.Geometry
         for i in range(sketch.GeometryCount):
             try:
                 if sketch.getConstruction(i):
                     continue
-                geo = sketch.Geometry[i]
+                geo = geometry[i]
                 if not hasattr(geo, 'StartPoint') or not hasattr(geo, 'EndPoint'):
                     continue
                 for pt, pos_id in ((geo.StartPoint, 1), (geo.EndPoint, 2)):
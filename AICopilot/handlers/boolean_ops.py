@@ -20,6 +20,7 @@ class BooleanOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             # Get object references
             objs = []
@@ -67,6 +68,7 @@ class BooleanOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             # Get object references
             _, base_obj, err = self.resolve_object(base, doc, noun='Base object')
@@ -120,6 +122,7 @@ class BooleanOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             # Get object references
             objs = []
@@ -46,6 +46,7 @@ class CAMOpsHandler(BaseHandler):
             if not doc:
                 error = Exception("No active document")
                 return self.log_and_return("create_job", args, error=error, duration=time.time() - start_time)
+            self.settle(doc)
 
             job_name = args.get('name', 'Job')
             base_object = args.get('base_object', '')
@@ -117,6 +118,7 @@ class CAMOpsHandler(BaseHandler):
             if not doc:
                 error = Exception("No active document")
                 return self.log_and_return("setup_stock", args, error=error, duration=time.time() - start_time)
+            self.settle(doc)
 
             job_name = args.get('job_name', '')
             stock_type = args.get('stock_type', 'CreateBox')
@@ -378,6 +380,7 @@ class CAMOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return json.dumps({"error": "No active document"})
+            self.settle(doc)
 
             job_name = args.get("job_name", "")
             job = self.get_object(job_name, doc) if job_name else None
@@ -507,6 +510,7 @@ class CAMOpsHandler(BaseHandler):
             if not doc:
                 error = Exception("No active document")
                 return self.log_and_return("post_process", args, error=error, duration=time.time() - start_time)
+            self.settle(doc)
 
             job_name = args.get('job_name', '')
             output_file = args.get('output_file', '')
@@ -1101,6 +1105,7 @@ class CAMOpsHandler(BaseHandler):
                 return self.log_and_return("simulate_job", args, error=error, duration=time.time() - start_time)
 
             doc = self.get_document()
+            self.settle(doc)
             job = self.get_object(job_name, doc)
             if not job:
                 error = Exception(f"Job '{job_name}' not found")
@@ -1210,6 +1215,7 @@ class CAMOpsHandler(BaseHandler):
         doc = self.get_document()
         if not doc:
             raise RuntimeError("No active document")
+        self.settle(doc)
 
         job_name = args.get('job_name', '')
         job = self.get_object(job_name, doc) if job_name else None
@@ -208,6 +208,7 @@ class DocumentOpsHandler(BaseHandler):
             doc = FreeCAD.ActiveDocument
             if not doc:
                 return json.dumps({"error": "No active document"})
+            self.settle(doc)
             name = args.get("object_name", "")
             obj = self.get_object(name, doc)
             if obj is None:
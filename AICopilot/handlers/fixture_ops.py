@@ -357,7 +357,7 @@ class FixtureOpsHandler(BaseHandler):
                     )
                 })
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return json.dumps({"ok": False, "details": {}, "message": err})
 
@@ -562,7 +562,7 @@ class FixtureOpsHandler(BaseHandler):
                 })
 
             # Resolve object
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return json.dumps({"ok": False, "details": {}, "message": err})
 
@@ -124,6 +124,7 @@ class InspectorOpsHandler(BaseHandler):
             doc = FreeCAD.ActiveDocument
             if not doc:
                 return json.dumps({"error": "No active document"})
+        self.settle(doc)
 
         # Resolve objects. get_object() raises ValueError on an ambiguous
         # Label rather than guessing (see its docstring) — a DRC scan that
@@ -20,7 +20,7 @@ class MeasurementOpsHandler(BaseHandler):
             object1 = args.get('object1', '')
             object2 = args.get('object2', '')
 
-            doc, obj1, err = self.resolve_object(object1)
+            doc, obj1, err = self.resolve_object(object1, settle=True)
             if err:
                 return err
             _, obj2, err = self.resolve_object(object2, doc)
@@ -47,7 +47,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -62,7 +62,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -82,7 +82,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -110,7 +110,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -127,7 +127,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -142,7 +142,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -165,7 +165,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -191,7 +191,7 @@ class MeasurementOpsHandler(BaseHandler):
         try:
             object_name = args.get('object_name', '')
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
@@ -139,7 +139,7 @@ class MeshOpsHandler(BaseHandler):
                     error=Exception(f"Unsupported mesh format '{ext}'. Supported: {', '.join(sorted(self.MESH_FORMATS))}"),
                     duration=time.time() - start_time)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return self.log_and_return("export_mesh", args,
                     error=Exception(err), duration=time.time() - start_time)
@@ -206,7 +206,7 @@ class MeshOpsHandler(BaseHandler):
                     error=Exception("object_name parameter required"),
                     duration=time.time() - start_time)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return self.log_and_return("mesh_to_solid", args,
                     error=Exception(err), duration=time.time() - start_time)
@@ -285,7 +285,7 @@ class MeshOpsHandler(BaseHandler):
                     error=Exception("object_name parameter required"),
                     duration=time.time() - start_time)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return self.log_and_return("get_mesh_info", args,
                     error=Exception(err), duration=time.time() - start_time)
@@ -450,7 +450,7 @@ class MeshOpsHandler(BaseHandler):
             if ext in self.CAD_FORMATS:
                 import Part
 
-                doc, obj, err = self.resolve_object(object_name)
+                doc, obj, err = self.resolve_object(object_name, settle=True)
                 if err:
                     return self.log_and_return("export_file", args,
                         error=Exception(err), duration=time.time() - start_time)
@@ -503,7 +503,7 @@ class MeshOpsHandler(BaseHandler):
                     error=Exception("object_name parameter required"),
                     duration=time.time() - start_time)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return self.log_and_return("validate_mesh", args,
                     error=Exception(err), duration=time.time() - start_time)
@@ -658,7 +658,7 @@ class MeshOpsHandler(BaseHandler):
                     error=Exception("object_name parameter required"),
                     duration=time.time() - start_time)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return self.log_and_return("simplify_mesh", args,
                     error=Exception(err), duration=time.time() - start_time)
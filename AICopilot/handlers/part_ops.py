@@ -1,6 +1,7 @@
 # Part workbench operation handlers for FreeCAD MCP
 
 import FreeCAD
+import Part
 from typing import Dict, Any
 from .base import BaseHandler
 
@@ -17,7 +18,7 @@ class PartOpsHandler(BaseHandler):
             # (revolve already lowercases; extrude didn't).
             direction = str(args.get('direction', 'z')).lower()
 
-            doc, sketch, err = self.resolve_object(profile_sketch, attr='Shape', noun='Sketch')
+            doc, sketch, err = self.resolve_object(profile_sketch, attr='Shape', noun='Sketch', settle=True)
             if err:
                 return err
 
@@ -32,7 +33,6 @@ class PartOpsHandler(BaseHandler):
                 return f"Invalid direction {direction!r}; use 'x', 'y', or 'z'"
 
             shape = sketch.Shape
-            import Part
 
             if shape.Wires:
                 face = Part.Face(shape.Wires[0])
@@ -58,7 +58,7 @@ class PartOpsHandler(BaseHandler):
             angle = args.get('angle', 360)
             axis = args.get('axis', 'z').lower()
 
-            doc, sketch, err = self.resolve_object(profile_sketch, attr='Shape', noun='Sketch')
+            doc, sketch, err = self.resolve_object(profile_sketch, attr='Shape', noun='Sketch', settle=True)
             if err:
                 return err
 
@@ -71,7 +71,6 @@ class PartOpsHandler(BaseHandler):
                 axis_vec = FreeCAD.Vector(0, 0, 1)
 
             shape = sketch.Shape
-            import Part
 
             pos = FreeCAD.Vector(0, 0, 0)
             if hasattr(sketch, 'Placement'):
@@ -101,7 +100,7 @@ class PartOpsHandler(BaseHandler):
             plane = args.get('plane', 'YZ')
             name = args.get('name', '')
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return err
             if not hasattr(obj, 'Shape'):
@@ -120,7 +119,6 @@ class PartOpsHandler(BaseHandler):
             else:
                 return f"Invalid plane '{plane}'. Valid options: XY, XZ, YZ"
 
-            import Part
             mirrored_shape = obj.Shape.mirror(mirror_point, normal)
 
             if name:
@@ -145,7 +143,7 @@ class PartOpsHandler(BaseHandler):
             if scale_factor <= 0:
                 return f"scale_factor must be > 0 (got {scale_factor})"
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return err
 
@@ -181,7 +179,6 @@ class PartOpsHandler(BaseHandler):
             else:
                 # Non-parametric object - create scaled copy
                 if hasattr(obj, 'Shape'):
-                    import Part
                     matrix = FreeCAD.Matrix()
                     matrix.scale(scale_factor, scale_factor, scale_factor)
                     scaled_shape = obj.Shape.transformGeometry(matrix)
@@ -202,14 +199,12 @@ class PartOpsHandler(BaseHandler):
             plane = args.get('plane', 'XY')
             offset = args.get('offset', 0)
 
-            doc, obj, err = self.resolve_object(object_name)
+            doc, obj, err = self.resolve_object(object_name, settle=True)
             if err:
                 return err
             if not hasattr(obj, 'Shape'):
                 return f"Object {object_name} is not a shape object"
 
-            import Part
-
             # Define section plane
             if plane == 'XY':
                 section_plane = Part.makePlane(1000, 1000, FreeCAD.Vector(-500, -500, offset))
@@ -319,11 +314,9 @@ class PartOpsHandler(BaseHandler):
             if not doc:
                 return "No active document"
 
-            import Part
-
             shapes = []
             for obj_name in objects:
-                _, obj, err = self.resolve_object(obj_name, doc, attr='Shape')
+                _, obj, err = self.resolve_object(obj_name, doc, attr='Shape', settle=True)
                 if err:
                     return err
                 shapes.append(obj.Shape)
@@ -370,8 +363,6 @@ class PartOpsHandler(BaseHandler):
                     "/System/Library/Fonts/Supplemental/Arial.ttf"
                 )
 
-            import Part
-
             # makeWireString returns [[Wire, ...], ...] — one list of wires per character
             char_wires = Part.makeWireString(string, font, size, tracking)
             flat = [w for char in char_wires for w in char]
@@ -403,7 +394,7 @@ class PartOpsHandler(BaseHandler):
             object_name = args.get('object_name', '')
             run_bop_check = args.get('run_bop_check', False)
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return err
 
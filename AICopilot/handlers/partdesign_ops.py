@@ -8,6 +8,37 @@ from typing import Dict, Any
 from .base import BaseHandler
 
 
+# Prebuilt "FaceN" sub-element names for the face-selection paths, so
+# turning a selection into a LinkSub tuple is an index, not a format, per
+# face. Indices past the table fall back to formatting.
+_FACE_NAMES = tuple(f"Face{i}" for i in range(1, 1025))
+
+
+def _face_names(indices):
+    """1-based face indices -> tuple of "FaceN" sub-element names."""
+    table = _FACE_NAMES
+    n = len(table)
+    # List comprehension then tuple(): cheaper than feeding tuple() a
+    # generator, which pays the iterator protocol per element.
+    return tuple([table[i - 1] if 0 < i <= n else f"Face{i}" for i in indices])
+
+
+# Unit vector per axis name for the standalone (no-Body) paths.
+_AXIS_UNITS = {'x': (1, 0, 0), 'y': (0, 1, 0), 'z': (0, 0, 1)}
+
+# Part::Extrusion Dir for create_rib; anything else extrudes along the
+# sketch normal.
+_RIB_DIRECTIONS = {'horizontal': (1, 0, 0), 'vertical': (0, 0, 1)}
+_RIB_NORMAL = (0, 1, 0)
+
+# Standalone create_helix path: (rotation axis, degrees) that stands
+# Part.makeLongHelix's Z-axis curve along the requested axis ('z' needs none).
+_HELIX_AXIS_TURNS = {
+    'x': ((0, 1, 0), 90),
+    'y': ((1, 0, 0), 90),
+}
+
+
 class PartDesignOpsHandler(BaseHandler):
     """Handler for PartDesign workbench operations."""
 
@@ -126,6 +157,35 @@ class PartDesignOpsHandler(BaseHandler):
                 pass
             return err
 
+    @staticmethod
+    def _selection_target_context(doc, obj) -> Dict[str, Any]:
+        """Extra request_selection context pinning the resolved target.
+
+        Stored with the pending operation so completion can look the object
+        up by document and internal Name instead of resolving object_name
+        (possibly a Label) again against whatever document is active then.
+        """
+        return {"document": doc.Name, "target": obj.Name}
+
+    def _resolve_selection_target(self, object_name: str, selection_result: Dict[str, Any]):
+        """(doc, obj, error) for a completed interactive selection.
+
+        Uses the document/Name recorded by _selection_target_context when
+        the request stored them and the object still exists; otherwise
+        resolves object_name the usual way. Either way the document is
+        settled, since every completion reads the target's Shape.
+        """
+        context = selection_result.get("context") or {}
+        doc_name = context.get("document")
+        target = context.get("target")
+        if doc_name and target:
+            doc = FreeCAD.listDocuments().get(doc_name)
+            obj = doc.getObject(target) if doc is not None else None
+            if obj is not None:
+                self.settle(doc)
+                return doc, obj, None
+        return self.resolve_object(object_name, settle=True)
+
     def fillet_edges(self, args: Dict[str, Any]) -> str:
         """Add fillets to object edges (Interactive selection workflow)."""
         try:
@@ -151,12 +211,14 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
                 return f"Object not found: {object_name}"
 
-            if not hasattr(obj, 'Shape') or not obj.Shape.Edges:
+            shape = getattr(obj, 'Shape', None)
+            if shape is None or not shape.Edges:
                 return f"Object {object_name} has no edges to fillet"
 
             # Method 1: Use explicit edge list if provided
@@ -175,7 +237,8 @@ class PartDesignOpsHandler(BaseHandler):
                 object_name=object_name,
                 hints="Select edges for filleting. Ctrl+click for multiple edges.",
                 radius=radius,
-                name=name
+                name=name,
+                **self._selection_target_context(doc, obj)
             )
 
             return json.dumps(selection_request)
@@ -190,13 +253,9 @@ class PartDesignOpsHandler(BaseHandler):
             radius = args.get('radius', 1)
             name = args.get('name', 'Fillet')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self._resolve_selection_target(object_name, selection_result)
+            if err:
+                return err
 
             edge_indices = selection_result["selection_data"]["elements"]
             if not edge_indices:
@@ -215,12 +274,11 @@ class PartDesignOpsHandler(BaseHandler):
                 # Fallback to Part::Fillet if not in a Body
                 fillet = doc.addObject("Part::Fillet", name)
                 fillet.Base = obj
-                if hasattr(obj, 'Shape') and obj.Shape.Edges:
-                    edge_list = []
-                    for edge_idx in edge_indices:
-                        if 1 <= edge_idx <= len(obj.Shape.Edges):
-                            edge_list.append((edge_idx, radius, radius))
-                    fillet.Edges = edge_list
+                shape = getattr(obj, 'Shape', None)
+                n_edges = len(shape.Edges) if shape is not None else 0
+                if n_edges:
+                    fillet.Edges = [(idx, radius, radius) for idx in edge_indices
+                                    if 1 <= idx <= n_edges]
 
             self.recompute(doc)
 
@@ -256,7 +314,8 @@ class PartDesignOpsHandler(BaseHandler):
                 fillet.Base = obj
                 # Bounds-check like _create_fillet_with_selection — an out-of-range
                 # index otherwise produces a cryptic OCCT recompute error.
-                n_edges = len(obj.Shape.Edges) if hasattr(obj, 'Shape') else 0
+                shape = getattr(obj, 'Shape', None)
+                n_edges = len(shape.Edges) if shape is not None else 0
                 edge_list = [(idx, radius, radius) for idx in edges if 1 <= idx <= n_edges]
                 fillet.Edges = edge_list
 
@@ -281,6 +340,7 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
@@ -288,9 +348,10 @@ class PartDesignOpsHandler(BaseHandler):
 
             # Guard before touching obj.Shape.Edges so a shapeless object gets a
             # clear message, not an AttributeError from the success-line below.
-            if not hasattr(obj, 'Shape') or not obj.Shape.Edges:
+            shape = getattr(obj, 'Shape', None)
+            n_edges = len(shape.Edges) if shape is not None else 0
+            if not n_edges:
                 return f"Object {object_name} has no edges to fillet"
-            n_edges = len(obj.Shape.Edges)
 
             fillet = doc.addObject("Part::Fillet", name)
             fillet.Base = obj
@@ -331,6 +392,19 @@ class PartDesignOpsHandler(BaseHandler):
             if auto_select_all:
                 return self._create_chamfer_auto(args)
 
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+            self.settle(doc)
+
+            obj = self.get_object(object_name, doc)
+            if not obj:
+                return f"Object not found: {object_name}"
+
+            shape = getattr(obj, 'Shape', None)
+            if shape is None or not shape.Edges:
+                return f"Object {object_name} has no edges to chamfer"
+
             selection_request = self.selector.request_selection(
                 tool_name="chamfer_edges",
                 selection_type="edges",
@@ -338,7 +412,8 @@ class PartDesignOpsHandler(BaseHandler):
                 object_name=object_name,
                 hints="Select sharp edges for chamfering. Ctrl+click for multiple edges.",
                 distance=distance,
-                name=name
+                name=name,
+                **self._selection_target_context(doc, obj)
             )
 
             return json.dumps(selection_request)
@@ -353,13 +428,9 @@ class PartDesignOpsHandler(BaseHandler):
             distance = args.get('distance', 1)
             name = args.get('name', 'Chamfer')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self._resolve_selection_target(object_name, selection_result)
+            if err:
+                return err
 
             edge_indices = selection_result["selection_data"]["elements"]
             if not edge_indices:
@@ -375,12 +446,11 @@ class PartDesignOpsHandler(BaseHandler):
             else:
                 chamfer = doc.addObject("Part::Chamfer", name)
                 chamfer.Base = obj
-                if hasattr(obj, 'Shape') and obj.Shape.Edges:
-                    edge_list = []
-                    for edge_idx in edge_indices:
-                        if 1 <= edge_idx <= len(obj.Shape.Edges):
-                            edge_list.append((edge_idx, distance))
-                    chamfer.Edges = edge_list
+                shape = getattr(obj, 'Shape', None)
+                n_edges = len(shape.Edges) if shape is not None else 0
+                if n_edges:
+                    chamfer.Edges = [(idx, distance) for idx in edge_indices
+                                     if 1 <= idx <= n_edges]
 
             self.recompute(doc)
 
@@ -403,6 +473,7 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
@@ -412,9 +483,10 @@ class PartDesignOpsHandler(BaseHandler):
             # clear message, not an AttributeError from the success line below —
             # mirrors _create_fillet_auto. (Without this, zero-edge objects also
             # report a false "all 0 edges" success.)
-            if not hasattr(obj, 'Shape') or not obj.Shape.Edges:
+            shape = getattr(obj, 'Shape', None)
+            n_edges = len(shape.Edges) if shape is not None else 0
+            if not n_edges:
                 return f"Object {object_name} has no edges to chamfer"
-            n_edges = len(obj.Shape.Edges)
 
             chamfer = doc.addObject("Part::Chamfer", name)
             chamfer.Base = obj
@@ -467,6 +539,7 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             base_obj = self.get_object(object_name, doc)
             if not base_obj:
@@ -680,18 +753,14 @@ class PartDesignOpsHandler(BaseHandler):
                 )
 
             # No Body — standalone doc.copyObject approach (unchanged).
-            if direction.lower() == 'x':
-                direction_vector = FreeCAD.Vector(spacing, 0, 0)
-            elif direction.lower() == 'y':
-                direction_vector = FreeCAD.Vector(0, spacing, 0)
-            elif direction.lower() == 'z':
-                direction_vector = FreeCAD.Vector(0, 0, spacing)
-            else:
+            unit = _AXIS_UNITS.get(direction.lower())
+            if unit is None:
                 # No fallback vector — an unrecognized direction used to
                 # silently stay at (0,0,0), stacking every copy exactly on
                 # top of the original (the coincident-geometry OCCT crash
                 # pathology) while still reporting success.
                 return f"Invalid direction '{direction}': must be 'x', 'y', or 'z'"
+            direction_vector = FreeCAD.Vector(*(c * spacing for c in unit))
 
             copies = []
             for i in range(1, count):
@@ -787,23 +856,22 @@ class PartDesignOpsHandler(BaseHandler):
             # No Body — standalone doc.copyObject approach (unchanged).
             angle_step = angle / count
 
-            axis_vector = FreeCAD.Vector(0, 0, 1)
-            if axis.lower() == 'x':
-                axis_vector = FreeCAD.Vector(1, 0, 0)
-            elif axis.lower() == 'y':
-                axis_vector = FreeCAD.Vector(0, 1, 0)
+            axis_vector = FreeCAD.Vector(*_AXIS_UNITS.get(axis.lower(), (0, 0, 1)))
+
+            # Base placement and the per-step rotation are loop-invariant;
+            # accumulate the step instead of building Rotation(axis, step*i)
+            # from scratch for every copy.
+            base_pos = feature.Placement.Base
+            base_rot = feature.Placement.Rotation
+            delta = FreeCAD.Rotation(axis_vector, angle_step)
+            accum = FreeCAD.Rotation()
 
             copies = []
             for i in range(1, count):
                 copy = doc.copyObject(feature)
                 copy.Label = f"{feature.Label}_Polar{i}"
-                rotation_angle = angle_step * i
-                rotation = FreeCAD.Rotation(axis_vector, rotation_angle)
-                new_placement = FreeCAD.Placement(
-                    feature.Placement.Base,
-                    feature.Placement.Rotation.multiply(rotation)
-                )
-                copy.Placement = new_placement
+                accum = accum.multiply(delta)
+                copy.Placement = FreeCAD.Placement(base_pos, base_rot.multiply(accum))
                 copies.append(copy)
 
             self.recompute(doc)
@@ -968,9 +1036,10 @@ class PartDesignOpsHandler(BaseHandler):
                 # always degenerate here too, for the identical reason
                 # groove() rejects it — no per-sketch computation needed.
                 axis_refs = {'x': 'H_Axis', 'y': 'V_Axis'}
-                ref_axis = axis_refs.get(axis.lower())
+                axis_key = axis.lower()
+                ref_axis = axis_refs.get(axis_key)
                 if ref_axis is None:
-                    if axis.lower() == 'z':
+                    if axis_key == 'z':
                         return (
                             "Invalid axis 'z': the sketch's own normal "
                             "(N_Axis) cannot be used as a revolution axis — "
@@ -999,8 +1068,7 @@ class PartDesignOpsHandler(BaseHandler):
                 )
 
             # No Body — standalone Part::Revolution, axis is a global vector.
-            axis_vectors = {'x': (1, 0, 0), 'y': (0, 1, 0), 'z': (0, 0, 1)}
-            axis_vector = axis_vectors.get(axis.lower())
+            axis_vector = _AXIS_UNITS.get(axis.lower())
             if axis_vector is None:
                 # Validated before creating the object — an unrecognized
                 # axis used to silently fall through to Z while the success
@@ -1062,9 +1130,10 @@ class PartDesignOpsHandler(BaseHandler):
             # normal for every sketch, by construction, so it can never sweep
             # volume; there's no sketch placement that makes it valid.
             axis_refs = {'x': 'H_Axis', 'y': 'V_Axis'}
-            ref_axis = axis_refs.get(axis.lower())
+            axis_key = axis.lower()
+            ref_axis = axis_refs.get(axis_key)
             if ref_axis is None:
-                if axis.lower() == 'z':
+                if axis_key == 'z':
                     return (
                         "Invalid axis 'z': the sketch's own normal (N_Axis) "
                         "cannot be used as a groove axis — revolving a planar "
@@ -1312,12 +1381,14 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
                 return f"Object not found: {object_name}"
 
-            if not hasattr(obj, 'Shape') or not obj.Shape.Faces:
+            shape = getattr(obj, 'Shape', None)
+            if shape is None or not shape.Faces:
                 return f"Object {object_name} has no faces for draft"
 
             selection_request = self.selector.request_selection(
@@ -1328,7 +1399,8 @@ class PartDesignOpsHandler(BaseHandler):
                 hints="Select faces to apply draft angle. Ctrl+click for multiple faces.",
                 angle=angle,
                 neutral_plane=neutral_plane,
-                name=name
+                name=name,
+                **self._selection_target_context(doc, obj)
             )
 
             return json.dumps(selection_request)
@@ -1343,13 +1415,9 @@ class PartDesignOpsHandler(BaseHandler):
             angle = args.get('angle', 5)
             name = args.get('name', 'Draft')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self._resolve_selection_target(object_name, selection_result)
+            if err:
+                return err
 
             face_indices = selection_result["selection_data"]["elements"]
             if not face_indices:
@@ -1361,8 +1429,7 @@ class PartDesignOpsHandler(BaseHandler):
                 draft = body.newObject("PartDesign::Draft", name)
                 draft.Angle = angle
                 draft.Reversed = False
-                face_names = [f"Face{idx}" for idx in face_indices]
-                draft.Base = (obj, face_names)
+                draft.Base = (obj, _face_names(face_indices))
 
                 self.recompute(doc)
 
@@ -1400,12 +1467,26 @@ class PartDesignOpsHandler(BaseHandler):
             if auto_shell_closed:
                 return self._create_shell_closed(args)
 
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+            self.settle(doc)
+
+            obj = self.get_object(object_name, doc)
+            if not obj:
+                return f"Object not found: {object_name}"
+
+            shape = getattr(obj, 'Shape', None)
+            if shape is None or not shape.Faces:
+                return f"Object {object_name} has no faces to shell"
+
             selection_request = self.selector.request_selection(
                 tool_name="shell_solid",
                 selection_type="faces",
                 message=f"Please select face(s) to remove for opening the {object_name} object in FreeCAD.\nTell me when you have finished selecting faces...",
                 object_name=object_name,
-                hints="Usually select the top face or access faces for openings. Ctrl+click for multiple faces."
+                hints="Usually select the top face or access faces for openings. Ctrl+click for multiple faces.",
+                **self._selection_target_context(doc, obj)
             )
 
             return json.dumps(selection_request)
@@ -1420,13 +1501,9 @@ class PartDesignOpsHandler(BaseHandler):
             thickness = args.get('thickness', 2)
             name = args.get('name', 'Shell')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self._resolve_selection_target(object_name, selection_result)
+            if err:
+                return err
 
             face_indices = selection_result["selection_data"]["elements"]
             if not face_indices:
@@ -1442,14 +1519,18 @@ class PartDesignOpsHandler(BaseHandler):
             shell.Value = thickness
             shell.Join = 2
 
-            if hasattr(obj, 'Shape') and obj.Shape.Faces:
+            # Shape.Faces builds a fresh list of wrapped faces on every
+            # access — fetch its length once, not once per selected index.
+            shape = getattr(obj, 'Shape', None)
+            n_faces = len(shape.Faces) if shape is not None else 0
+            if n_faces:
                 # Part::Thickness.Faces is an App::PropertyLinkSubList — it takes
                 # (object, ("Face1", ...)) with 1-based FaceN sub-names, NOT raw
                 # integer indices (the sibling _create_thickness_with_selection
                 # does it this way). Passing ints silently produces a wrong/closed
                 # shell.
-                valid = [fi for fi in face_indices if 1 <= fi <= len(obj.Shape.Faces)]
-                shell.Faces = (obj, tuple(f"Face{fi}" for fi in valid))
+                shell.Faces = (obj, _face_names([fi for fi in face_indices
+                                                 if 1 <= fi <= n_faces]))
 
             self.recompute(doc)
 
@@ -1469,13 +1550,9 @@ class PartDesignOpsHandler(BaseHandler):
             thickness = args.get('thickness', 2)
             name = args.get('name', 'Shell')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self.resolve_object(object_name, settle=True)
+            if err:
+                return err
 
             # Part::Thickness (BRepOffsetAPI_MakeThickSolid) genuinely
             # requires at least one face to remove - confirmed live that
@@ -1528,12 +1605,14 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
                 return f"Object not found: {object_name}"
 
-            if not hasattr(obj, 'Shape') or not obj.Shape.Faces:
+            shape = getattr(obj, 'Shape', None)
+            if shape is None or not shape.Faces:
                 return f"Object {object_name} has no faces for thickness"
 
             selection_request = self.selector.request_selection(
@@ -1543,7 +1622,8 @@ class PartDesignOpsHandler(BaseHandler):
                 object_name=object_name,
                 hints="Select faces to remove (hollow out). Ctrl+click for multiple faces.",
                 thickness=thickness_val,
-                name=name
+                name=name,
+                **self._selection_target_context(doc, obj)
             )
 
             return json.dumps(selection_request)
@@ -1558,13 +1638,9 @@ class PartDesignOpsHandler(BaseHandler):
             thickness_val = args.get('thickness', 2)
             name = args.get('name', 'Thickness')
 
-            doc = self.get_document()
-            if not doc:
-                return "No active document"
-
-            obj = self.get_object(object_name, doc)
-            if not obj:
-                return f"Object not found: {object_name}"
+            doc, obj, err = self._resolve_selection_target(object_name, selection_result)
+            if err:
+                return err
 
             body = self.find_body_for_object(obj, doc)
             if not body:
@@ -1575,7 +1651,7 @@ class PartDesignOpsHandler(BaseHandler):
                 return "No faces were selected for thickness opening"
 
             thickness = body.newObject("PartDesign::Thickness", name)
-            thickness.Base = (obj, tuple(f"Face{face_idx}" for face_idx in face_indices))
+            thickness.Base = (obj, _face_names(face_indices))
             thickness.Value = thickness_val
 
             self.recompute(doc)
@@ -1646,9 +1722,10 @@ class PartDesignOpsHandler(BaseHandler):
                 # planar profile around its own plane's normal sweeps zero
                 # volume, for any sketch.
                 axis_refs = {'x': 'H_Axis', 'y': 'V_Axis'}
-                ref_axis = axis_refs.get(axis.lower())
+                axis_key = axis.lower()
+                ref_axis = axis_refs.get(axis_key)
                 if ref_axis is None:
-                    if axis.lower() == 'z':
+                    if axis_key == 'z':
                         return (
                             "Invalid axis 'z': the sketch's own normal "
                             "(N_Axis) cannot be used as a helix axis — "
@@ -1705,10 +1782,10 @@ class PartDesignOpsHandler(BaseHandler):
             helix_curve = doc.addObject("Part::Feature", f"{name}_Path")
             helix_curve.Shape = helix_shape
 
-            if axis.lower() == 'x':
-                helix_curve.Placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(0, 1, 0), 90)
-            elif axis.lower() == 'y':
-                helix_curve.Placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(1, 0, 0), 90)
+            turn = _HELIX_AXIS_TURNS.get(axis.lower())
+            if turn is not None:
+                direction, degrees = turn
+                helix_curve.Placement.Rotation = FreeCAD.Rotation(FreeCAD.Vector(*direction), degrees)
 
             self.recompute(doc)
 
@@ -1752,15 +1829,8 @@ class PartDesignOpsHandler(BaseHandler):
             rib = doc.addObject("Part::Extrusion", name)
             rib.Base = sketch
 
-            if direction.lower() == 'horizontal':
-                rib.Dir = (1, 0, 0)
-                rib.LengthFwd = thickness
-            elif direction.lower() == 'vertical':
-                rib.Dir = (0, 0, 1)
-                rib.LengthFwd = thickness
-            else:
-                rib.Dir = (0, 1, 0)
-                rib.LengthFwd = thickness
+            rib.Dir = _RIB_DIRECTIONS.get(direction.lower(), _RIB_NORMAL)
+            rib.LengthFwd = thickness
 
             rib.Solid = True
 
@@ -1978,6 +2048,7 @@ class PartDesignOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             obj = self.get_object(object_name, doc)
             if not obj:
@@ -23,9 +23,27 @@ from .base import BaseHandler
 
 _INJECTED_KEYS = frozenset({"operation", "_continue_selection", "_operation_id"})
 
-
-def _check_unknown_keys(primitive: str, args: dict, allowed: frozenset) -> Optional[str]:
-    unknown = set(args) - allowed - _INJECTED_KEYS
+# Per-primitive argument defaults. The keys double as the allowlist for
+# _check_unknown_keys, and each handler reads its arguments from one
+# {**defaults, **args} merge instead of a chain of args.get() calls.
+_BOX_DEFAULTS = {'length': 10, 'width': 10, 'height': 10,
+                 'x': 0, 'y': 0, 'z': 0, 'name': 'Box', 'defer_recompute': False}
+_CYLINDER_DEFAULTS = {'radius': 5, 'height': 10,
+                      'x': 0, 'y': 0, 'z': 0, 'name': 'Cylinder', 'defer_recompute': False}
+_SPHERE_DEFAULTS = {'radius': 5,
+                    'x': 0, 'y': 0, 'z': 0, 'name': 'Sphere', 'defer_recompute': False}
+# radius1 = bottom radius, radius2 = top radius
+_CONE_DEFAULTS = {'radius1': 5, 'radius2': 0, 'height': 10,
+                  'x': 0, 'y': 0, 'z': 0, 'name': 'Cone', 'defer_recompute': False}
+# radius1 = major radius, radius2 = minor radius
+_TORUS_DEFAULTS = {'radius1': 10, 'radius2': 3,
+                   'x': 0, 'y': 0, 'z': 0, 'name': 'Torus', 'defer_recompute': False}
+_WEDGE_DEFAULTS = {'xmin': 0, 'ymin': 0, 'zmin': 0, 'x2min': 2, 'x2max': 8,
+                   'xmax': 10, 'ymax': 10, 'zmax': 10, 'name': 'Wedge', 'defer_recompute': False}
+
+
+def _check_unknown_keys(primitive: str, args: dict, allowed) -> Optional[str]:
+    unknown = args.keys() - allowed - _INJECTED_KEYS
     if unknown:
         return f"Error creating {primitive}: unknown argument(s) {sorted(unknown)} — check for typos"
     return None
@@ -73,19 +91,31 @@ def _validate_wedge_bounds(xmin, xmax, ymin, ymax, zmin, zmax, x2min, x2max) ->
 class PrimitivesHandler(BaseHandler):
     """Handler for creating primitive shapes (Part workbench)."""
 
+    @staticmethod
+    def _add_primitive(doc, type_id: str, name: str, props: Dict[str, Any], base=None):
+        """addObject + Label + property writes shared by every create_*.
+
+        props maps FreeCAD property names to values; base, when given, is
+        the (x, y, z) placement origin.
+        """
+        obj = doc.addObject(type_id, name)
+        obj.Label = name
+        for prop, value in props.items():
+            setattr(obj, prop, value)
+        if base is not None:
+            obj.Placement.Base = FreeCAD.Vector(*base)
+        return obj
+
     def create_box(self, args: Dict[str, Any]) -> str:
         """Create a box with specified dimensions."""
         try:
-            err = _check_unknown_keys('box', args, frozenset({'length', 'width', 'height', 'x', 'y', 'z', 'name'}))
+            err = _check_unknown_keys('box', args, _BOX_DEFAULTS.keys())
             if err:
                 return err
-            length = args.get('length', 10)
-            width = args.get('width', 10)
-            height = args.get('height', 10)
-            x = args.get('x', 0)
-            y = args.get('y', 0)
-            z = args.get('z', 0)
-            name = args.get('name', 'Box')
+            p = {**_BOX_DEFAULTS, **args}
+            length, width, height = p['length'], p['width'], p['height']
+            x, y, z = p['x'], p['y'], p['z']
+            name = p['name']
 
             err = _validate_positive('box', length=length, width=width, height=height)
             if err:
@@ -95,16 +125,12 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating box: No active document. Call view_control(operation='create_document') first."
 
-            box = doc.addObject("Part::Box", name)
-            box.Label = name
-            box.Length = length
-            box.Width = width
-            box.Height = height
-            box.Placement.Base = FreeCAD.Vector(x, y, z)
+            box = self._add_primitive(
+                doc, "Part::Box", name,
+                {'Length': length, 'Width': width, 'Height': height}, (x, y, z))
+            note = self.recompute_or_defer(doc, p)
 
-            self.recompute(doc)
-
-            return f"Created box: {box.Name} ({length}x{width}x{height}mm) at ({x},{y},{z})"
+            return f"Created box: {box.Name} ({length}x{width}x{height}mm) at ({x},{y},{z}){note}"
 
         except Exception as e:
             return f"Error creating box: {e}"
@@ -112,15 +138,13 @@ class PrimitivesHandler(BaseHandler):
     def create_cylinder(self, args: Dict[str, Any]) -> str:
         """Create a cylinder with specified dimensions."""
         try:
-            err = _check_unknown_keys('cylinder', args, frozenset({'radius', 'height', 'x', 'y', 'z', 'name'}))
+            err = _check_unknown_keys('cylinder', args, _CYLINDER_DEFAULTS.keys())
             if err:
                 return err
-            radius = args.get('radius', 5)
-            height = args.get('height', 10)
-            x = args.get('x', 0)
-            y = args.get('y', 0)
-            z = args.get('z', 0)
-            name = args.get('name', 'Cylinder')
+            p = {**_CYLINDER_DEFAULTS, **args}
+            radius, height = p['radius'], p['height']
+            x, y, z = p['x'], p['y'], p['z']
+            name = p['name']
 
             err = _validate_positive('cylinder', radius=radius, height=height)
             if err:
@@ -130,15 +154,12 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating cylinder: No active document. Call view_control(operation='create_document') first."
 
-            cylinder = doc.addObject("Part::Cylinder", name)
-            cylinder.Label = name
-            cylinder.Radius = radius
-            cylinder.Height = height
-            cylinder.Placement.Base = FreeCAD.Vector(x, y, z)
-
-            self.recompute(doc)
+            cylinder = self._add_primitive(
+                doc, "Part::Cylinder", name,
+                {'Radius': radius, 'Height': height}, (x, y, z))
+            note = self.recompute_or_defer(doc, p)
 
-            return f"Created cylinder: {cylinder.Name} (R{radius}, H{height}) at ({x},{y},{z})"
+            return f"Created cylinder: {cylinder.Name} (R{radius}, H{height}) at ({x},{y},{z}){note}"
 
         except Exception as e:
             return f"Error creating cylinder: {e}"
@@ -146,14 +167,13 @@ class PrimitivesHandler(BaseHandler):
     def create_sphere(self, args: Dict[str, Any]) -> str:
         """Create a sphere with specified radius."""
         try:
-            err = _check_unknown_keys('sphere', args, frozenset({'radius', 'x', 'y', 'z', 'name'}))
+            err = _check_unknown_keys('sphere', args, _SPHERE_DEFAULTS.keys())
             if err:
                 return err
-            radius = args.get('radius', 5)
-            x = args.get('x', 0)
-            y = args.get('y', 0)
-            z = args.get('z', 0)
-            name = args.get('name', 'Sphere')
+            p = {**_SPHERE_DEFAULTS, **args}
+            radius = p['radius']
+            x, y, z = p['x'], p['y'], p['z']
+            name = p['name']
 
             err = _validate_positive('sphere', radius=radius)
             if err:
@@ -163,14 +183,11 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating sphere: No active document. Call view_control(operation='create_document') first."
 
-            sphere = doc.addObject("Part::Sphere", name)
-            sphere.Label = name
-            sphere.Radius = radius
-            sphere.Placement.Base = FreeCAD.Vector(x, y, z)
+            sphere = self._add_primitive(
+                doc, "Part::Sphere", name, {'Radius': radius}, (x, y, z))
+            note = self.recompute_or_defer(doc, p)
 
-            self.recompute(doc)
-
-            return f"Created sphere: {sphere.Name} (R{radius}) at ({x},{y},{z})"
+            return f"Created sphere: {sphere.Name} (R{radius}) at ({x},{y},{z}){note}"
 
         except Exception as e:
             return f"Error creating sphere: {e}"
@@ -178,16 +195,13 @@ class PrimitivesHandler(BaseHandler):
     def create_cone(self, args: Dict[str, Any]) -> str:
         """Create a cone with specified radii and height."""
         try:
-            err = _check_unknown_keys('cone', args, frozenset({'radius1', 'radius2', 'height', 'x', 'y', 'z', 'name'}))
+            err = _check_unknown_keys('cone', args, _CONE_DEFAULTS.keys())
             if err:
                 return err
-            radius1 = args.get('radius1', 5)  # Bottom radius
-            radius2 = args.get('radius2', 0)  # Top radius
-            height = args.get('height', 10)
-            x = args.get('x', 0)
-            y = args.get('y', 0)
-            z = args.get('z', 0)
-            name = args.get('name', 'Cone')
+            p = {**_CONE_DEFAULTS, **args}
+            radius1, radius2, height = p['radius1'], p['radius2'], p['height']
+            x, y, z = p['x'], p['y'], p['z']
+            name = p['name']
 
             # height must be positive; radii non-negative and not both zero —
             # radius2=0 is a valid pointed cone, radius1==radius2 a valid cylinder.
@@ -206,16 +220,12 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating cone: No active document. Call view_control(operation='create_document') first."
 
-            cone = doc.addObject("Part::Cone", name)
-            cone.Label = name
-            cone.Radius1 = radius1
-            cone.Radius2 = radius2
-            cone.Height = height
-            cone.Placement.Base = FreeCAD.Vector(x, y, z)
-
-            self.recompute(doc)
+            cone = self._add_primitive(
+                doc, "Part::Cone", name,
+                {'Radius1': radius1, 'Radius2': radius2, 'Height': height}, (x, y, z))
+            note = self.recompute_or_defer(doc, p)
 
-            return f"Created cone: {cone.Name} (R1{radius1}, R2{radius2}, H{height}) at ({x},{y},{z})"
+            return f"Created cone: {cone.Name} (R1{radius1}, R2{radius2}, H{height}) at ({x},{y},{z}){note}"
 
         except Exception as e:
             return f"Error creating cone: {e}"
@@ -223,15 +233,13 @@ class PrimitivesHandler(BaseHandler):
     def create_torus(self, args: Dict[str, Any]) -> str:
         """Create a torus (donut shape) with specified radii."""
         try:
-            err = _check_unknown_keys('torus', args, frozenset({'radius1', 'radius2', 'x', 'y', 'z', 'name'}))
+            err = _check_unknown_keys('torus', args, _TORUS_DEFAULTS.keys())
             if err:
                 return err
-            radius1 = args.get('radius1', 10)  # Major radius
-            radius2 = args.get('radius2', 3)   # Minor radius
-            x = args.get('x', 0)
-            y = args.get('y', 0)
-            z = args.get('z', 0)
-            name = args.get('name', 'Torus')
+            p = {**_TORUS_DEFAULTS, **args}
+            radius1, radius2 = p['radius1'], p['radius2']
+            x, y, z = p['x'], p['y'], p['z']
+            name = p['name']
 
             err = _validate_positive('torus', radius1=radius1, radius2=radius2)
             if err:
@@ -241,15 +249,12 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating torus: No active document. Call view_control(operation='create_document') first."
 
-            torus = doc.addObject("Part::Torus", name)
-            torus.Label = name
-            torus.Radius1 = radius1
-            torus.Radius2 = radius2
-            torus.Placement.Base = FreeCAD.Vector(x, y, z)
+            torus = self._add_primitive(
+                doc, "Part::Torus", name,
+                {'Radius1': radius1, 'Radius2': radius2}, (x, y, z))
+            note = self.recompute_or_defer(doc, p)
 
-            self.recompute(doc)
-
-            return f"Created torus: {torus.Name} (R1{radius1}, R2{radius2}) at ({x},{y},{z})"
+            return f"Created torus: {torus.Name} (R1{radius1}, R2{radius2}) at ({x},{y},{z}){note}"
 
         except Exception as e:
             return f"Error creating torus: {e}"
@@ -257,18 +262,14 @@ class PrimitivesHandler(BaseHandler):
     def create_wedge(self, args: Dict[str, Any]) -> str:
         """Create a wedge (triangular prism) with specified dimensions."""
         try:
-            err = _check_unknown_keys('wedge', args, frozenset({'xmin', 'ymin', 'zmin', 'x2min', 'x2max', 'xmax', 'ymax', 'zmax', 'name'}))
+            err = _check_unknown_keys('wedge', args, _WEDGE_DEFAULTS.keys())
             if err:
                 return err
-            xmin = args.get('xmin', 0)
-            ymin = args.get('ymin', 0)
-            zmin = args.get('zmin', 0)
-            x2min = args.get('x2min', 2)
-            x2max = args.get('x2max', 8)
-            xmax = args.get('xmax', 10)
-            ymax = args.get('ymax', 10)
-            zmax = args.get('zmax', 10)
-            name = args.get('name', 'Wedge')
+            p = {**_WEDGE_DEFAULTS, **args}
+            xmin, ymin, zmin = p['xmin'], p['ymin'], p['zmin']
+            x2min, x2max = p['x2min'], p['x2max']
+            xmax, ymax, zmax = p['xmax'], p['ymax'], p['zmax']
+            name = p['name']
 
             err = _validate_wedge_bounds(xmin, xmax, ymin, ymax, zmin, zmax, x2min, x2max)
             if err:
@@ -278,20 +279,14 @@ class PrimitivesHandler(BaseHandler):
             if not doc:
                 return "Error creating wedge: No active document. Call view_control(operation='create_document') first."
 
-            wedge = doc.addObject("Part::Wedge", name)
-            wedge.Label = name
-            wedge.Xmin = xmin
-            wedge.Ymin = ymin
-            wedge.Zmin = zmin
-            wedge.X2min = x2min
-            wedge.X2max = x2max
-            wedge.Xmax = xmax
-            wedge.Ymax = ymax
-            wedge.Zmax = zmax
-
-            self.recompute(doc)
+            wedge = self._add_primitive(doc, "Part::Wedge", name, {
+                'Xmin': xmin, 'Ymin': ymin, 'Zmin': zmin,
+                'X2min': x2min, 'X2max': x2max,
+                'Xmax': xmax, 'Ymax': ymax, 'Zmax': zmax,
+            })
+            note = self.recompute_or_defer(doc, p)
 
-            return f"Created wedge: {wedge.Name} ({xmax}x{ymax}x{zmax}) at origin"
+            return f"Created wedge: {wedge.Name} ({xmax}x{ymax}x{zmax}) at origin{note}"
 
         except Exception as e:
             return f"Error creating wedge: {e}"
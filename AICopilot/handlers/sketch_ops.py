@@ -1,15 +1,202 @@
 # Sketch operation handlers for FreeCAD MCP
 
 import FreeCAD
+import Part
+import Sketcher
 import json
 import math
 from typing import Dict, Any
 from .base import BaseHandler
 
 
+# (x,y,z,w) quaternion args to FreeCAD.Rotation for each supported plane.
+_PLANE_ROTATIONS = {
+    'XY': (0, 0, 0, 1),
+    'XZ': (1, 0, 0, 1),
+    'YZ': (0, 1, 0, 1),
+}
+
+
+# Unit-circle vertices per polygon side count, filled by _polygon_unit_vertices.
+# Only common side counts are kept so an odd one-off can't grow it unbounded.
+_POLYGON_TEMPLATE_MAX_SIDES = 64
+_polygon_templates = {}
+
+
+def _polygon_unit_vertices(sides):
+    """Return ((cos, sin), ...) for a regular polygon starting at -90°.
+
+    A new side count starts straight below the center (-90°) and rotates
+    the unit vector by the fixed step, so it costs one cos/sin pair rather
+    than one per vertex. Repeated add_polygon calls with the same side count
+    (a row of hex nuts, bolt circles) reuse the cached tuple; only the
+    center offset and radius scaling remain per call.
+    """
+    template = _polygon_templates.get(sides)
+    if template is None:
+        step = 2 * math.pi / sides
+        cos_s, sin_s = math.cos(step), math.sin(step)
+        dx, dy = 0.0, -1.0
+        vertices = []
+        for _ in range(sides):
+            vertices.append((dx, dy))
+            dx, dy = dx * cos_s - dy * sin_s, dx * sin_s + dy * cos_s
+        template = tuple(vertices)
+        if sides <= _POLYGON_TEMPLATE_MAX_SIDES:
+            _polygon_templates[sides] = template
+    return template
+
+
+# add_constraint builders, keyed by the canonical constraint_type. Each takes
+# (g1, p1, g2, p2, seed, args) -- seed is the dimensional value (0.0 when only
+# an expression is given) -- and returns the Sketcher.Constraint.
+_CONSTRAINT_BUILDERS = {
+    # Single-geometry, no value
+    'Horizontal': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Horizontal', g1),
+    'Vertical': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Vertical', g1),
+    'Block': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Block', g1),
+    # Two-geometry, no value
+    'Perpendicular': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Perpendicular', g1, g2),
+    'Parallel': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Parallel', g1, g2),
+    'Tangent': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Tangent', g1, g2),
+    'Equal': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Equal', g1, g2),
+    # Point-to-point / point-on-object / fixed point, no value
+    'Coincident': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Coincident', g1, p1, g2, p2),
+    'PointOnObject': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('PointOnObject', g1, p1, g2),
+    'Fix': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Lock', g1, p1),
+    'Symmetric': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint(
+        'Symmetric', g1, p1, g2, p2, a.get('sym_geo', -2), a.get('sym_pos', 0)),
+    # Dimensional: single geometry + value
+    'Radius': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Radius', g1, seed),
+    'Diameter': lambda g1, p1, g2, p2, seed, a: Sketcher.Constraint('Diameter', g1, seed),
+    # Dimensional: between two points, or the length of line geo_id1
+    'Distance': lambda g1, p1, g2, p2, seed, a: (
+        Sketcher.Constraint('Distance', g1, p1, g2, p2, seed)
+        if a.get('geo_id2') is not None else
+        Sketcher.Constraint('Distance', g1, seed)),
+    'DistanceX': lambda g1, p1, g2, p2, seed, a: (
+        Sketcher.Constraint('DistanceX', g1, p1, g2, p2, seed)
+        if a.get('geo_id2') is not None else
+        Sketcher.Constraint('DistanceX', g1, p1, seed)),
+    'DistanceY': lambda g1, p1, g2, p2, seed, a: (
+        Sketcher.Constraint('DistanceY', g1, p1, g2, p2, seed)
+        if a.get('geo_id2') is not None else
+        Sketcher.Constraint('DistanceY', g1, p1, seed)),
+    # Angle between two lines, or of one line from horizontal (seed in radians)
+    'Angle': lambda g1, p1, g2, p2, seed, a: (
+        Sketcher.Constraint('Angle', g1, g2, seed)
+        if a.get('geo_id2') is not None else
+        Sketcher.Constraint('Angle', g1, seed)),
+}
+
+# Case-insensitive constraint_type -> canonical name, so 'horizontal' /
+# 'DISTANCEX' resolve instead of falling through to "Unknown".
+_CONSTRAINT_CANON = {n.lower(): n for n in _CONSTRAINT_BUILDERS}
+
+_DIMENSIONAL = frozenset({'Radius', 'Diameter', 'Distance', 'DistanceX', 'DistanceY', 'Angle'})
+
+
+def _build_constraint(ct, args):
+    """Build the Sketcher.Constraint for canonical type *ct* from add_constraint
+    style args. Returns (constraint, None) or (None, error message)."""
+    builder = _CONSTRAINT_BUILDERS.get(ct)
+    if builder is None:
+        return None, f"Unknown constraint type: {ct}"
+
+    value = args.get('value', None)
+    if ct in _DIMENSIONAL:
+        if value is None and args.get('expression') is None:
+            if ct == 'Angle':
+                return None, "Angle constraint requires a value (degrees) or expression"
+            return None, f"{ct} constraint requires a value or expression"
+        if value is None:
+            seed = 0.0
+        else:
+            seed = math.radians(value) if ct == 'Angle' else value
+    else:
+        seed = None
+
+    return builder(args.get('geo_id1', 0), args.get('pos_id1', 0),
+                   args.get('geo_id2', 0), args.get('pos_id2', 0),
+                   seed, args), None
+
+
+def _rectangle_segments(x, y, width, height):
+    """Bottom, right, top, left LineSegments of an axis-aligned rectangle."""
+    p1 = FreeCAD.Vector(x, y, 0)
+    p2 = FreeCAD.Vector(x + width, y, 0)
+    p3 = FreeCAD.Vector(x + width, y + height, 0)
+    p4 = FreeCAD.Vector(x, y + height, 0)
+    return [
+        Part.LineSegment(p1, p2),  # bottom
+        Part.LineSegment(p2, p3),  # right
+        Part.LineSegment(p3, p4),  # top
+        Part.LineSegment(p4, p1),  # left
+    ]
+
+
+def _rectangle_constraints(g0, g1, g2, g3, x, y, width, height):
+    """Constraints that fully pin a rectangle built by _rectangle_segments."""
+    return [
+        # Coincident corners
+        Sketcher.Constraint('Coincident', g0, 2, g1, 1),
+        Sketcher.Constraint('Coincident', g1, 2, g2, 1),
+        Sketcher.Constraint('Coincident', g2, 2, g3, 1),
+        Sketcher.Constraint('Coincident', g3, 2, g0, 1),
+        # Horizontal/vertical
+        Sketcher.Constraint('Horizontal', g0),
+        Sketcher.Constraint('Horizontal', g2),
+        Sketcher.Constraint('Vertical', g1),
+        Sketcher.Constraint('Vertical', g3),
+        # Position: fix bottom-left corner relative to origin
+        Sketcher.Constraint('DistanceX', -1, 1, g0, 1, x),
+        Sketcher.Constraint('DistanceY', -1, 1, g0, 1, y),
+        # Size: width and height
+        Sketcher.Constraint('DistanceX', g0, 1, g0, 2, width),
+        Sketcher.Constraint('DistanceY', g1, 1, g1, 2, height),
+    ]
+
+
+def _circle_constraints(geo_id, x, y, radius):
+    """Center position (point 3) relative to origin, plus radius."""
+    return [
+        Sketcher.Constraint('DistanceX', -1, 1, geo_id, 3, x),
+        Sketcher.Constraint('DistanceY', -1, 1, geo_id, 3, y),
+        Sketcher.Constraint('Radius', geo_id, radius),
+    ]
+
+
+_DEG2RAD = math.pi / 180.0
+_HALF_PI = math.pi / 2
+
+
+def _arc(center_x, center_y, radius, start_angle, end_angle):
+    """ArcOfCircle in the sketch plane; angles in degrees."""
+    return Part.ArcOfCircle(
+        Part.Circle(
+            FreeCAD.Vector(center_x, center_y, 0),
+            FreeCAD.Vector(0, 0, 1),
+            radius
+        ),
+        start_angle * _DEG2RAD,
+        end_angle * _DEG2RAD
+    )
+
+
 class SketchOpsHandler(BaseHandler):
     """Handler for sketch operations (Sketcher workbench)."""
 
+    def _recompute_sketch(self, doc, sketch):
+        """Recompute after a geometry add; inside a batch, defer it instead.
+
+        Looking the sketch up doesn't settle the document, so a batched run
+        of adds leaves the deferral alone. end_batch, any other operation
+        that recomputes or settles the document, or flush_recomputes() pays
+        for it once.
+        """
+        batched = (doc.Name, sketch.Name) in self._batch_sketches
+        self.recompute(doc, defer=batched)
+
     # -----------------------------------------------------------------
     # Sketch lifecycle
     # -----------------------------------------------------------------
@@ -24,13 +211,7 @@ class SketchOpsHandler(BaseHandler):
             if not doc:
                 return "Error creating sketch: No active document. Call view_control(operation='create_document') first."
 
-            # (x,y,z,w) quaternion args to FreeCAD.Rotation for each plane.
-            plane_rotations = {
-                'XY': (0, 0, 0, 1),
-                'XZ': (1, 0, 0, 1),
-                'YZ': (0, 1, 0, 1),
-            }
-            rotation_args = plane_rotations.get(plane.upper())
+            rotation_args = _PLANE_ROTATIONS.get(plane.upper())
             if rotation_args is None:
                 # Validated before creating the object — an unrecognized
                 # plane used to leave sketch.Placement at doc.addObject's
@@ -103,6 +284,7 @@ class SketchOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             sketch = self.get_object(sketch_name, doc)
             if not sketch:
@@ -119,8 +301,16 @@ class SketchOpsHandler(BaseHandler):
             results.append(f"Geometry elements: {geo_count}")
             results.append(f"Constraints: {constraint_count}")
 
-            # Check if fully constrained
-            dof = sketch.solve()
+            # Check if fully constrained. An untouched sketch was already
+            # solved by its last recompute (see list_constraints), so DoF is
+            # current; only re-solve pending edits. solve()'s return code is
+            # a solver-success code, not a DoF count, and a recompute whose
+            # solve failed leaves the sketch marked Invalid.
+            if sketch.isTouched():
+                solved = sketch.solve() == 0
+            else:
+                solved = 'Invalid' not in sketch.State
+            dof = sketch.DoF if solved else -1
             if dof == 0:
                 results.append("Fully constrained: Yes")
             elif dof > 0:
@@ -133,17 +323,17 @@ class SketchOpsHandler(BaseHandler):
             # which references them even when the sketch produced no Shape.
             closed_wires = 0
             open_wires = 0
-            if hasattr(sketch, 'Shape') and sketch.Shape:
-                shape = sketch.Shape
-                wire_count = len(shape.Wires)
+            # One read of sketch.Shape (a fresh copy per access) instead of
+            # hasattr + truth test + assignment.
+            shape = getattr(sketch, 'Shape', None)
+            if shape:
+                wires = shape.Wires  # rebuilt on every property access
+                wire_count = len(wires)
                 results.append(f"Wires: {wire_count}")
 
                 # Check if wires are closed
-                for wire in shape.Wires:
-                    if wire.isClosed():
-                        closed_wires += 1
-                    else:
-                        open_wires += 1
+                closed_wires = sum(1 for wire in wires if wire.isClosed())
+                open_wires = wire_count - closed_wires
 
                 if closed_wires > 0:
                     results.append(f"Closed wires (valid for extrusion): {closed_wires}")
@@ -157,8 +347,7 @@ class SketchOpsHandler(BaseHandler):
                 # Check if can make face
                 if wire_count > 0 and closed_wires > 0:
                     try:
-                        import Part
-                        face = Part.Face(shape.Wires[0])
+                        face = Part.Face(wires[0])
                         results.append("Can create face: Yes")
                         results.append(f"Face area: {face.Area:.2f} mm²")
                     except Exception as e:
@@ -171,10 +360,8 @@ class SketchOpsHandler(BaseHandler):
                     results.append(f"\nOpen wire diagnosis:\n{diagnosis}")
 
             # Check for construction geometry
-            construction_count = 0
-            for i in range(geo_count):
-                if sketch.getConstruction(i):
-                    construction_count += 1
+            construction_count = sum(1 for i in range(geo_count)
+                                     if sketch.getConstruction(i))
             if construction_count > 0:
                 results.append(f"Construction geometry: {construction_count} (not used in extrusion)")
 
@@ -192,6 +379,60 @@ class SketchOpsHandler(BaseHandler):
         except Exception as e:
             return f"Error verifying sketch: {e}"
 
+    def begin_batch(self, args: Dict[str, Any]) -> str:
+        """Suspend per-call recomputes for geometry added to a sketch.
+
+        Until end_batch, add_line/add_circle/add_rectangle/add_rectangles/
+        add_arc/add_polygon/add_slot/add_geometry_batch/add_external_geometry on
+        this sketch defer their recompute, so N adds cost one recompute
+        instead of N.
+        Constraint operations still recompute, since they report DoF, and
+        settle the deferral with it; so does flush_recomputes().
+        """
+        try:
+            sketch_name = args.get('sketch_name', '')
+
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+
+            sketch = self.get_object(sketch_name, doc)
+            if not sketch:
+                return f"Sketch not found: {sketch_name}"
+
+            self._batch_sketches.add((doc.Name, sketch.Name))
+            return (f"Batch started on {sketch_name}: geometry adds skip "
+                    f"recompute until end_batch")
+
+        except Exception as e:
+            return f"Error starting batch: {e}"
+
+    def end_batch(self, args: Dict[str, Any]) -> str:
+        """End a begin_batch on a sketch and recompute once."""
+        try:
+            sketch_name = args.get('sketch_name', '')
+
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+
+            sketch = self.get_object(sketch_name, doc)
+            if not sketch:
+                return f"Sketch not found: {sketch_name}"
+
+            key = (doc.Name, sketch.Name)
+            was_batched = key in self._batch_sketches
+            self._batch_sketches.discard(key)
+            self.recompute(doc)
+
+            note = "" if was_batched else " (no batch was active)"
+            return (f"Ended batch on {sketch_name}{note}: "
+                    f"{sketch.GeometryCount} geometries, "
+                    f"{sketch.ConstraintCount} constraints")
+
+        except Exception as e:
+            return f"Error ending batch: {e}"
+
     # -----------------------------------------------------------------
     # Geometry: lines, circles, rectangles, arcs, polygons, slots
     # -----------------------------------------------------------------
@@ -213,13 +454,12 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
             line = Part.LineSegment(
                 FreeCAD.Vector(x1, y1, 0),
                 FreeCAD.Vector(x2, y2, 0)
             )
             geo_id = sketch.addGeometry(line)
-            self.recompute(doc)
+            self._recompute_sketch(doc, sketch)
 
             return f"Added line to {sketch_name}: ({x1},{y1}) to ({x2},{y2}), geo_id={geo_id}"
 
@@ -242,8 +482,6 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
-            import Sketcher
             circle = Part.Circle(
                 FreeCAD.Vector(x, y, 0),
                 FreeCAD.Vector(0, 0, 1),
@@ -252,13 +490,9 @@ class SketchOpsHandler(BaseHandler):
             geo_id = sketch.addGeometry(circle)
 
             # Add dimensional constraints to fully constrain the circle
-            # Position: fix center relative to origin (point 3 = center)
-            sketch.addConstraint(Sketcher.Constraint('DistanceX', -1, 1, geo_id, 3, x))
-            sketch.addConstraint(Sketcher.Constraint('DistanceY', -1, 1, geo_id, 3, y))
-            # Size: fix radius
-            sketch.addConstraint(Sketcher.Constraint('Radius', geo_id, radius))
+            sketch.addConstraint(_circle_constraints(geo_id, x, y, radius))
 
-            self.recompute(doc)
+            self._recompute_sketch(doc, sketch)
 
             return f"Added circle to {sketch_name}: center ({x},{y}), radius {radius}, geo_id={geo_id}"
 
@@ -273,7 +507,6 @@ class SketchOpsHandler(BaseHandler):
         constrained with coincident corners, horizontal/vertical edges.
         """
         try:
-            import Sketcher
             sketch_name = args.get('sketch_name', '')
             x = args.get('x', 0)
             y = args.get('y', 0)
@@ -289,37 +522,17 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
-            # Create rectangle as 4 lines
-            p1 = FreeCAD.Vector(x, y, 0)
-            p2 = FreeCAD.Vector(x + width, y, 0)
-            p3 = FreeCAD.Vector(x + width, y + height, 0)
-            p4 = FreeCAD.Vector(x, y + height, 0)
-
-            g0 = sketch.addGeometry(Part.LineSegment(p1, p2))  # bottom
-            g1 = sketch.addGeometry(Part.LineSegment(p2, p3))  # right
-            g2 = sketch.addGeometry(Part.LineSegment(p3, p4))  # top
-            g3 = sketch.addGeometry(Part.LineSegment(p4, p1))  # left
+            # addGeometry/addConstraint accept a list and return a tuple of
+            # indices -- one call (and one solver pass) per batch instead of
+            # one per line/constraint.
+            g0, g1, g2, g3 = sketch.addGeometry(
+                _rectangle_segments(x, y, width, height))
 
             if constrain:
-                # Coincident corners
-                sketch.addConstraint(Sketcher.Constraint('Coincident', g0, 2, g1, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', g1, 2, g2, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', g2, 2, g3, 1))
-                sketch.addConstraint(Sketcher.Constraint('Coincident', g3, 2, g0, 1))
-                # Horizontal/vertical
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', g0))
-                sketch.addConstraint(Sketcher.Constraint('Horizontal', g2))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', g1))
-                sketch.addConstraint(Sketcher.Constraint('Vertical', g3))
-                # Position: fix bottom-left corner relative to origin
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', -1, 1, g0, 1, x))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', -1, 1, g0, 1, y))
-                # Size: width and height
-                sketch.addConstraint(Sketcher.Constraint('DistanceX', g0, 1, g0, 2, width))
-                sketch.addConstraint(Sketcher.Constraint('DistanceY', g1, 1, g1, 2, height))
+                sketch.addConstraint(
+                    _rectangle_constraints(g0, g1, g2, g3, x, y, width, height))
 
-            self.recompute(doc)
+            self._recompute_sketch(doc, sketch)
 
             return (f"Added rectangle to {sketch_name}: origin ({x},{y}), "
                     f"size {width}x{height}, geo_ids=[{g0},{g1},{g2},{g3}]")
@@ -327,6 +540,55 @@ class SketchOpsHandler(BaseHandler):
         except Exception as e:
             return f"Error adding rectangle: {e}"
 
+    def add_rectangles(self, args: Dict[str, Any]) -> str:
+        """Add many rectangles to a sketch in one call.
+
+        ``rectangles`` is a list of [x, y, width, height] rows. All edges go
+        in with one addGeometry call and (with ``constrain``, default True)
+        all constraints with one addConstraint call, so bulk parametric
+        layouts pay for one solve and one recompute instead of one per
+        rectangle. geo_ids come back four per rectangle, in add_rectangle's
+        bottom/right/top/left order.
+        """
+        try:
+            sketch_name = args.get('sketch_name', '')
+            rectangles = args.get('rectangles') or []
+            constrain = args.get('constrain', True)
+
+            if not isinstance(rectangles, list) or not rectangles:
+                return "rectangles must be a non-empty list"
+            for i, row in enumerate(rectangles):
+                if not isinstance(row, (list, tuple)) or len(row) != 4:
+                    return f"rectangles[{i}] must be [x, y, width, height], got {row!r}"
+
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+
+            sketch = self.get_object(sketch_name, doc)
+            if not sketch:
+                return f"Sketch not found: {sketch_name}"
+
+            geoms = []
+            for x, y, width, height in rectangles:
+                geoms.extend(_rectangle_segments(x, y, width, height))
+            geo_ids = list(sketch.addGeometry(geoms))
+
+            constraints = []
+            if constrain:
+                for i, (x, y, width, height) in enumerate(rectangles):
+                    constraints += _rectangle_constraints(
+                        *geo_ids[4 * i:4 * i + 4], x, y, width, height)
+                sketch.addConstraint(constraints)
+
+            self._recompute_sketch(doc, sketch)
+
+            return (f"Added {len(rectangles)} rectangle(s) to {sketch_name}: "
+                    f"{len(constraints)} constraints, geo_ids={geo_ids}")
+
+        except Exception as e:
+            return f"Error adding rectangles: {e}"
+
     def add_arc(self, args: Dict[str, Any]) -> str:
         """Add an arc to a sketch."""
         try:
@@ -345,18 +607,9 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
-            arc = Part.ArcOfCircle(
-                Part.Circle(
-                    FreeCAD.Vector(center_x, center_y, 0),
-                    FreeCAD.Vector(0, 0, 1),
-                    radius
-                ),
-                math.radians(start_angle),
-                math.radians(end_angle)
-            )
+            arc = _arc(center_x, center_y, radius, start_angle, end_angle)
             geo_id = sketch.addGeometry(arc)
-            self.recompute(doc)
+            self._recompute_sketch(doc, sketch)
 
             return (f"Added arc to {sketch_name}: center ({center_x},{center_y}), "
                     f"R{radius}, {start_angle}° to {end_angle}°, geo_id={geo_id}")
@@ -364,6 +617,104 @@ class SketchOpsHandler(BaseHandler):
         except Exception as e:
             return f"Error adding arc: {e}"
 
+    def add_geometry_batch(self, args: Dict[str, Any]) -> str:
+        """Add several lines, circles, arcs and rectangles in one call.
+
+        ``primitives`` is a list of dicts, each with a ``type`` ('line',
+        'circle', 'arc' or 'rectangle') plus the parameters the matching
+        add_* operation takes, with the same defaults. Circles and
+        rectangles get the same constraints add_circle/add_rectangle add.
+        All geometry goes in with one addGeometry call, all constraints
+        with one addConstraint call, and the document recomputes once.
+        geo_ids are returned flat, in the order the geometry was added
+        (a rectangle contributes four: bottom, right, top, left).
+
+        ``lines`` is a compact alternative for bulk line work (DXF-style
+        outlines, hatching): a list of [x1, y1, x2, y2] rows, added after
+        any ``primitives`` in the same addGeometry call.
+        """
+        try:
+            sketch_name = args.get('sketch_name', '')
+            primitives = args.get('primitives') or []
+            lines = args.get('lines') or []
+
+            if (not isinstance(primitives, list) or not isinstance(lines, list)
+                    or not (primitives or lines)):
+                return "primitives or lines must be a non-empty list"
+
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+
+            sketch = self.get_object(sketch_name, doc)
+            if not sketch:
+                return f"Sketch not found: {sketch_name}"
+
+            # Build everything before touching the sketch so a bad entry
+            # leaves it unchanged.
+            geoms = []
+            spans = []  # (primitive, index of its first geometry in geoms)
+            for i, prim in enumerate(primitives):
+                kind = prim.get('type') if isinstance(prim, dict) else None
+                spans.append((prim, len(geoms)))
+                if kind == 'line':
+                    geoms.append(Part.LineSegment(
+                        FreeCAD.Vector(prim.get('x1', 0), prim.get('y1', 0), 0),
+                        FreeCAD.Vector(prim.get('x2', 10), prim.get('y2', 10), 0)
+                    ))
+                elif kind == 'circle':
+                    geoms.append(Part.Circle(
+                        FreeCAD.Vector(prim.get('x', 0), prim.get('y', 0), 0),
+                        FreeCAD.Vector(0, 0, 1),
+                        prim.get('radius', 5)
+                    ))
+                elif kind == 'arc':
+                    geoms.append(_arc(
+                        prim.get('center_x', 0), prim.get('center_y', 0),
+                        prim.get('radius', 5),
+                        prim.get('start_angle', 0), prim.get('end_angle', 90)
+                    ))
+                elif kind == 'rectangle':
+                    geoms.extend(_rectangle_segments(
+                        prim.get('x', 0), prim.get('y', 0),
+                        prim.get('width', 10), prim.get('height', 10)
+                    ))
+                else:
+                    return (f"Unknown primitive type at index {i}: {kind!r} "
+                            f"(expected line, circle, arc or rectangle)")
+            for i, row in enumerate(lines):
+                if not isinstance(row, (list, tuple)) or len(row) != 4:
+                    return f"lines[{i}] must be [x1, y1, x2, y2], got {row!r}"
+                x1, y1, x2, y2 = row
+                geoms.append(Part.LineSegment(FreeCAD.Vector(x1, y1, 0),
+                                              FreeCAD.Vector(x2, y2, 0)))
+
+            geo_ids = list(sketch.addGeometry(geoms))
+
+            constraints = []
+            for prim, first in spans:
+                kind = prim['type']
+                if kind == 'circle':
+                    constraints += _circle_constraints(
+                        geo_ids[first], prim.get('x', 0), prim.get('y', 0),
+                        prim.get('radius', 5))
+                elif kind == 'rectangle' and prim.get('constrain', True):
+                    constraints += _rectangle_constraints(
+                        *geo_ids[first:first + 4],
+                        prim.get('x', 0), prim.get('y', 0),
+                        prim.get('width', 10), prim.get('height', 10))
+            if constraints:
+                sketch.addConstraint(constraints)
+
+            self._recompute_sketch(doc, sketch)
+
+            return (f"Added {len(primitives) + len(lines)} primitive(s) to {sketch_name}: "
+                    f"{len(geo_ids)} geometries, {len(constraints)} constraints, "
+                    f"geo_ids={geo_ids}")
+
+        except Exception as e:
+            return f"Error adding geometry batch: {e}"
+
     def add_polygon(self, args: Dict[str, Any]) -> str:
         """Add a regular polygon to a sketch.
 
@@ -371,7 +722,6 @@ class SketchOpsHandler(BaseHandler):
         constraints at corners and equal-length constraints on all edges.
         """
         try:
-            import Sketcher
             sketch_name = args.get('sketch_name', '')
             x = args.get('x', 0)
             y = args.get('y', 0)
@@ -390,38 +740,35 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
+            # Vertices start straight below the center (-90°); the unit-circle
+            # template is cached per side count, so only scaling is per call.
+            points = [
+                FreeCAD.Vector(x + radius * c, y + radius * s, 0)
+                for c, s in _polygon_unit_vertices(sides)
+            ]
 
-            # Calculate vertices
-            points = []
-            for i in range(sides):
-                angle = 2 * math.pi * i / sides - math.pi / 2  # start at top
-                px = x + radius * math.cos(angle)
-                py = y + radius * math.sin(angle)
-                points.append(FreeCAD.Vector(px, py, 0))
-
-            # Add line segments
-            geo_ids = []
-            for i in range(sides):
-                p_start = points[i]
-                p_end = points[(i + 1) % sides]
-                gid = sketch.addGeometry(Part.LineSegment(p_start, p_end))
-                geo_ids.append(gid)
+            # One addGeometry/addConstraint call for the whole outline, as in
+            # add_rectangle, rather than one solver pass per edge.
+            geo_ids = list(sketch.addGeometry([
+                Part.LineSegment(points[i], points[(i + 1) % sides])
+                for i in range(sides)
+            ]))
 
             if constrain:
-                # Coincident corners
-                for i in range(sides):
-                    next_i = (i + 1) % sides
-                    sketch.addConstraint(
-                        Sketcher.Constraint('Coincident', geo_ids[i], 2, geo_ids[next_i], 1)
-                    )
-                # Equal length on all edges (constrain each to the first)
-                for i in range(1, sides):
-                    sketch.addConstraint(
-                        Sketcher.Constraint('Equal', geo_ids[0], geo_ids[i])
-                    )
-
-            self.recompute(doc)
+                # Coincident corners, then equal length on all edges
+                # (constrain each to the first)
+                constraints = [
+                    Sketcher.Constraint('Coincident', geo_ids[i], 2,
+                                        geo_ids[(i + 1) % sides], 1)
+                    for i in range(sides)
+                ]
+                constraints += [
+                    Sketcher.Constraint('Equal', geo_ids[0], geo_ids[i])
+                    for i in range(1, sides)
+                ]
+                sketch.addConstraint(constraints)
+
+            self._recompute_sketch(doc, sketch)
 
             return (f"Added {sides}-sided polygon to {sketch_name}: "
                     f"center ({x},{y}), radius {radius}, geo_ids={geo_ids}")
@@ -437,7 +784,6 @@ class SketchOpsHandler(BaseHandler):
         rotate or position it.
         """
         try:
-            import Sketcher
             sketch_name = args.get('sketch_name', '')
             x = args.get('x', 0)
             y = args.get('y', 0)
@@ -452,8 +798,6 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
-            import Part
-
             r = width / 2.0
             half_len = length / 2.0 - r  # half distance between arc centers
 
@@ -469,39 +813,37 @@ class SketchOpsHandler(BaseHandler):
             # first parameter to the second, so the start/end angles below keep each
             # arc on the outer side; endpoints chain via the Coincident(gA,2,gB,1)
             # constraints added afterwards.
-            # Bottom line: left to right
-            g0 = sketch.addGeometry(Part.LineSegment(
-                FreeCAD.Vector(cx1, y - r, 0),
-                FreeCAD.Vector(cx2, y - r, 0)
-            ))
-            # Right arc: -90° to 90° (bottom to top, bulging right/outward)
-            g1 = sketch.addGeometry(Part.ArcOfCircle(
-                Part.Circle(FreeCAD.Vector(cx2, y, 0), FreeCAD.Vector(0, 0, 1), r),
-                math.radians(-90), math.radians(90)
-            ))
-            # Top line: right to left
-            g2 = sketch.addGeometry(Part.LineSegment(
-                FreeCAD.Vector(cx2, y + r, 0),
-                FreeCAD.Vector(cx1, y + r, 0)
-            ))
-            # Left arc: 90° to 270° (top to bottom, bulging left/outward)
-            g3 = sketch.addGeometry(Part.ArcOfCircle(
-                Part.Circle(FreeCAD.Vector(cx1, y, 0), FreeCAD.Vector(0, 0, 1), r),
-                math.radians(90), math.radians(270)
-            ))
-
-            # Coincident constraints to close the shape
-            sketch.addConstraint(Sketcher.Constraint('Coincident', g0, 2, g1, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', g1, 2, g2, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', g2, 2, g3, 1))
-            sketch.addConstraint(Sketcher.Constraint('Coincident', g3, 2, g0, 1))
-            # Tangent between lines and arcs
-            sketch.addConstraint(Sketcher.Constraint('Tangent', g0, g1))
-            sketch.addConstraint(Sketcher.Constraint('Tangent', g1, g2))
-            sketch.addConstraint(Sketcher.Constraint('Tangent', g2, g3))
-            sketch.addConstraint(Sketcher.Constraint('Tangent', g3, g0))
-
-            self.recompute(doc)
+            g0, g1, g2, g3 = sketch.addGeometry([
+                # Bottom line: left to right
+                Part.LineSegment(FreeCAD.Vector(cx1, y - r, 0),
+                                 FreeCAD.Vector(cx2, y - r, 0)),
+                # Right arc: -90° to 90° (bottom to top, bulging right/outward)
+                Part.ArcOfCircle(
+                    Part.Circle(FreeCAD.Vector(cx2, y, 0), FreeCAD.Vector(0, 0, 1), r),
+                    -_HALF_PI, _HALF_PI),
+                # Top line: right to left
+                Part.LineSegment(FreeCAD.Vector(cx2, y + r, 0),
+                                 FreeCAD.Vector(cx1, y + r, 0)),
+                # Left arc: 90° to 270° (top to bottom, bulging left/outward)
+                Part.ArcOfCircle(
+                    Part.Circle(FreeCAD.Vector(cx1, y, 0), FreeCAD.Vector(0, 0, 1), r),
+                    _HALF_PI, 3 * _HALF_PI),
+            ])
+
+            sketch.addConstraint([
+                # Coincident constraints to close the shape
+                Sketcher.Constraint('Coincident', g0, 2, g1, 1),
+                Sketcher.Constraint('Coincident', g1, 2, g2, 1),
+                Sketcher.Constraint('Coincident', g2, 2, g3, 1),
+                Sketcher.Constraint('Coincident', g3, 2, g0, 1),
+                # Tangent between lines and arcs
+                Sketcher.Constraint('Tangent', g0, g1),
+                Sketcher.Constraint('Tangent', g1, g2),
+                Sketcher.Constraint('Tangent', g2, g3),
+                Sketcher.Constraint('Tangent', g3, g0),
+            ])
+
+            self._recompute_sketch(doc, sketch)
 
             return (f"Added slot to {sketch_name}: center ({x},{y}), "
                     f"length {length}, width {width}, geo_ids=[{g0},{g1},{g2},{g3}]")
@@ -580,7 +922,6 @@ class SketchOpsHandler(BaseHandler):
         GeoId: 0+ = user geometry (in add order), -1 = X axis, -2 = Y axis
         """
         try:
-            import Sketcher
             sketch_name = args.get('sketch_name', '')
             constraint_type = args.get('constraint_type', '')
 
@@ -595,94 +936,14 @@ class SketchOpsHandler(BaseHandler):
             if not constraint_type:
                 return "constraint_type is required"
 
-            g1 = args.get('geo_id1', 0)
-            p1 = args.get('pos_id1', 0)
-            g2 = args.get('geo_id2', 0)
-            p2 = args.get('pos_id2', 0)
-            value = args.get('value', None)
+            ct = _CONSTRAINT_CANON.get(str(constraint_type).lower(), constraint_type)
             expression = args.get('expression', None)
-
-            # Build constraint based on type. Normalize case against the canonical
-            # vocabulary (single source of truth) so 'horizontal' / 'DISTANCEX'
-            # resolve instead of silently falling through to "Unknown" — the
-            # case-sensitive compares below are otherwise a syntactic seam.
-            _CANON = {n.lower(): n for n in (
-                'Horizontal', 'Vertical', 'Block', 'Perpendicular', 'Parallel',
-                'Tangent', 'Equal', 'Coincident', 'PointOnObject', 'Fix',
-                'Symmetric', 'Radius', 'Diameter', 'Distance', 'DistanceX',
-                'DistanceY', 'Angle')}
-            ct = _CANON.get(str(constraint_type).lower(), constraint_type)
-
-            _DIMENSIONAL = ('Radius', 'Diameter', 'Distance', 'DistanceX', 'DistanceY', 'Angle')
             if expression is not None and ct not in _DIMENSIONAL:
                 return f"expression is only supported for dimensional constraint types, got {ct}"
 
-            # --- Single-geometry, no value ---
-            if ct in ('Horizontal', 'Vertical', 'Block'):
-                c = Sketcher.Constraint(ct, g1)
-
-            # --- Two-geometry, no value ---
-            elif ct in ('Perpendicular', 'Parallel', 'Tangent', 'Equal'):
-                c = Sketcher.Constraint(ct, g1, g2)
-
-            # --- Point-to-point, no value ---
-            elif ct == 'Coincident':
-                c = Sketcher.Constraint('Coincident', g1, p1, g2, p2)
-
-            # --- Point on object ---
-            elif ct == 'PointOnObject':
-                c = Sketcher.Constraint('PointOnObject', g1, p1, g2)
-
-            # --- Fix a point ---
-            elif ct == 'Fix':
-                c = Sketcher.Constraint('Lock', g1, p1)
-
-            # --- Symmetric ---
-            elif ct == 'Symmetric':
-                sym_geo = args.get('sym_geo', -2)
-                sym_pos = args.get('sym_pos', 0)
-                c = Sketcher.Constraint('Symmetric', g1, p1, g2, p2, sym_geo, sym_pos)
-
-            # --- Dimensional: single geometry + value ---
-            elif ct in ('Radius', 'Diameter'):
-                if value is None and expression is None:
-                    return f"{ct} constraint requires a value or expression"
-                c = Sketcher.Constraint(ct, g1, value if value is not None else 0.0)
-
-            # --- Dimensional: distance between two points ---
-            elif ct == 'Distance':
-                if value is None and expression is None:
-                    return "Distance constraint requires a value or expression"
-                seed = value if value is not None else 0.0
-                if args.get('geo_id2') is not None:
-                    c = Sketcher.Constraint('Distance', g1, p1, g2, p2, seed)
-                else:
-                    # Distance of a line segment (geo_id1 = line)
-                    c = Sketcher.Constraint('Distance', g1, seed)
-
-            # --- Dimensional: horizontal/vertical distance ---
-            elif ct in ('DistanceX', 'DistanceY'):
-                if value is None and expression is None:
-                    return f"{ct} constraint requires a value or expression"
-                seed = value if value is not None else 0.0
-                if args.get('geo_id2') is not None:
-                    c = Sketcher.Constraint(ct, g1, p1, g2, p2, seed)
-                else:
-                    c = Sketcher.Constraint(ct, g1, p1, seed)
-
-            # --- Angle ---
-            elif ct == 'Angle':
-                if value is None and expression is None:
-                    return "Angle constraint requires a value (degrees) or expression"
-                angle_rad = math.radians(value) if value is not None else 0.0
-                if args.get('geo_id2') is not None:
-                    c = Sketcher.Constraint('Angle', g1, g2, angle_rad)
-                else:
-                    # Angle of a single line from horizontal
-                    c = Sketcher.Constraint('Angle', g1, angle_rad)
-
-            else:
-                return f"Unknown constraint type: {constraint_type}"
+            c, err = _build_constraint(ct, args)
+            if err:
+                return err
 
             idx = sketch.addConstraint(c)
 
@@ -709,6 +970,62 @@ class SketchOpsHandler(BaseHandler):
         except Exception as e:
             return f"Error adding constraint: {e}"
 
+    def add_constraints(self, args: Dict[str, Any]) -> str:
+        """Add several constraints to a sketch in one call.
+
+        ``constraints`` is a list of dicts taking the same keys as
+        add_constraint (constraint_type, geo_id1, pos_id1, geo_id2, pos_id2,
+        value, expression, sym_geo, sym_pos). Every entry is validated
+        before any is added; then all go in with one addConstraint call,
+        followed by one recompute and one solve.
+        """
+        try:
+            sketch_name = args.get('sketch_name', '')
+            specs = args.get('constraints') or []
+
+            if not isinstance(specs, list) or not specs:
+                return "constraints must be a non-empty list"
+
+            doc = self.get_document()
+            if not doc:
+                return "No active document"
+
+            sketch = self.get_object(sketch_name, doc)
+            if not sketch:
+                return f"Sketch not found: {sketch_name}"
+
+            built = []
+            for i, spec in enumerate(specs):
+                if not isinstance(spec, dict) or not spec.get('constraint_type'):
+                    return f"constraints[{i}]: constraint_type is required"
+                ct = _CONSTRAINT_CANON.get(str(spec['constraint_type']).lower(),
+                                           spec['constraint_type'])
+                if spec.get('expression') is not None and ct not in _DIMENSIONAL:
+                    return (f"constraints[{i}]: expression is only supported for "
+                            f"dimensional constraint types, got {ct}")
+                c, err = _build_constraint(ct, spec)
+                if err:
+                    return f"constraints[{i}]: {err}"
+                built.append(c)
+
+            indices = list(sketch.addConstraint(built))
+
+            for idx, spec in zip(indices, specs):
+                if spec.get('expression') is not None:
+                    sketch.setExpression(f'Constraints[{idx}]', spec['expression'])
+
+            self.recompute(doc)
+            # See add_constraint: solve() only forces the state; DoF and
+            # FullyConstrained are the reported numbers.
+            sketch.solve()
+
+            return (f"Added {len(indices)} constraints to {sketch_name}, "
+                    f"indices={indices}, DoF={sketch.DoF}, "
+                    f"FullyConstrained={sketch.FullyConstrained}")
+
+        except Exception as e:
+            return f"Error adding constraints: {e}"
+
     def delete_constraint(self, args: Dict[str, Any]) -> str:
         """Delete a constraint by its index."""
         try:
@@ -747,9 +1064,10 @@ class SketchOpsHandler(BaseHandler):
             if not sketch:
                 return f"Sketch not found: {sketch_name}"
 
+            # sketch.Constraints builds a fresh list of every constraint on
+            # each access -- read it once, not once per index.
             constraints = []
-            for i in range(sketch.ConstraintCount):
-                c = sketch.Constraints[i]
+            for i, c in enumerate(sketch.Constraints):
                 info = {
                     "index": i,
                     "type": c.Type,
@@ -772,7 +1090,11 @@ class SketchOpsHandler(BaseHandler):
                     info["name"] = c.Name
                 constraints.append(info)
 
-            sketch.solve()
+            # An untouched sketch was already solved by its last recompute
+            # (SketchObject's execute runs the solver), so DoF and
+            # FullyConstrained are current; only re-solve pending edits.
+            if sketch.isTouched():
+                sketch.solve()
             result = {
                 "sketch": sketch_name,
                 "constraint_count": sketch.ConstraintCount,
@@ -819,7 +1141,9 @@ class SketchOpsHandler(BaseHandler):
                 return "object_name and edge_name are required"
 
             sketch.addExternal(object_name, edge_name)
-            self.recompute(doc)
+            # addExternal rebuilds the external geometry list itself, so the
+            # count below is current even when a batch skips the recompute.
+            self._recompute_sketch(doc, sketch)
 
             # Count external geometry to report the geo_id
             ext_count = sketch.ExternalGeometryCount
@@ -54,6 +54,7 @@ class SpatialOpsHandler(BaseHandler):
         doc = self.get_document()
         if not doc:
             return None, None, None, "No active document"
+        self.settle(doc)
 
         obj1 = self.get_object(obj1_name, doc)
         obj2 = self.get_object(obj2_name, doc)
@@ -283,6 +284,7 @@ class SpatialOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "Error: No active document"
+            self.settle(doc)
             obj = self.get_object(obj_name, doc)
             if not obj:
                 return f"Error: Object not found: {obj_name}"
@@ -420,6 +422,7 @@ class SpatialOpsHandler(BaseHandler):
             doc = self.get_document()
             if not doc:
                 return "No active document"
+            self.settle(doc)
 
             # Resolve all objects, collecting non-solid warnings
             shapes = {}
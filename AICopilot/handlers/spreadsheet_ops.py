@@ -1,11 +1,19 @@
 # Spreadsheet workbench operation handlers for FreeCAD MCP
 
+import csv
+import io
 import json
+import re
+import xml.etree.ElementTree as ET
 import FreeCAD
 from typing import Dict, Any
 from .base import BaseHandler
 
 
+# A1-style cell reference: column letters then row number ("B2", "AA10").
+_A1_RE = re.compile(r'([A-Z]+)(\d+)')
+
+
 def _col_to_num(col):
     """Spreadsheet column letters ('A', 'Z', 'AA', ...) -> 1-based number.
 
@@ -20,15 +28,78 @@ def _col_to_num(col):
     return num
 
 
+_AZ = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+
+
 def _num_to_col(num):
     """1-based column number -> spreadsheet column letters. Inverse of
-    _col_to_num; same consolidation rationale."""
-    col = ''
+    _col_to_num; same consolidation rationale.
+
+    One- and two-letter columns (A..ZZ, every column FreeCAD's sheet
+    offers) index the alphabet directly; longer ones take the general
+    divmod loop.
+    """
+    if num <= 26:
+        return _AZ[num - 1] if num > 0 else ''
+    if num <= 702:
+        q, r = divmod(num - 27, 26)
+        return _AZ[q] + _AZ[r]
+    letters = []
     while num > 0:
-        num -= 1
-        col = chr(num % 26 + ord('A')) + col
-        num //= 26
-    return col
+        num, r = divmod(num - 1, 26)
+        letters.append(_AZ[r])
+    return ''.join(reversed(letters))
+
+
+def _column_letters(start_col_num, count):
+    """Letters for `count` consecutive columns starting at start_col_num.
+
+    Bulk readers and writers build this once per call and index into it, instead of
+    converting the column number to letters again for every cell.
+    """
+    return [_num_to_col(start_col_num + i) for i in range(count)]
+
+
+def _used_cells(spreadsheet):
+    """Set of populated cell addresses, or None if the sheet can't say.
+
+    Range readers check this before calling spreadsheet.get(), so the
+    empty cells of a sparse range cost no FreeCAD call. The values
+    themselves still come from get(): cells.Content holds the raw
+    contents ('=A1*2'), not the evaluated results callers expect.
+    """
+    if not callable(getattr(spreadsheet, 'getUsedCells', None)):
+        return None
+    try:
+        used = spreadsheet.getUsedCells()
+    except Exception:
+        return None
+    return set(used) if isinstance(used, (list, tuple)) else None
+
+
+def _set_rows(spreadsheet, start_col_num, start_row, rows):
+    """Write a 2D list of strings into the sheet from (start_col_num, start_row).
+
+    An empty string is only written when the target cell currently holds
+    something — setting an already-empty cell to '' changes nothing but
+    still costs a FreeCAD call and dirties the sheet, and sparse CSVs are
+    mostly empty fields. If the used-cell list is unavailable every value
+    is written, so existing contents are always overwritten as before.
+
+    Returns the number of cells in `rows`.
+    """
+    col_letters = _column_letters(start_col_num, max(map(len, rows), default=0))
+    used = _used_cells(spreadsheet)
+    cells = 0
+    for row_idx, values in enumerate(rows):
+        row_str = str(start_row + row_idx)
+        for col_letter, value in zip(col_letters, values):
+            cell = col_letter + row_str
+            if value == '' and used is not None and cell not in used:
+                continue
+            spreadsheet.set(cell, value)
+        cells += len(values)
+    return cells
 
 
 class SpreadsheetOpsHandler(BaseHandler):
@@ -40,6 +111,20 @@ class SpreadsheetOpsHandler(BaseHandler):
         "list_aliases", "import_csv", "export_csv",
     })
 
+    def _resolve_sheet(self, spreadsheet_name: str, settle: bool = False):
+        """resolve_object plus the Spreadsheet::Sheet type check every cell
+        operation needs. Reads of computed cell values pass settle=True.
+
+        Returns (doc, spreadsheet, error); error is None on success.
+        """
+        doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet',
+                                                   settle=settle)
+        if err:
+            return doc, None, err
+        if spreadsheet.TypeId != 'Spreadsheet::Sheet':
+            return doc, None, f"Object {spreadsheet_name} is not a spreadsheet"
+        return doc, spreadsheet, None
+
     def create_spreadsheet(self, args: Dict[str, Any]) -> str:
         """Create a new spreadsheet in the active document."""
         try:
@@ -66,17 +151,15 @@ class SpreadsheetOpsHandler(BaseHandler):
             cell = args.get('cell', 'A1')
             value = args.get('value', '')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             # A null value clears the cell rather than writing the literal "None".
             spreadsheet.set(cell, '' if value is None else str(value))
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Set {spreadsheet_name}.{cell} = {value}"
+            return f"Set {spreadsheet_name}.{cell} = {value}{note}"
 
         except Exception as e:
             return f"Error setting cell: {e}"
@@ -87,11 +170,9 @@ class SpreadsheetOpsHandler(BaseHandler):
             spreadsheet_name = args.get('spreadsheet_name', '')
             cell = args.get('cell', 'A1')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name, settle=True)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             value = spreadsheet.get(cell)
             # getContents returns the stored expression/formula (e.g. "=A1+B1");
@@ -120,19 +201,17 @@ class SpreadsheetOpsHandler(BaseHandler):
             cell = args.get('cell', 'A1')
             alias = args.get('alias', '')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             if not alias:
                 return "Alias name is required"
 
             spreadsheet.setAlias(cell, alias)
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Set alias '{alias}' for {spreadsheet_name}.{cell}"
+            return f"Set alias '{alias}' for {spreadsheet_name}.{cell}{note}"
 
         except Exception as e:
             return f"Error setting alias: {e}"
@@ -143,11 +222,9 @@ class SpreadsheetOpsHandler(BaseHandler):
             spreadsheet_name = args.get('spreadsheet_name', '')
             cell = args.get('cell', 'A1')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             alias = spreadsheet.getAlias(cell)
 
@@ -165,16 +242,14 @@ class SpreadsheetOpsHandler(BaseHandler):
             spreadsheet_name = args.get('spreadsheet_name', '')
             cell = args.get('cell', 'A1')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             spreadsheet.clear(cell)
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Cleared {spreadsheet_name}.{cell}"
+            return f"Cleared {spreadsheet_name}.{cell}{note}"
 
         except Exception as e:
             return f"Error clearing cell: {e}"
@@ -186,38 +261,31 @@ class SpreadsheetOpsHandler(BaseHandler):
             start_cell = args.get('start_cell', 'A1')
             values = args.get('values', [])  # 2D array of values
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             if not values:
                 return "No values provided"
 
             # Parse start cell (e.g., "A1" -> col='A', row=1)
-            import re
-            match = re.match(r'([A-Z]+)(\d+)', start_cell.upper())
+            match = _A1_RE.match(start_cell.upper())
             if not match:
                 return f"Invalid cell reference: {start_cell}"
 
-            start_col = match.group(1)
+            start_col_num = _col_to_num(match.group(1))
             start_row = int(match.group(2))
 
-            cells_set = 0
-            for row_idx, row_values in enumerate(values):
-                if not isinstance(row_values, list):
-                    row_values = [row_values]
-                for col_idx, value in enumerate(row_values):
-                    col_num = _col_to_num(start_col) + col_idx
-                    col_letter = _num_to_col(col_num)
-                    cell = f"{col_letter}{start_row + row_idx}"
-                    spreadsheet.set(cell, str(value))
-                    cells_set += 1
+            rows = [[str(v) for v in row] if isinstance(row, list) else [str(row)]
+                    for row in values]
 
-            self.recompute(doc)
+            # Every set() only marks the sheet; the single recompute below
+            # evaluates the whole range once.
+            cells_set = _set_rows(spreadsheet, start_col_num, start_row, rows)
+
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Set {cells_set} cells in {spreadsheet_name} starting at {start_cell}"
+            return f"Set {cells_set} cells in {spreadsheet_name} starting at {start_cell}{note}"
 
         except Exception as e:
             return f"Error setting cell range: {e}"
@@ -229,17 +297,13 @@ class SpreadsheetOpsHandler(BaseHandler):
             start_cell = args.get('start_cell', 'A1')
             end_cell = args.get('end_cell', 'A1')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name, settle=True)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
-
-            import re
 
             # Parse start cell
-            match_start = re.match(r'([A-Z]+)(\d+)', start_cell.upper())
-            match_end = re.match(r'([A-Z]+)(\d+)', end_cell.upper())
+            match_start = _A1_RE.match(start_cell.upper())
+            match_end = _A1_RE.match(end_cell.upper())
 
             if not match_start or not match_end:
                 return f"Invalid cell reference: {start_cell} or {end_cell}"
@@ -249,11 +313,18 @@ class SpreadsheetOpsHandler(BaseHandler):
             start_row = int(match_start.group(2))
             end_row = int(match_end.group(2))
 
+            col_letters = _column_letters(start_col_num, end_col_num - start_col_num + 1)
+            used = _used_cells(spreadsheet)
+
             values = []
             for row in range(start_row, end_row + 1):
+                row_str = str(row)
                 row_values = []
-                for col_num in range(start_col_num, end_col_num + 1):
-                    cell = f"{_num_to_col(col_num)}{row}"
+                for col_letter in col_letters:
+                    cell = col_letter + row_str
+                    if used is not None and cell not in used:
+                        row_values.append("")
+                        continue
                     try:
                         value = spreadsheet.get(cell)
                         row_values.append(str(value) if value is not None else "")
@@ -289,9 +360,9 @@ class SpreadsheetOpsHandler(BaseHandler):
             expression = f"{spreadsheet_name}.{cell_or_alias}"
             obj.setExpression(property_name, expression)
 
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Bound {object_name}.{property_name} to {expression}"
+            return f"Bound {object_name}.{property_name} to {expression}{note}"
 
         except Exception as e:
             return f"Error binding property: {e}"
@@ -301,34 +372,36 @@ class SpreadsheetOpsHandler(BaseHandler):
         try:
             spreadsheet_name = args.get('spreadsheet_name', '')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
-            # Get all cells with aliases
+            # Get all cells with aliases from the cells.Content XML, which
+            # FreeCAD keeps authoritative. One attribute read and one parse;
+            # a sheet whose XML parses with no aliases has none.
+            # Streamed with iterparse, clearing each element once read, so a
+            # large sheet never holds a full tree just to collect attributes.
             aliases = {}
+            parsed = False
             if hasattr(spreadsheet, 'cells'):
-                cells_content = spreadsheet.cells.Content
-                # Parse the content to find aliases
-                # FreeCAD stores this in XML format
-                import xml.etree.ElementTree as ET
                 try:
-                    root = ET.fromstring(cells_content)
-                    for cell in root.findall('.//Cell'):
-                        alias = cell.get('alias')
-                        address = cell.get('address')
-                        if alias and address:
-                            aliases[address] = alias
+                    for _, elem in ET.iterparse(io.StringIO(spreadsheet.cells.Content)):
+                        if elem.tag == 'Cell':
+                            alias = elem.get('alias')
+                            address = elem.get('address')
+                            if alias and address:
+                                aliases[address] = alias
+                        elem.clear()
+                    parsed = True
                 except Exception:
-                    pass
-
-            # Fallback if XML parsing yielded nothing: ask the sheet for its
-            # non-empty cells and check each for an alias. getUsedCells() covers
-            # the exact populated extent regardless of column — far better than
-            # scanning a guessed A-Z grid (which silently missed columns past Z).
-            if not aliases and callable(getattr(spreadsheet, 'getUsedCells', None)):
+                    aliases = {}
+
+            # Fallback only if the XML was unavailable or unparseable: ask the
+            # sheet for its non-empty cells and check each for an alias.
+            # getUsedCells() covers the exact populated extent regardless of
+            # column — far better than scanning a guessed A-Z grid (which
+            # silently missed columns past Z).
+            if not parsed and callable(getattr(spreadsheet, 'getUsedCells', None)):
                 try:
                     used_cells = list(spreadsheet.getUsedCells())
                 except Exception:
@@ -357,42 +430,29 @@ class SpreadsheetOpsHandler(BaseHandler):
             start_cell = args.get('start_cell', 'A1')
             delimiter = args.get('delimiter', ',')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
 
             if not csv_data:
                 return "No CSV data provided"
 
-            import re
-            match = re.match(r'([A-Z]+)(\d+)', start_cell.upper())
+            match = _A1_RE.match(start_cell.upper())
             if not match:
                 return f"Invalid cell reference: {start_cell}"
 
-            start_col = match.group(1)
+            start_col_num = _col_to_num(match.group(1))
             start_row = int(match.group(2))
 
-            start_col_num = _col_to_num(start_col)
-
             # csv.reader handles quoted fields, embedded delimiters and embedded
             # newlines correctly; naive line.split(delimiter) silently breaks cell
             # boundaries whenever a field contains the delimiter or a newline.
-            import csv as _csv
-            import io as _io
-            cells_set = 0
-            reader = _csv.reader(_io.StringIO(csv_data), delimiter=delimiter)
-            for row_idx, values in enumerate(reader):
-                for col_idx, value in enumerate(values):
-                    col_letter = _num_to_col(start_col_num + col_idx)
-                    cell = f"{col_letter}{start_row + row_idx}"
-                    spreadsheet.set(cell, value)
-                    cells_set += 1
+            rows = list(csv.reader(io.StringIO(csv_data), delimiter=delimiter))
+            cells_set = _set_rows(spreadsheet, start_col_num, start_row, rows)
 
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Imported {cells_set} cells from CSV into {spreadsheet_name}"
+            return f"Imported {cells_set} cells from CSV into {spreadsheet_name}{note}"
 
         except Exception as e:
             return f"Error importing CSV: {e}"
@@ -405,13 +465,9 @@ class SpreadsheetOpsHandler(BaseHandler):
             end_cell = args.get('end_cell')   # None => auto-detect the used range
             delimiter = args.get('delimiter', ',')
 
-            doc, spreadsheet, err = self.resolve_object(spreadsheet_name, noun='Spreadsheet')
+            doc, spreadsheet, err = self._resolve_sheet(spreadsheet_name, settle=True)
             if err:
                 return err
-            if spreadsheet.TypeId != 'Spreadsheet::Sheet':
-                return f"Object {spreadsheet_name} is not a spreadsheet"
-
-            import re
 
             # Default to the sheet's actual used range, not a hardcoded J100 box
             # that silently drops any data beyond column J / row 100.
@@ -425,8 +481,8 @@ class SpreadsheetOpsHandler(BaseHandler):
                 except Exception:
                     pass
 
-            match_start = re.match(r'([A-Z]+)(\d+)', start_cell.upper())
-            match_end = re.match(r'([A-Z]+)(\d+)', end_cell.upper())
+            match_start = _A1_RE.match(start_cell.upper())
+            match_end = _A1_RE.match(end_cell.upper())
 
             if not match_start or not match_end:
                 return f"Invalid cell reference"
@@ -438,20 +494,26 @@ class SpreadsheetOpsHandler(BaseHandler):
 
             # csv.writer quotes/escapes fields containing the delimiter, quotes or
             # newlines; the old delimiter.join produced structurally broken CSV.
-            import csv as _csv
-            import io as _io
-            buf = _io.StringIO()
-            writer = _csv.writer(buf, delimiter=delimiter)
+            buf = io.StringIO()
+            writer = csv.writer(buf, delimiter=delimiter)
+            col_letters = _column_letters(start_col_num, end_col_num - start_col_num + 1)
+            used = _used_cells(spreadsheet)
             errors = []
+            # One row buffer, overwritten in place: writerow serializes it
+            # into buf immediately, so it can be reused for the next row.
+            row_values = [""] * len(col_letters)
             for row in range(start_row, end_row + 1):
-                row_values = []
-                for col_num in range(start_col_num, end_col_num + 1):
-                    cell = f"{_num_to_col(col_num)}{row}"
+                row_str = str(row)
+                for j, col_letter in enumerate(col_letters):
+                    cell = col_letter + row_str
+                    if used is not None and cell not in used:
+                        row_values[j] = ""
+                        continue
                     try:
                         value = spreadsheet.get(cell)
-                        row_values.append("" if value is None else str(value))
+                        row_values[j] = "" if value is None else str(value)
                     except Exception as e:
-                        row_values.append("")
+                        row_values[j] = ""
                         errors.append(f"{cell}: {e}")
                 writer.writerow(row_values)
             csv_data = buf.getvalue()
@@ -468,7 +530,7 @@ class SpreadsheetOpsHandler(BaseHandler):
                 if callable(getattr(spreadsheet, 'getUsedRange', None)):
                     ur = spreadsheet.getUsedRange()
                     if ur and len(ur) == 2 and ur[1]:
-                        m = re.match(r'([A-Z]+)(\d+)', ur[1].upper())
+                        m = _A1_RE.match(ur[1].upper())
                         if m and (_col_to_num(m.group(1)) > end_col_num
                                   or int(m.group(2)) > end_row):
                             truncated = True
@@ -5,6 +5,14 @@ from typing import Dict, Any
 from .base import BaseHandler
 
 
+# rotate_object axis names -> direction.
+_AXIS_DIRECTIONS = {
+    'x': (1, 0, 0),
+    'y': (0, 1, 0),
+    'z': (0, 0, 1),
+}
+
+
 class TransformsHandler(BaseHandler):
     """Handler for transform operations (move, rotate, copy, array)."""
 
@@ -28,18 +36,19 @@ class TransformsHandler(BaseHandler):
             if err:
                 return self.log_and_return("move_object", args, error=Exception(err))
 
+            # obj.Placement hands back a copy on every read: read it once,
+            # edit the copy, and assign it back in a single property write.
+            placement = obj.Placement
             if relative:
-                obj.Placement.Base = FreeCAD.Vector(
-                    obj.Placement.Base.x + x,
-                    obj.Placement.Base.y + y,
-                    obj.Placement.Base.z + z
-                )
+                base = placement.Base
+                placement.Base = FreeCAD.Vector(base.x + x, base.y + y, base.z + z)
                 result = f"Moved {object_name} by ({x}, {y}, {z})"
             else:
-                obj.Placement.Base = FreeCAD.Vector(x, y, z)
+                placement.Base = FreeCAD.Vector(x, y, z)
                 result = f"Moved {object_name} to ({x}, {y}, {z})"
+            obj.Placement = placement
+            result += self.recompute_or_defer(doc, args)
 
-            self.recompute(doc)
             duration = time.time() - start_time
             return self.log_and_return("move_object", args, result=result, duration=duration)
 
@@ -58,26 +67,26 @@ class TransformsHandler(BaseHandler):
             if err:
                 return err
 
-            # Set rotation axis
-            axis_vectors = {
-                'x': FreeCAD.Vector(1, 0, 0),
-                'y': FreeCAD.Vector(0, 1, 0),
-                'z': FreeCAD.Vector(0, 0, 1),
-            }
-            axis_vector = axis_vectors.get(axis.lower())
-            if axis_vector is None:
+            direction = _AXIS_DIRECTIONS.get(axis.lower())
+            if direction is None:
                 # No fallback — an unrecognized axis used to silently
                 # rotate around Z while the success message still echoed
                 # the requested axis string, e.g. axis="q" reporting
                 # "around Q-axis" while actually rotating around Z.
                 return f"Invalid axis '{axis}': must be 'x', 'y', or 'z'"
 
+            if angle == 0:
+                # Nothing changes, so skip the Placement write and recompute.
+                return f"Rotated {object_name} by 0° around {axis.upper()}-axis (no change)"
+
             # Rotate object
-            rotation = FreeCAD.Rotation(axis_vector, angle)
-            obj.Placement.Rotation = obj.Placement.Rotation.multiply(rotation)
-            self.recompute(doc)
+            placement = obj.Placement
+            placement.Rotation = placement.Rotation.multiply(
+                FreeCAD.Rotation(FreeCAD.Vector(*direction), angle))
+            obj.Placement = placement
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Rotated {object_name} by {angle}° around {axis.upper()}-axis"
+            return f"Rotated {object_name} by {angle}° around {axis.upper()}-axis{note}"
 
         except Exception as e:
             return f"Error rotating object: {e}"
@@ -100,14 +109,13 @@ class TransformsHandler(BaseHandler):
             # original's (which silently couples the "copy" to the source).
             copy = doc.copyObject(obj, True)
             copy.Label = name
-            copy.Placement.Base = FreeCAD.Vector(
-                obj.Placement.Base.x + x,
-                obj.Placement.Base.y + y,
-                obj.Placement.Base.z + z
-            )
-            self.recompute(doc)
+            base = obj.Placement.Base
+            placement = copy.Placement
+            placement.Base = FreeCAD.Vector(base.x + x, base.y + y, base.z + z)
+            copy.Placement = placement
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Created copy: {copy.Name} at offset ({x}, {y}, {z})"
+            return f"Created copy: {copy.Name} at offset ({x}, {y}, {z}){note}"
 
         except Exception as e:
             return f"Error copying object: {e}"
@@ -125,21 +133,25 @@ class TransformsHandler(BaseHandler):
             if err:
                 return err
 
-            # Create array copies
+            # Create array copies. The source base and label are read once;
+            # each copy gets one Placement write and the document one
+            # recompute after the loop.
+            base = obj.Placement.Base
+            bx, by, bz = base.x, base.y, base.z
+            label = obj.Label
             copies = []
             for i in range(1, count):  # Start from 1 (original is 0)
                 copy = doc.copyObject(obj)
-                copy.Label = f"{obj.Label}_Array{i}"
-                copy.Placement.Base = FreeCAD.Vector(
-                    obj.Placement.Base.x + (spacing_x * i),
-                    obj.Placement.Base.y + (spacing_y * i),
-                    obj.Placement.Base.z + (spacing_z * i)
-                )
+                copy.Label = f"{label}_Array{i}"
+                placement = copy.Placement
+                placement.Base = FreeCAD.Vector(
+                    bx + spacing_x * i, by + spacing_y * i, bz + spacing_z * i)
+                copy.Placement = placement
                 copies.append(copy.Name)
 
-            self.recompute(doc)
+            note = self.recompute_or_defer(doc, args)
 
-            return f"Created array: {count} copies of {object_name} with spacing ({spacing_x}, {spacing_y}, {spacing_z})"
+            return f"Created array: {count} copies of {object_name} with spacing ({spacing_x}, {spacing_y}, {spacing_z}){note}"
 
         except Exception as e:
             return f"Error creating array: {e}"
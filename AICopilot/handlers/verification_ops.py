@@ -224,7 +224,7 @@ class VerificationOpsHandler(BaseHandler):
                                 f"Use [x,y,z] list or named axis like '+Z', '-X', '+Y'.")
                 })
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return json.dumps({"ok": False, "details": {}, "message": err})
 
@@ -367,7 +367,7 @@ class VerificationOpsHandler(BaseHandler):
                     "message": "Missing required argument: object_name"
                 })
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return json.dumps({"ok": False, "details": {}, "message": err})
 
@@ -459,7 +459,7 @@ class VerificationOpsHandler(BaseHandler):
                     "message": "Missing required argument: object_name"
                 })
 
-            doc, obj, err = self.resolve_object(object_name, attr='Shape')
+            doc, obj, err = self.resolve_object(object_name, attr='Shape', settle=True)
             if err:
                 return json.dumps({"ok": False, "details": {}, "message": err})
 
@@ -1,7 +1,11 @@
 # View operation handlers for FreeCAD MCP
 
+import base64
 import json
+import math
 import platform
+import sys
+import time
 import FreeCAD
 from typing import Dict, Any
 from .base import BaseHandler
@@ -22,6 +26,67 @@ _FACE_THRESH_MED   = 20_000   # above this: cap at 800x600
 _FACE_THRESH_HIGH  = 80_000   # above this: cap at 640x480
 _FACE_THRESH_HUGE  = 200_000  # above this: cap at 400x300
 
+# view_type (lower-cased) -> FreeCAD view command, for set_view.
+_VIEW_COMMANDS = {
+    'top': 'Std_ViewTop',
+    'bottom': 'Std_ViewBottom',
+    'front': 'Std_ViewFront',
+    'rear': 'Std_ViewRear',
+    'back': 'Std_ViewRear',
+    'left': 'Std_ViewLeft',
+    'right': 'Std_ViewRight',
+    'isometric': 'Std_ViewIsometric',
+    'iso': 'Std_ViewIsometric',
+    'axonometric': 'Std_ViewAxonometric',
+    'axo': 'Std_ViewAxonometric',
+}
+
+
+# Slice size for _encode_file_base64 -- a multiple of 3, so every chunk but
+# the last encodes without '=' padding and the pieces concatenate cleanly.
+_B64_CHUNK = 48 * 1024
+
+
+def _encode_file_base64(path) -> str:
+    """Base64-encode the file at *path* in _B64_CHUNK pieces.
+
+    The file is mmap'd and fed to b64encode through memoryview slices, so
+    the raw image is never copied into Python bytes; only the encoded buffer
+    and the final str are allocated. f.read() + b64encode() used to keep the
+    raw PNG, its encoded copy and the str alive at once.
+    """
+    import mmap
+    import os
+    buf = bytearray()
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return ""  # mmap refuses zero-length files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                for start in range(0, len(view), _B64_CHUNK):
+                    buf += base64.b64encode(view[start:start + _B64_CHUNK])
+            finally:
+                view.release()  # mmap can't close while a view is exported
+    return buf.decode("ascii")
+
+
+# RAM-backed tmpfs on Linux; see _screenshot_tmp_dir.
+_SHM_DIR = "/dev/shm"
+
+
+def _screenshot_tmp_dir():
+    """Directory for the screenshot scratch PNG, or None for the default.
+
+    saveImage() and screencapture can only write to a path, so the PNG has
+    to round-trip through a file. On Linux, put that file on /dev/shm when
+    it is writable so the round-trip never touches the disk.
+    """
+    import os
+    if platform.system() == "Linux" and os.path.isdir(_SHM_DIR) and os.access(_SHM_DIR, os.W_OK):
+        return _SHM_DIR
+    return None
+
 
 def _read_png_dimensions(path):
     """Read a PNG's actual width/height from its IHDR chunk, without a
@@ -44,26 +109,235 @@ def _read_png_dimensions(path):
         return None
 
 
-def _estimate_scene_faces() -> int:
-    """Count total visible faces across all visible objects in the active document."""
-    doc = FreeCAD.ActiveDocument
-    if not doc:
-        return 0
-    total = 0
+def _read_jpeg_dimensions(path):
+    """Read a JPEG's width/height from its first SOFn segment, the JPEG
+    counterpart of _read_png_dimensions. Returns None if no frame header is
+    found."""
+    import struct
+    try:
+        with open(path, "rb") as f:
+            if f.read(2) != b'\xff\xd8':
+                return None
+            while True:
+                marker = f.read(2)
+                if len(marker) < 2 or marker[0] != 0xFF:
+                    return None
+                kind = marker[1]
+                if kind == 0x01 or 0xD0 <= kind <= 0xD8:
+                    continue  # standalone marker, no length field
+                seg_len = struct.unpack('>H', f.read(2))[0]
+                # SOF0..SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+                if 0xC0 <= kind <= 0xCF and kind not in (0xC4, 0xC8, 0xCC):
+                    height, width = struct.unpack('>xHH', f.read(5))
+                    return width, height
+                f.seek(seg_len - 2, 1)
+    except Exception:
+        return None
+
+
+# screenshot format -> (file suffix, MIME type). saveImage() and
+# screencapture both pick the encoder from the requested type; JPEG runs
+# several times smaller than PNG for shaded viewport captures, which is
+# what the base64 payload (and an LLM client's token bill) scales with.
+_IMAGE_FORMATS = {
+    'png': ('.png', 'image/png'),
+    'jpeg': ('.jpg', 'image/jpeg'),
+    'jpg': ('.jpg', 'image/jpeg'),
+}
+
+
+# Face counts of recently screenshotted scenes, keyed on the
+# _visible_scene() signature, so an unchanged scene hits and any edit misses.
+_FACE_CACHE_SIZE = 16
+_face_count_cache = {}
+
+# Recent saveImage() results keyed on (scene signature, camera, width,
+# height, MIME type). Repeat screenshots of an untouched scene skip the
+# render; kept small because every entry holds a full base64 image.
+_SCREENSHOT_CACHE_SIZE = 4
+_screenshot_cache = {}
+
+
+def _face_count(shape) -> int:
+    """Number of faces in *shape* without building the Faces list.
+
+    countElement() asks OCCT for the count directly; shape.Faces would wrap
+    every TopoDS_Face in a Python object just to take len(). Older builds
+    without countElement fall back to the list.
+    """
+    try:
+        return shape.countElement("Face")
+    except AttributeError:
+        return len(shape.Faces)
+
+
+def _cache_put(cache: dict, size: int, key, value):
+    """Insert into a small FIFO-bounded cache (dicts keep insertion order)."""
+    if len(cache) >= size:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+class _SceneObserver:
+    """App/Gui document and selection observer that bumps _scene_generation
+    on any edit.
+
+    FreeCAD calls the slot* methods on the main thread for every created,
+    deleted, changed or recomputed object (view-provider changes such as
+    colour included, via the Gui registration), and the *Selection methods
+    whenever the highlighted set changes, so an unchanged generation means
+    an unchanged scene without walking doc.Objects.
+    """
+
+    def _bump(self, *args):
+        global _scene_generation
+        _scene_generation += 1
+
+    slotCreatedObject = slotDeletedObject = slotChangedObject = _bump
+    slotRecomputedObject = slotUndoDocument = slotRedoDocument = _bump
+    addSelection = removeSelection = setSelection = clearSelection = _bump
+
+
+_scene_generation = 0
+_scene_observer = None  # _SceneObserver once registered, False if that failed
+# True once the Gui document and selection registrations also succeeded --
+# only then does the generation see everything a screenshot shows.
+_scene_observer_gui = False
+
+
+def _watch_scene() -> bool:
+    """Register the scene observer on first use; True if generations are live."""
+    global _scene_observer, _scene_observer_gui
+    if _scene_observer is None:
+        observer = _SceneObserver()
+        try:
+            FreeCAD.addDocumentObserver(observer)
+            _scene_observer = observer
+        except Exception:
+            _scene_observer = False
+            return False
+        try:
+            if FreeCADGui is not None:
+                FreeCADGui.addDocumentObserver(observer)
+                FreeCADGui.Selection.addObserver(observer)
+                _scene_observer_gui = True
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(
+                f"[MCP] Gui scene observer unavailable, screenshot cache disabled: {e}\n")
+    return bool(_scene_observer)
+
+
+def _unwatch_scene(observer):
+    """Unregister *observer* from everything _watch_scene registered it with."""
+    for remove in (lambda: FreeCAD.removeDocumentObserver(observer),
+                   lambda: FreeCADGui.removeDocumentObserver(observer),
+                   lambda: FreeCADGui.Selection.removeObserver(observer)):
+        try:
+            remove()
+        except Exception:
+            pass  # never registered there (headless, or registration failed)
+
+
+# A handler reload re-executes this module while sys.modules still holds the
+# old one; drop its observer so reloads don't stack up live observers.
+_previous = sys.modules.get(__name__)
+if _previous is not None and getattr(_previous, "_scene_observer", None):
+    _unwatch_scene(_previous._scene_observer)
+del _previous
+
+
+def _invalidate_screenshots():
+    """Mark the scene changed for edits no observer sees (Coin nodes put
+    straight into the scene graph, e.g. clip planes)."""
+    global _scene_generation
+    _scene_generation += 1
+    _screenshot_cache.clear()
+
+
+def _visible_shapes(doc, visibility):
+    """Shapes of the objects in doc that are currently shown.
+
+    visibility is the server's {obj.Name: bool} snapshot (see
+    FreeCADSocketServer._refresh_visibility_cache); objects found in it skip
+    the per-object visibility reads.
+    """
+    if not isinstance(visibility, dict):
+        visibility = {}
+    shapes = []
     for obj in doc.Objects:
         if not hasattr(obj, "Shape"):
             continue
-        # Check visibility via GUI
-        try:
-            vobj = obj.ViewObject
-            if vobj and not vobj.Visibility:
+        # App-side Visibility mirrors the view provider's and is a plain
+        # property read; only go through ViewObject (a Coin bridge call
+        # that can sync the scene graph) when it isn't available.
+        visible = visibility.get(obj.Name)
+        if visible is None:
+            visible = getattr(obj, "Visibility", None)
+        if isinstance(visible, bool):
+            if not visible:
                 continue
+        else:
+            try:
+                vobj = obj.ViewObject
+                if vobj and not vobj.Visibility:
+                    continue
+            except Exception:
+                pass
+        try:
+            shapes.append(obj.Shape)
         except Exception:
             pass
+    return shapes
+
+
+def _visible_scene(visibility=None):
+    """Return (signature, shapes) for the active document's visible scene.
+
+    With the scene observer registered, signature is (doc name, generation)
+    and shapes is None -- nothing is walked until a cache misses. Otherwise
+    the visible shapes are collected and signature is the document name plus
+    every shape's hashCode() (a recompute replaces the OCCT shape; hiding or
+    showing changes the set). signature is None when there is no document or
+    a shape can't be hashed.
+    """
+    doc = FreeCAD.ActiveDocument
+    if not doc:
+        return None, []
+    if _watch_scene():
+        return (doc.Name, _scene_generation), None
+    shapes = _visible_shapes(doc, visibility)
+    try:
+        key = (doc.Name, tuple(shape.hashCode() for shape in shapes))
+    except Exception:
+        key = None  # no cheap signature -- callers skip their caches
+    return key, shapes
+
+
+def _estimate_scene_faces(visibility=None, scene=None) -> int:
+    """Count total visible faces across all visible objects in the active document.
+
+    scene is a precomputed _visible_scene() result; otherwise one is built
+    from visibility. Stops counting once _FACE_THRESH_HUGE is reached, so
+    very large scenes report a lower bound rather than the exact total.
+    """
+    key, shapes = scene if scene is not None else _visible_scene(visibility)
+    if key is not None and key in _face_count_cache:
+        return _face_count_cache[key]
+    if shapes is None:
+        doc = FreeCAD.ActiveDocument
+        shapes = _visible_shapes(doc, visibility) if doc else []
+
+    total = 0
+    for shape in shapes:
         try:
-            total += len(obj.Shape.Faces)
+            total += _face_count(shape)
         except Exception:
             pass
+        if total >= _FACE_THRESH_HUGE:
+            break  # already in the top bucket; the exact figure is never used
+
+    if key is not None:
+        _cache_put(_face_count_cache, _FACE_CACHE_SIZE, key, total)
     return total
 
 
@@ -83,6 +357,40 @@ def _clamp_resolution(requested_w: int, requested_h: int, face_count: int):
     return w, h, (w != requested_w or h != requested_h)
 
 
+# Render-time feedback for saveImage. Face count is only a proxy: lights,
+# transparency and large flat faces cost differently. Keep an EWMA of how long
+# recent saveImage() calls took per megapixel, and when the predicted time for
+# the next request exceeds _SAVE_TARGET_MS, shrink both sides by
+# sqrt(target / predicted) so the pixel count tracks the time budget. Storing
+# a per-pixel rate (not raw ms) keeps a downscaled render from reading as
+# "fast" and bouncing the next request back to full size.
+_SAVE_TARGET_MS = 2000.0
+_SAVE_EWMA_ALPHA = 0.3
+_SAVE_MIN_SCALE = 0.25
+_save_ms_per_mpx = None
+
+
+def _record_save_time(elapsed_ms: float, width: int, height: int):
+    global _save_ms_per_mpx
+    mpx = max(width * height, 1) / 1e6
+    rate = elapsed_ms / mpx
+    if _save_ms_per_mpx is None:
+        _save_ms_per_mpx = rate
+    else:
+        _save_ms_per_mpx = (1 - _SAVE_EWMA_ALPHA) * _save_ms_per_mpx + _SAVE_EWMA_ALPHA * rate
+
+
+def _save_time_scale(width: int, height: int) -> float:
+    """Linear scale (<= 1.0) for width/height so the predicted saveImage()
+    time stays within _SAVE_TARGET_MS; 1.0 until a render has been timed."""
+    if _save_ms_per_mpx is None:
+        return 1.0
+    predicted_ms = _save_ms_per_mpx * (width * height / 1e6)
+    if predicted_ms <= _SAVE_TARGET_MS:
+        return 1.0
+    return max(_SAVE_MIN_SCALE, math.sqrt(_SAVE_TARGET_MS / predicted_ms))
+
+
 class ViewOpsHandler(BaseHandler):
     """Handler for view control operations."""
 
@@ -110,24 +418,16 @@ class ViewOpsHandler(BaseHandler):
             if not FreeCADGui.ActiveDocument:
                 return "No active document for view change"
 
-            view_type = args.get('view_type', 'isometric').lower()
-
-            views = {
-                'top': 'Std_ViewTop',
-                'bottom': 'Std_ViewBottom',
-                'front': 'Std_ViewFront',
-                'rear': 'Std_ViewRear',
-                'back': 'Std_ViewRear',
-                'left': 'Std_ViewLeft',
-                'right': 'Std_ViewRight',
-                'isometric': 'Std_ViewIsometric',
-                'iso': 'Std_ViewIsometric',
-                'axonometric': 'Std_ViewAxonometric',
-                'axo': 'Std_ViewAxonometric'
-            }
+            view_type = args.get('view_type', 'isometric')
 
-            if view_type in views:
-                FreeCADGui.runCommand(views[view_type], 0)
+            # Callers almost always send the canonical lower-case name, so
+            # only lower() on a miss.
+            cmd = _VIEW_COMMANDS.get(view_type)
+            if cmd is None:
+                view_type = view_type.lower()
+                cmd = _VIEW_COMMANDS.get(view_type)
+            if cmd is not None:
+                FreeCADGui.runCommand(cmd, 0)
                 return f"View set to {view_type}"
             else:
                 return f"Unknown view type: {view_type}. Available: top, bottom, front, rear, left, right, isometric"
@@ -156,8 +456,9 @@ class ViewOpsHandler(BaseHandler):
     def zoom_in(self, args: Dict[str, Any]) -> str:
         """Zoom in on the view."""
         try:
-            if FreeCADGui.ActiveDocument:
-                FreeCADGui.activeDocument().activeView().zoomIn()
+            gui_doc = FreeCADGui.ActiveDocument
+            if gui_doc:
+                gui_doc.activeView().zoomIn()
                 return "Zoomed in"
             else:
                 return "No active document"
@@ -167,8 +468,9 @@ class ViewOpsHandler(BaseHandler):
     def zoom_out(self, args: Dict[str, Any]) -> str:
         """Zoom out on the view."""
         try:
-            if FreeCADGui.ActiveDocument:
-                FreeCADGui.activeDocument().activeView().zoomOut()
+            gui_doc = FreeCADGui.ActiveDocument
+            if gui_doc:
+                gui_doc.activeView().zoomOut()
                 return "Zoomed out"
             else:
                 return "No active document"
@@ -232,7 +534,10 @@ class ViewOpsHandler(BaseHandler):
             return f"Error getting selection: {e}"
 
     def take_screenshot(self, args: Dict[str, Any]) -> str:
-        """Take a screenshot of the FreeCAD viewport and return as base64-encoded PNG.
+        """Take a screenshot of the FreeCAD viewport and return it base64-encoded.
+
+        format selects 'png' (default) or 'jpeg'; mime_type in the result
+        says which one came back.
 
         MUST run on the GUI thread (dispatch layer handles this).
 
@@ -245,11 +550,14 @@ class ViewOpsHandler(BaseHandler):
         """
         import tempfile
         import os
-        import base64
         import subprocess
 
         req_width = args.get("width", 800)
         req_height = args.get("height", 600)
+        fmt = str(args.get("format", "png")).lower()
+        if fmt not in _IMAGE_FORMATS:
+            return json.dumps({"success": False, "error": f"Unknown format '{fmt}'. Available: png, jpeg"})
+        suffix, mime_type = _IMAGE_FORMATS[fmt]
         tmp_path = None
 
         try:
@@ -278,22 +586,23 @@ class ViewOpsHandler(BaseHandler):
                 if view is None:
                     return json.dumps({"success": False, "error": "No active view"})
 
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+            with tempfile.NamedTemporaryFile(suffix=suffix, delete=False,
+                                             dir=_screenshot_tmp_dir()) as f:
                 tmp_path = f.name
 
             # ── macOS: screencapture (subprocess, runs on socket thread) ─────────
             if platform.system() == "Darwin":
                 # -x  = suppress shutter sound
                 # no -w/-i = capture entire screen (FreeCAD visible on screen)
+                type_flag = ["-t", "jpg"] if mime_type == "image/jpeg" else []
                 proc = subprocess.run(
-                    ["screencapture", "-x", tmp_path],
+                    ["screencapture", "-x", *type_flag, tmp_path],
                     timeout=10,
                     capture_output=True,
                 )
                 stderr_text = proc.stderr.decode(errors="replace") if proc.stderr else ""
                 if proc.returncode == 0 and os.path.getsize(tmp_path) > 0:
-                    with open(tmp_path, "rb") as f:
-                        image_data = base64.b64encode(f.read()).decode("utf-8")
+                    image_data = _encode_file_base64(tmp_path)
                     # screencapture -x (no -R region flag) captures the
                     # entire screen at its native resolution, never the
                     # caller's requested width/height — echoing the
@@ -302,12 +611,13 @@ class ViewOpsHandler(BaseHandler):
                     # the request only if the PNG header can't be parsed
                     # (should not happen for a real screencapture output,
                     # but must not crash a successful capture over it).
-                    actual_dims = _read_png_dimensions(tmp_path)
+                    read_dims = _read_jpeg_dimensions if mime_type == "image/jpeg" else _read_png_dimensions
+                    actual_dims = read_dims(tmp_path)
                     actual_width, actual_height = actual_dims if actual_dims else (req_width, req_height)
                     return json.dumps({
                         "success": True,
                         "image_data": image_data,
-                        "mime_type": "image/png",
+                        "mime_type": mime_type,
                         "width": actual_width,
                         "height": actual_height,
                         "method": "screencapture",
@@ -337,28 +647,53 @@ class ViewOpsHandler(BaseHandler):
             except Exception:
                 pass
 
-            face_count = _estimate_scene_faces()
-            width, height, was_clamped = _clamp_resolution(req_width, req_height, face_count)
-
+            visibility = getattr(self.server, "_visibility_cache", None)
+            scene = _visible_scene(visibility)
+            face_count = _estimate_scene_faces(visibility, scene=scene)
+            scale = _save_time_scale(req_width, req_height)
+            width, height, was_clamped = _clamp_resolution(
+                max(1, int(req_width * scale)), max(1, int(req_height * scale)), face_count)
+
+            # Same scene generation, same camera, same size: the last render
+            # is still right. Only trusted when the Gui observer is live --
+            # the shape-hash fallback can't see colour or selection changes.
+            # nocache forces a fresh render regardless.
+            cache_key = None
+            if scene[0] is not None and _scene_observer_gui and not args.get("nocache"):
+                try:
+                    cache_key = (scene[0], view.getCamera(), width, height, mime_type)
+                except Exception:
+                    pass
+            if cache_key is not None and cache_key in _screenshot_cache:
+                return json.dumps({**_screenshot_cache[cache_key], "cached": True})
+
+            t0 = time.perf_counter()
             view.saveImage(tmp_path, width, height)
+            _record_save_time((time.perf_counter() - t0) * 1000, width, height)
 
-            with open(tmp_path, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+            image_data = _encode_file_base64(tmp_path)
 
             result = {
                 "success": True,
                 "image_data": image_data,
-                "mime_type": "image/png",
+                "mime_type": mime_type,
                 "width": width,
                 "height": height,
                 "method": "saveImage",
             }
-            if was_clamped:
+            if was_clamped or scale < 1.0:
+                reasons = []
+                if was_clamped:
+                    reasons.append(f"scene has ~{face_count:,} faces")
+                if scale < 1.0:
+                    reasons.append(f"recent renders were slow, scaled to {scale:.0%}")
                 result["note"] = (
                     f"Resolution reduced from {req_width}x{req_height} to "
-                    f"{width}x{height} (scene has ~{face_count:,} faces)"
+                    f"{width}x{height} ({'; '.join(reasons)})"
                 )
 
+            if cache_key is not None:
+                _cache_put(_screenshot_cache, _SCREENSHOT_CACHE_SIZE, cache_key, result)
             return json.dumps(result)
 
         except Exception as e:
@@ -406,6 +741,39 @@ class ViewOpsHandler(BaseHandler):
         except Exception as e:
             return f"Error showing object: {e}"
 
+    def set_objects_visibility(self, args: Dict[str, Any]) -> str:
+        """Hide or show several objects in one call.
+
+        hide_object/show_object cost one MCP round-trip and one GUI-thread
+        hop per object; this resolves the document once and toggles every
+        name in object_names, reporting any that weren't found.
+        """
+        try:
+            names = args.get('object_names') or []
+            if not isinstance(names, list) or not names:
+                return "Error: object_names must be a non-empty list"
+            visible = bool(args.get('visible', False))
+            doc = FreeCAD.ActiveDocument
+            if not doc:
+                return "Error: No active document"
+            changed, missing = [], []
+            for name in names:
+                obj = self.get_object(name, doc)
+                if not obj:
+                    missing.append(name)
+                    continue
+                obj.ViewObject.Visibility = visible
+                changed.append(name)
+            state = "shown" if visible else "hidden"
+            result = f"{len(changed)} object(s) {state}"
+            if changed:
+                result += f": {', '.join(changed)}"
+            if missing:
+                result += f"; not found: {', '.join(missing)}"
+            return result
+        except Exception as e:
+            return f"Error setting visibility: {e}"
+
     def delete_object(self, args: Dict[str, Any]) -> str:
         """Delete an object from the document."""
         try:
@@ -476,12 +844,17 @@ class ViewOpsHandler(BaseHandler):
                 if force:
                     obj.touch()
                 obj.recompute(True)
+                # An explicit recompute of a batched sketch ends its batch.
+                self._batch_sketches.discard((doc.Name, obj.Name))
                 elapsed = _time.time() - t0
                 state = list(obj.State) if hasattr(obj, 'State') else []
                 return (f"Recomputed '{object_name}' in {elapsed:.2f}s "
                         f"(State: {state or 'unknown'})")
             else:
-                doc.recompute()
+                self.recompute(doc)
+                # Also settles recomputes deferred (defer_recompute=True,
+                # sketch batches) in any other open document.
+                self.flush_recomputes()
                 elapsed = _time.time() - t0
                 return f"Recomputed document '{doc.Name}' in {elapsed:.2f}s"
         except Exception as e:
@@ -556,6 +929,7 @@ class ViewOpsHandler(BaseHandler):
             self._clip_planes.append((sg, clip))
 
             sg.insertChild(clip, 0)
+            _invalidate_screenshots()
 
             # Force a repaint so the clip shows before screenshot
             try:
@@ -585,6 +959,7 @@ class ViewOpsHandler(BaseHandler):
                 sg.removeChild(clip)
             except Exception:
                 pass
+            _invalidate_screenshots()
 
             # Force repaint
             try:
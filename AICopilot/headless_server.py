@@ -14,6 +14,7 @@ already on sys.path and `from freecad_mcp_handler import FreeCADSocketServer` wo
 """
 
 import os
+import select
 import sys
 import signal
 import time
@@ -156,24 +157,52 @@ def main():
     # ---------------------------------------------------------------------------
     # Keep the process alive until SIGTERM / SIGINT
     # ---------------------------------------------------------------------------
-    _stop = threading.Event()
+    # The handler only sets a plain flag. It runs on the main thread at
+    # whatever point the signal interrupted, and Event.set() from inside that
+    # thread's own Event.wait() can deadlock on the event's internal lock.
+    stopping = False
 
     def _on_signal(sig, frame):
+        nonlocal stopping
         FreeCAD.Console.PrintMessage(
             f"[Headless MCP] Received signal {sig}, shutting down...\n"
         )
-        _stop.set()
+        stopping = True
 
     try:
         signal.signal(signal.SIGTERM, _on_signal)
         signal.signal(signal.SIGINT, _on_signal)
+        handlers_installed = True
     except (OSError, ValueError):
         # signal.signal can fail in some environments (e.g. non-main thread)
-        pass
+        handlers_installed = False
 
     try:
-        while not _stop.is_set():
-            time.sleep(0.5)
+        if not handlers_installed:
+            # No signal can end this wait, so nothing needs to set the
+            # event from a handler; the process runs until it is killed.
+            threading.Event().wait()
+        elif sys.platform == "win32":
+            # Sleeps are interruptible by Ctrl+C on Windows, and there is
+            # no wakeup fd for a pipe there; check the flag once a second.
+            while not stopping:
+                time.sleep(1.0)
+        else:
+            # Block on a self-pipe. Python's C-level handler writes a byte
+            # to the wakeup fd for every signal, so select() returns once
+            # the handler has run -- and a signal landing between the flag
+            # check and select() still leaves its byte in the pipe.
+            wakeup_r, wakeup_w = os.pipe()
+            os.set_blocking(wakeup_w, False)
+            signal.set_wakeup_fd(wakeup_w)
+            try:
+                while not stopping:
+                    select.select([wakeup_r], [], [])
+                    os.read(wakeup_r, 512)
+            finally:
+                signal.set_wakeup_fd(-1)
+                os.close(wakeup_r)
+                os.close(wakeup_w)
     finally:
         FreeCAD.Console.PrintMessage("[Headless MCP] Stopping socket server.\n")
         server.stop_server()
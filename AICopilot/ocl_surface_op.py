@@ -91,42 +91,71 @@ def _load_stl(stl_file, ocl):
                 f"for {n_tris} triangles)"
             )
 
-        for _ in range(n_tris):
-            f.read(12)  # normal vector (ignored — OCL recomputes)
-            raw = f.read(36)
-            if len(raw) < 36:
-                raise ValueError(f"Truncated triangle data in: {stl_file}")
-            v = struct.unpack("<9f", raw)
-            f.read(2)  # attribute byte count
-
-            stl_surf.addTriangle(ocl.Triangle(
-                ocl.Point(v[0], v[1], v[2]),
-                ocl.Point(v[3], v[4], v[5]),
-                ocl.Point(v[6], v[7], v[8]),
-            ))
-
-            for i in range(3):
-                x, y = v[i * 3], v[i * 3 + 1]
-                if x < x_min: x_min = x
-                if x > x_max: x_max = x
-                if y < y_min: y_min = y
-                if y > y_max: y_max = y
+        # One read of the whole triangle block, then iter_unpack walks the
+        # 50-byte records in C -- three f.read() calls per triangle were
+        # the dominant cost on large meshes. Each record is the normal
+        # (ignored — OCL recomputes), nine vertex floats and the attribute
+        # byte count.
+        data = f.read(50 * n_tris)
+        if len(data) < 50 * n_tris:
+            raise ValueError(f"Truncated triangle data in: {stl_file}")
+
+    Triangle, Point, add = ocl.Triangle, ocl.Point, stl_surf.addTriangle
+    for (_nx, _ny, _nz, x0, y0, z0, x1, y1, z1, x2, y2, z2, _attr) \
+            in struct.iter_unpack("<12fH", data):
+        add(Triangle(Point(x0, y0, z0), Point(x1, y1, z1), Point(x2, y2, z2)))
+
+        lo = min(x0, x1, x2)
+        hi = max(x0, x1, x2)
+        if lo < x_min: x_min = lo
+        if hi > x_max: x_max = hi
+        lo = min(y0, y1, y2)
+        hi = max(y0, y1, y2)
+        if lo < y_min: y_min = lo
+        if hi > y_max: y_max = hi
 
     return stl_surf, x_min, x_max, y_min, y_max
 
 
+# Parsed STLs keyed on (path, mtime_ns, size, ocl module). execute() runs
+# on every recompute, and most recomputes come from feed/stepover/safe-height
+# edits that never touch the mesh; PathDropCutter only reads the STLSurf, so
+# one parse can serve them all. Set FREECAD_MCP_STL_CACHE=0 to re-parse on
+# every execute() while debugging.
+_STL_CACHE_ENABLED = os.environ.get("FREECAD_MCP_STL_CACHE") != "0"
+_STL_CACHE_SIZE = 4
+_stl_cache = {}
+
+
+def _load_stl_cached(stl_file, ocl):
+    """_load_stl, reusing the previous result while the file is unchanged."""
+    if not _STL_CACHE_ENABLED:
+        return _load_stl(stl_file, ocl)
+    st = os.stat(stl_file)
+    key = (os.path.abspath(stl_file), st.st_mtime_ns, st.st_size, id(ocl))
+    loaded = _stl_cache.get(key)
+    if loaded is None:
+        loaded = _load_stl(stl_file, ocl)
+        if len(_stl_cache) >= _STL_CACHE_SIZE:
+            del _stl_cache[next(iter(_stl_cache))]  # oldest first
+        _stl_cache[key] = loaded
+    return loaded
+
+
 def _build_zigzag_scan(ocl, x_min, x_max, y_min, y_max, stepover):
     """Build an ocl.Path of alternating-direction scan lines (zigzag).
 
     Returns (ocl_path, n_lines).
     """
     scan_path = ocl.Path()
-    n_lines = 0
-    y = y_min
-    forward = True
-
-    while y <= y_max + 1e-9:
-        if forward:
+    # Line i sits at y_min + i*stepover, computed directly: repeatedly adding
+    # stepover accumulates rounding error over long Y ranges and could drop
+    # (or add) the last line at y_max.
+    n_lines = int(math.floor((y_max - y_min + 1e-9) / stepover)) + 1
+
+    for i in range(n_lines):
+        y = y_min + i * stepover
+        if i % 2 == 0:
             scan_path.append(ocl.Line(
                 ocl.Point(x_min, y, 0.0),
                 ocl.Point(x_max, y, 0.0),
@@ -136,9 +165,6 @@ def _build_zigzag_scan(ocl, x_min, x_max, y_min, y_max, stepover):
                 ocl.Point(x_max, y, 0.0),
                 ocl.Point(x_min, y, 0.0),
             ))
-        y += stepover
-        forward = not forward
-        n_lines += 1
 
     return scan_path, n_lines
 
@@ -156,7 +182,11 @@ def _cl_points_to_commands(pts, safe_z, cut_feed, plunge_feed):
     cut_feed_mms    = mm_min_to_mm_s(cut_feed)
     plunge_feed_mms = mm_min_to_mm_s(plunge_feed)
 
-    cmds = [Path.Command("G0", {"Z": safe_z})]
+    # Dense scans produce hundreds of thousands of points: bind the
+    # constructor and append once rather than per point.
+    Command = Path.Command
+    cmds = [Command("G0", {"Z": safe_z})]
+    append = cmds.append
     current_y = None
 
     for pt in pts:
@@ -164,28 +194,28 @@ def _cl_points_to_commands(pts, safe_z, cut_feed, plunge_feed):
 
         if current_y is None or abs(y - current_y) > 1e-6:
             # New scan line: retract → rapid position → plunge
-            cmds.append(Path.Command("G0", {"Z": safe_z}))
-            cmds.append(Path.Command("G0", {"X": x, "Y": y}))
-            cmds.append(Path.Command("G1", {"Z": z, "F": plunge_feed_mms}))
+            append(Command("G0", {"Z": safe_z}))
+            append(Command("G0", {"X": x, "Y": y}))
+            append(Command("G1", {"Z": z, "F": plunge_feed_mms}))
             current_y = y
         else:
-            cmds.append(Path.Command("G1", {"X": x, "Y": y, "Z": z, "F": cut_feed_mms}))
+            append(Command("G1", {"X": x, "Y": y, "Z": z, "F": cut_feed_mms}))
 
-    cmds.append(Path.Command("G0", {"Z": safe_z}))
+    append(Command("G0", {"Z": safe_z}))
     return cmds
 
 
 def _estimate_cycle_time(pts, cut_feed, plunge_feed, safe_z, n_lines):
     """Rough cycle time estimate in minutes."""
     cut_dist = 0.0
-    prev = None
+    # Carry the previous point as plain floats: each pt.x/.y/.z is a call
+    # into the OCL binding, so read every point exactly once.
+    px = py = pz = None
     for pt in pts:
-        if prev is not None and abs(pt.y - prev.y) < 1e-6:
-            dx = pt.x - prev.x
-            dy = pt.y - prev.y
-            dz = pt.z - prev.z
-            cut_dist += math.sqrt(dx * dx + dy * dy + dz * dz)
-        prev = pt
+        x, y, z = pt.x, pt.y, pt.z
+        if py is not None and abs(y - py) < 1e-6:
+            cut_dist += math.hypot(x - px, y - py, z - pz)
+        px, py, pz = x, y, z
 
     cut_min = cut_dist / cut_feed if cut_feed > 0 else 0.0
     # Rough retract overhead: each scan line retracts safe_z at ~3000 mm/min
@@ -309,9 +339,9 @@ class OCLSurfaceProxy:
             raise ValueError(f"StepOver must be > 0 (got {stepover})")
         if stepover >= tool_dia:
             # Unlike Pocket/Adaptive's StepOver (a percentage of tool
-            # diameter), this StepOver is an absolute mm value — the scan
-            # loop advances by it directly (_build_zigzag_scan: y +=
-            # stepover). At or above the tool diameter, consecutive scan
+            # diameter), this StepOver is an absolute mm value — scan
+            # lines are spaced by it directly (_build_zigzag_scan: y_min +
+            # i*stepover). At or above the tool diameter, consecutive scan
             # lines don't overlap, leaving uncut ridges — the same
             # silent-wrong-geometry failure as Pocket/Adaptive's percentage
             # check, just expressed in absolute mm here.
@@ -326,7 +356,7 @@ class OCLSurfaceProxy:
         t0 = time.time()
 
         # 1. Load STL
-        stl_surf, x_min, x_max, y_min, y_max = _load_stl(stl_file, ocl)
+        stl_surf, x_min, x_max, y_min, y_max = _load_stl_cached(stl_file, ocl)
         FreeCAD.Console.PrintMessage(
             f"[OCLSurface] STL loaded in {time.time()-t0:.2f}s  "
             f"X[{x_min:.3f},{x_max:.3f}] Y[{y_min:.3f},{y_max:.3f}]\n"
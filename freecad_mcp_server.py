@@ -929,11 +929,13 @@ async def main():
                         "enum": [
                             # Lifecycle
                             "create_sketch", "close_sketch", "verify_sketch",
+                            "begin_batch", "end_batch",
                             # Geometry
                             "add_line", "add_circle", "add_rectangle", "add_arc",
                             "add_polygon", "add_slot", "add_fillet",
+                            "add_geometry_batch", "add_rectangles",
                             # Constraints
-                            "add_constraint", "delete_constraint", "list_constraints",
+                            "add_constraint", "add_constraints", "delete_constraint", "list_constraints",
                             # External geometry
                             "add_external_geometry"
                         ]
@@ -963,6 +965,25 @@ async def main():
                     "sides": {"type": "integer", "description": "Number of polygon sides", "default": 6},
                     # Slot parameters
                     "length": {"type": "number", "description": "Slot total length", "default": 20},
+                    # Batch geometry
+                    "primitives": {
+                        "type": "array",
+                        "description": "add_geometry_batch: list of primitives added with one solve and one recompute. "
+                                       "Each item has 'type' (line, circle, arc, rectangle) plus that operation's parameters "
+                                       "(x1/y1/x2/y2; x/y/radius; center_x/center_y/radius/start_angle/end_angle; x/y/width/height/constrain).",
+                        "items": {"type": "object"},
+                    },
+                    "lines": {
+                        "type": "array",
+                        "description": "add_geometry_batch: compact bulk lines as [x1, y1, x2, y2] rows, added after 'primitives'.",
+                        "items": {"type": "array", "items": {"type": "number"}, "minItems": 4, "maxItems": 4},
+                    },
+                    "rectangles": {
+                        "type": "array",
+                        "description": "add_rectangles: rectangles as [x, y, width, height] rows, added with one solve and one recompute "
+                                       "('constrain' applies to all of them).",
+                        "items": {"type": "array", "items": {"type": "number"}, "minItems": 4, "maxItems": 4},
+                    },
                     # Constraint parameters
                     "constraint_type": {
                         "type": "string",
@@ -984,6 +1005,13 @@ async def main():
                     "expression": {"type": "string", "description": "Bind this dimensional constraint to a FreeCAD expression instead of a literal value, e.g. 'Dimensions.PanelLength / -2'. Dimensional constraint types only (Distance, DistanceX, DistanceY, Radius, Diameter, Angle). Exactly one of value/expression should be given for those types."},
                     "sym_geo": {"type": "integer", "description": "Symmetry axis geo_id (Symmetric constraint)", "default": -2},
                     "sym_pos": {"type": "integer", "description": "Symmetry axis point index", "default": 0},
+                    "constraints": {
+                        "type": "array",
+                        "description": "add_constraints: list of constraints added with one solve and one recompute. "
+                                       "Each item takes the add_constraint keys (constraint_type, geo_id1, pos_id1, "
+                                       "geo_id2, pos_id2, value, expression, sym_geo, sym_pos).",
+                        "items": {"type": "object"},
+                    },
                     # Delete constraint
                     "index": {"type": "integer", "description": "Constraint index for delete_constraint"},
                     # Fillet parameters
@@ -1033,6 +1061,7 @@ async def main():
                     "x": {"type": "number", "description": "X position", "default": 0},
                     "y": {"type": "number", "description": "Y position", "default": 0},
                     "z": {"type": "number", "description": "Z position", "default": 0},
+                    "defer_recompute": {"type": "boolean", "description": "Primitives and move/rotate/copy/array: skip the document recompute afterwards. Use when running many of these in a row, then run view_control(operation='recompute') once at the end", "default": False},
                     # Boolean operation parameters
                     "objects": {"type": "array", "items": {"type": "string"}, "description": "Object names for boolean ops"},
                     "base": {"type": "string", "description": "Base object for cut operation"},
@@ -1081,7 +1110,7 @@ async def main():
                             # Selection operations
                             "select_object", "clear_selection", "get_selection",
                             # Object visibility
-                            "hide_object", "show_object", "delete_object",
+                            "hide_object", "show_object", "set_objects_visibility", "delete_object",
                             # History operations
                             "undo", "redo",
                             # Recompute (document, or a single object with object_name)
@@ -1101,6 +1130,8 @@ async def main():
                     # Screenshot parameters
                     "width": {"type": "integer", "description": "Screenshot width", "default": 800},
                     "height": {"type": "integer", "description": "Screenshot height", "default": 600},
+                    "format": {"type": "string", "description": "screenshot: image encoding; jpeg is several times smaller than png (cheaper for LLM clients)", "enum": ["png", "jpeg"], "default": "png"},
+                    "nocache": {"type": "boolean", "description": "screenshot: render even if the scene, camera and size match the last capture (needed after colour/display-only changes)", "default": False},
                     # View parameters
                     "view_type": {"type": "string", "description": "View orientation",
                                  "enum": ["top", "front", "left", "right", "isometric", "axonometric"],
@@ -1110,6 +1141,8 @@ async def main():
                     "filename": {"type": "string", "description": "File path to save"},
                     # Object parameters
                     "object_name": {"type": "string", "description": "Object name for operations (recompute: omit to recompute the whole document instead of one object)"},
+                    "object_names": {"type": "array", "items": {"type": "string"}, "description": "set_objects_visibility: objects to hide or show in one call"},
+                    "visible": {"type": "boolean", "description": "set_objects_visibility: true to show, false to hide", "default": False},
                     "force": {"type": "boolean", "description": "recompute: touch() the object first so it recomputes even if not already marked dirty (default true, only meaningful with object_name)", "default": True},
                     # Workbench parameters
                     "workbench_name": {"type": "string", "description": "Workbench name to activate"},
@@ -1297,7 +1330,8 @@ async def main():
                     "alias": {"type": "string", "description": "Cell alias name"},
                     "start_cell": {"type": "string", "description": "Range start cell"},
                     "end_cell": {"type": "string", "description": "Range end cell"},
-                    "values": {"type": "array", "description": "Array of values for range"}
+                    "values": {"type": "array", "description": "Array of values for range"},
+                    "defer_recompute": {"type": "boolean", "description": "Write operations: skip the document recompute afterwards. Use for a run of cell writes, then run view_control(operation='recompute') once at the end", "default": False}
                 },
                 "required": ["operation"]
             },
@@ -2503,17 +2537,19 @@ async def main():
             import tempfile, base64 as _b64
             tmp_path = None
             try:
-                with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as f:
+                jpeg = str((arguments or {}).get("format", "png")).lower() in ("jpeg", "jpg")
+                with tempfile.NamedTemporaryFile(suffix=".jpg" if jpeg else ".png", delete=False) as f:
                     tmp_path = f.name
                 proc = subprocess.run(
-                    ["screencapture", "-x", tmp_path],
+                    ["screencapture", "-x", *(["-t", "jpg"] if jpeg else []), tmp_path],
                     timeout=10, capture_output=True,
                 )
                 if proc.returncode == 0 and os.path.getsize(tmp_path) > 0:
                     with open(tmp_path, "rb") as f:
                         image_data = _b64.b64encode(f.read()).decode("utf-8")
                     return [types.ImageContent(
-                        type="image", data=image_data, mimeType="image/png"
+                        type="image", data=image_data,
+                        mimeType="image/jpeg" if jpeg else "image/png",
                     )]
                 err = proc.stderr.decode(errors="replace")[:200]
                 return [types.TextContent(type="text", text=json.dumps({
@@ -599,7 +599,10 @@ def make_sketch(name="Sketch", has_wires=True, has_faces=False,
 
 
 def make_spreadsheet(name="Spreadsheet"):
-    """Mock Spreadsheet::Sheet with set/get/setAlias/getAlias/clear methods."""
+    """Mock Spreadsheet::Sheet with set/get/setAlias/getAlias/clear methods.
+
+    getUsedCells() lists the addresses currently holding a value.
+    """
     obj = MagicMock()
     obj.Name = name
     obj.Label = name
@@ -629,6 +632,7 @@ def make_spreadsheet(name="Spreadsheet"):
     obj.setAlias = MagicMock(side_effect=_set_alias)
     obj.getAlias = MagicMock(side_effect=_get_alias)
     obj.clear = MagicMock(side_effect=_clear)
+    obj.getUsedCells = MagicMock(side_effect=lambda: list(cells_data))
     obj._cells_data = cells_data
     obj._aliases = aliases
 
@@ -654,6 +658,10 @@ def make_body(name="Body", tip=None, group=None):
     obj.Tip = tip
     obj.Group = list(group) if group else []
     obj.Shape = _make_shape()
+    # Real Body members carry a getParentGeoFeatureGroup() back-pointer
+    # to their Body, which find_body_for_object reads instead of scanning.
+    for member in obj.Group:
+        member.getParentGeoFeatureGroup = MagicMock(return_value=obj)
 
     # Mock App::Origin with the 6 standard OriginFeatures every real
     # PartDesign::Body has (confirmed live) -- needed by any operation
@@ -42,6 +42,16 @@ def base_handler_class():
     return BaseHandler
 
 
+@pytest.fixture
+def open_docs(base_handler):
+    """Documents FreeCAD.listDocuments() reports as open; deferred
+    recomputes of any other document are dropped."""
+    docs = {}
+    with patch.object(sys.modules["handlers.base"].FreeCAD, "listDocuments",
+                      create=True, side_effect=lambda: docs):
+        yield docs
+
+
 # ---------------------------------------------------------------------------
 # Constructor and properties
 # ---------------------------------------------------------------------------
@@ -366,6 +376,96 @@ class TestRecompute:
         mock_freecad.ActiveDocument = None
         base_handler.recompute()  # should not raise
 
+    def test_deferred_recompute_coalesced_into_one_flush(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        for _ in range(5):
+            base_handler.recompute(doc, defer=True)
+        doc.recompute.assert_not_called()
+
+        assert base_handler.flush_recomputes() == 1
+        doc.recompute.assert_called_once()
+        assert base_handler.flush_recomputes() == 0
+
+    def test_plain_recompute_settles_pending_deferral(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.recompute(doc, defer=True)
+        base_handler.recompute(doc)
+        assert base_handler.flush_recomputes() == 0
+        doc.recompute.assert_called_once()
+
+    def test_settle_runs_pending_deferral_once(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.recompute(doc, defer=True)
+        base_handler.settle(doc)
+        base_handler.settle(doc)
+        doc.recompute.assert_called_once()
+        assert base_handler.flush_recomputes() == 0
+
+    def test_settle_without_pending_deferral_is_noop(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.settle(doc)
+        doc.recompute.assert_not_called()
+
+    def test_get_object_leaves_deferral_pending(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.recompute(doc, defer=True)
+        base_handler.get_object("Box", doc)
+        base_handler.resolve_object("Box", doc)
+        doc.recompute.assert_not_called()
+        assert base_handler.flush_recomputes() == 1
+
+    def test_resolve_object_settles_on_request(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.recompute(doc, defer=True)
+        base_handler.resolve_object("Box", doc, settle=True)
+        doc.recompute.assert_called_once()
+        assert base_handler.flush_recomputes() == 0
+
+    def test_recompute_or_defer_returns_note_only_when_deferring(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        doc = open_docs["Doc"] = MagicMock()
+        assert base_handler.recompute_or_defer(doc, {}) == ''
+        doc.recompute.assert_called_once()
+        assert "recompute deferred" in base_handler.recompute_or_defer(
+            doc, {'defer_recompute': True})
+        doc.recompute.assert_called_once()
+        assert base_handler.flush_recomputes() == 1
+
+
+    def test_flush_skips_and_releases_closed_documents(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        closed = MagicMock()
+        base_handler.recompute(closed, defer=True)
+        assert base_handler.flush_recomputes() == 0
+        closed.recompute.assert_not_called()
+
+        # A later deferral drops documents closed since theirs
+        doc = open_docs["Doc"] = MagicMock()
+        base_handler.recompute(closed, defer=True)
+        base_handler.recompute(doc, defer=True)
+        assert closed not in base_handler._pending_recompute
+        assert base_handler.flush_recomputes() == 1
+
+    def test_flush_logs_and_does_not_count_failures(self, base_handler, open_docs):
+        base_handler._pending_recompute.clear()
+        bad = open_docs["Bad"] = MagicMock(Name="Bad")
+        bad.recompute.side_effect = RuntimeError("solver blew up")
+        good = open_docs["Good"] = MagicMock()
+        base_handler.recompute(bad, defer=True)
+        base_handler.recompute(good, defer=True)
+
+        fc = sys.modules["handlers.base"].FreeCAD
+        with patch.object(fc, "Console", create=True) as console:
+            assert base_handler.flush_recomputes() == 1
+        warning = console.PrintWarning.call_args.args[0]
+        assert "Bad" in warning and "solver blew up" in warning
+
 
 # ---------------------------------------------------------------------------
 # save_before_risky_op
@@ -525,6 +625,25 @@ class TestFindBody:
         body = MagicMock()
         body.TypeId = "PartDesign::Body"
         body.Group = [obj]
+        obj.getParentGeoFeatureGroup.return_value = body
+        doc = MagicMock()
+        assert base_handler.find_body_for_object(obj, doc) is body
+        # Answered from the back-pointer -- the document is never scanned
+        assert not doc.mock_calls
+
+    def test_find_body_for_object_parent_not_a_body(self, base_handler, mock_freecad):
+        obj = MagicMock()
+        part = MagicMock()
+        part.TypeId = "App::Part"
+        obj.getParentGeoFeatureGroup.return_value = part
+        assert base_handler.find_body_for_object(obj, MagicMock()) is None
+
+    def test_find_body_for_object_scan_fallback(self, base_handler, mock_freecad):
+        """Objects without the back-pointer fall back to scanning Bodies."""
+        obj = MagicMock(spec=[])
+        body = MagicMock()
+        body.TypeId = "PartDesign::Body"
+        body.Group = [obj]
         other_body = MagicMock()
         other_body.TypeId = "PartDesign::Body"
         other_body.Group = []
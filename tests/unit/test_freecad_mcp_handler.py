@@ -622,7 +622,7 @@ class TestDispatchViewControl:
         """
         gui_ops = ["screenshot", "set_view", "fit_all", "zoom_in", "zoom_out",
                    "select_object", "clear_selection", "get_selection",
-                   "hide_object", "show_object", "delete_object",
+                   "hide_object", "show_object", "set_objects_visibility", "delete_object",
                    "undo", "redo", "activate_workbench", "open_document"]
         safe_ops = ["create_document", "save_document", "list_objects"]
 
@@ -1281,9 +1281,11 @@ class TestDispatchSketch:
         """All sketch operations should route through _call_on_gui_thread_async."""
         sketch_ops = [
             "create_sketch", "close_sketch", "verify_sketch",
+            "begin_batch", "end_batch",
             "add_line", "add_circle", "add_rectangle", "add_arc",
-            "add_polygon", "add_slot", "add_fillet",
-            "add_constraint", "delete_constraint", "list_constraints",
+            "add_polygon", "add_slot", "add_fillet", "add_geometry_batch",
+            "add_rectangles",
+            "add_constraint", "add_constraints", "delete_constraint", "list_constraints",
             "add_external_geometry",
         ]
         for op in sketch_ops:
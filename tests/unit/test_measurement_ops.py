@@ -201,6 +201,16 @@ class TestGetVolume(unittest.TestCase):
         result = self.handler.get_volume({'object_name': 'Cube'})
         assert_success_contains(self, result, "1000", "mm")
 
+    def test_settles_deferred_recompute_before_reading(self):
+        obj = make_part_object("Cube", volume=1000.0)
+        doc = make_mock_doc([obj])
+        mock_FreeCAD.ActiveDocument = doc
+        self.handler._pending_recompute.add(doc)
+        self.addCleanup(self.handler._pending_recompute.discard, doc)
+        self.handler.get_volume({'object_name': 'Cube'})
+        doc.recompute.assert_called_once()
+        self.assertNotIn(doc, self.handler._pending_recompute)
+
 
 class TestCountElements(unittest.TestCase):
     def setUp(self):
@@ -163,3 +163,104 @@ class TestLoadStlRejectsNonBinary:
 
         with pytest.raises(ValueError):
             ocl_surface_op._load_stl(path, _fake_ocl())
+
+
+class TestLoadStlCached:
+    """Recomputes that don't touch the mesh reuse the parsed STLSurf."""
+
+    _TRI = [(0, 0, 0, 10, 0, 0, 0, 10, 0)]
+
+    def setup_method(self):
+        ocl_surface_op._stl_cache.clear()
+
+    def teardown_method(self):
+        ocl_surface_op._stl_cache.clear()
+
+    def test_unchanged_file_parsed_once(self, tmp_path):
+        path = str(tmp_path / "mesh.stl")
+        _write_binary_stl(path, self._TRI)
+        ocl = _fake_ocl()
+
+        first = ocl_surface_op._load_stl_cached(path, ocl)
+        second = ocl_surface_op._load_stl_cached(path, ocl)
+
+        assert first is second
+        assert ocl.STLSurf.call_count == 1
+
+    def test_rewritten_file_parsed_again(self, tmp_path):
+        path = str(tmp_path / "mesh.stl")
+        _write_binary_stl(path, self._TRI)
+        ocl = _fake_ocl()
+        ocl_surface_op._load_stl_cached(path, ocl)
+
+        _write_binary_stl(path, self._TRI * 2)  # size changes
+        _, _, x_max, _, _ = ocl_surface_op._load_stl_cached(path, ocl)
+
+        assert ocl.STLSurf.call_count == 2
+        assert x_max == 10
+
+    def test_disabled_cache_always_parses(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(ocl_surface_op, "_STL_CACHE_ENABLED", False)
+        path = str(tmp_path / "mesh.stl")
+        _write_binary_stl(path, self._TRI)
+        ocl = _fake_ocl()
+
+        ocl_surface_op._load_stl_cached(path, ocl)
+        ocl_surface_op._load_stl_cached(path, ocl)
+
+        assert ocl.STLSurf.call_count == 2
+        assert ocl_surface_op._stl_cache == {}
+
+
+class TestClPointsToCommands:
+    def test_scan_line_transitions_and_cuts(self, monkeypatch):
+        made = []
+        monkeypatch.setattr(ocl_surface_op.Path, "Command",
+                            lambda name, params: made.append((name, params)) or (name, params))
+        pts = [MagicMock(x=0.0, y=0.0, z=-1.0), MagicMock(x=1.0, y=0.0, z=-2.0),
+               MagicMock(x=1.0, y=0.75, z=-3.0)]
+
+        cmds = ocl_surface_op._cl_points_to_commands(pts, safe_z=5.0, cut_feed=600.0,
+                                                     plunge_feed=120.0)
+
+        assert cmds == made
+        assert cmds == [
+            ("G0", {"Z": 5.0}),
+            ("G0", {"Z": 5.0}), ("G0", {"X": 0.0, "Y": 0.0}), ("G1", {"Z": -1.0, "F": 2.0}),
+            ("G1", {"X": 1.0, "Y": 0.0, "Z": -2.0, "F": 10.0}),
+            ("G0", {"Z": 5.0}), ("G0", {"X": 1.0, "Y": 0.75}), ("G1", {"Z": -3.0, "F": 2.0}),
+            ("G0", {"Z": 5.0}),
+        ]
+
+
+class TestEstimateCycleTime:
+    def test_sums_cuts_within_scan_lines_only(self):
+        pts = [MagicMock(x=0.0, y=0.0, z=0.0), MagicMock(x=3.0, y=0.0, z=4.0),   # 5 mm cut
+               MagicMock(x=3.0, y=1.0, z=0.0),                                   # line change
+               MagicMock(x=9.0, y=1.0, z=-8.0)]                                  # 10 mm cut
+        minutes = ocl_surface_op._estimate_cycle_time(pts, cut_feed=300.0, plunge_feed=100.0,
+                                                      safe_z=5.0, n_lines=2)
+        assert minutes == pytest.approx(15.0 / 300.0 + 2 * 10.0 / 3000.0)
+
+
+class TestBuildZigzagScan:
+    def _ocl(self):
+        ocl = MagicMock()
+        ocl.Point.side_effect = lambda x, y, z: (x, y, z)
+        ocl.Line.side_effect = lambda a, b: (a, b)
+        return ocl
+
+    def test_lines_alternate_and_include_y_max(self):
+        ocl = self._ocl()
+        path, n_lines = ocl_surface_op._build_zigzag_scan(ocl, 0.0, 5.0, 0.0, 1.0, 0.1)
+        lines = [c.args[0] for c in path.append.call_args_list]
+
+        assert n_lines == 11 == len(lines)
+        assert lines[0] == ((0.0, 0.0, 0.0), (5.0, 0.0, 0.0))
+        assert lines[1][0][0] == 5.0  # second line runs back
+        assert [a[1] for a, _ in lines] == [i * 0.1 for i in range(11)]
+
+    def test_no_drift_over_long_range(self):
+        ocl = self._ocl()
+        _, n_lines = ocl_surface_op._build_zigzag_scan(ocl, 0.0, 1.0, 0.0, 1000.0, 0.01)
+        assert n_lines == 100001
@@ -294,6 +294,7 @@ class TestVerifySketchOpenWireDiagnosis:
         sketch.GeometryCount = 2
         sketch.ConstraintCount = 3
         sketch.solve = MagicMock(return_value=0)
+        sketch.DoF = 0
 
         # Open wire
         wire = MagicMock()
@@ -347,6 +348,7 @@ class TestVerifySketchOpenWireDiagnosis:
         sketch.GeometryCount = 2
         sketch.ConstraintCount = 0
         sketch.solve = MagicMock(return_value=0)
+        sketch.DoF = 0
         sketch.Shape = None  # falsy -> the "no valid shape" branch
         sketch.getConstruction = MagicMock(return_value=False)
         sketch.getOpenVertices = MagicMock(return_value=[])
@@ -35,7 +35,7 @@ from tests.unit._freecad_mocks import (
     _Placement,
 )
 
-from handlers.partdesign_ops import PartDesignOpsHandler
+from handlers.partdesign_ops import PartDesignOpsHandler, _face_names
 
 
 def _make_next_addobject_invalid(doc, type_id):
@@ -322,6 +322,27 @@ class TestChamferEdges(unittest.TestCase):
         kwargs = self.handler.selector.request_selection.call_args.kwargs
         self.assertEqual(kwargs.get("tool_name"), "chamfer_edges")
         self.assertEqual(kwargs.get("distance"), 1.5)
+        self.assertEqual(kwargs.get("document"), doc.Name)
+        self.assertEqual(kwargs.get("target"), "B")
+
+    def test_continue_selection_uses_pinned_document(self):
+        box = make_box_object("B")
+        doc = make_mock_doc([box])
+        body = make_body("Body", group=[box])
+        mock_FreeCAD.listDocuments.return_value = {"Pinned": doc}
+        mock_FreeCAD.ActiveDocument = make_mock_doc([])
+        self.handler.selector.complete_selection.return_value = {
+            "selection_data": {"elements": [3]},
+            "context": {"document": "Pinned", "target": "B"},
+        }
+
+        result = self.handler.chamfer_edges({
+            'object_name': 'B', 'distance': 1.0,
+            '_continue_selection': True, '_operation_id': 'op',
+        })
+
+        body.newObject.assert_called_once_with("PartDesign::Chamfer", "Chamfer")
+        assert_success_contains(self, result, "1 selected edges")
 
     def test_auto_select_all(self):
         box = make_box_object("B")
@@ -693,6 +714,25 @@ class TestPolarPattern(unittest.TestCase):
         self.assertEqual(doc.copyObject.call_count, 5)  # 6 - 1
         assert_success_contains(self, result, "6 instances", "Z", "360")
 
+    def test_copies_rotated_by_accumulated_step(self):
+        """The per-step rotation is composed incrementally, so copy i must
+        still land at step*i around the axis, on top of the feature's own
+        rotation and at its original base."""
+        feat = make_part_object("F")
+        feat.Placement = _Placement(_Vec(5, 0, 0))
+        doc = make_mock_doc([feat])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.polar_pattern({
+            'feature_name': 'F', 'axis': 'z', 'angle': 360, 'count': 4,
+        })
+
+        copies = [o for o in doc.Objects if o is not feat]
+        self.assertEqual([c.Placement.Rotation.angle for c in copies],
+                         [90, 180, 270])
+        for c in copies:
+            self.assertEqual(c.Placement.Base, _Vec(5, 0, 0))
+
     def test_count_zero_rejected(self):
         """count<1 must be rejected before the `angle / count` division —
         count=0 would otherwise raise ZeroDivisionError (swallowed as a
@@ -1438,6 +1478,14 @@ class TestShellSolid(unittest.TestCase):
         kwargs = self.handler.selector.request_selection.call_args.kwargs
         self.assertEqual(kwargs.get("tool_name"), "shell_solid")
         self.assertEqual(kwargs.get("selection_type"), "faces")
+        self.assertEqual(kwargs.get("document"), doc.Name)
+        self.assertEqual(kwargs.get("target"), "B")
+
+    def test_missing_object_errors_before_requesting_selection(self):
+        mock_FreeCAD.ActiveDocument = make_mock_doc([])
+        result = self.handler.shell_solid({'object_name': 'Ghost'})
+        assert_error_contains(self, result, "not found")
+        self.handler.selector.request_selection.assert_not_called()
 
     def test_continue_selection_creates_thickness_with_faces(self):
         box = make_box_object("B")
@@ -1470,6 +1518,23 @@ class TestShellSolid(unittest.TestCase):
         self.assertEqual(shell.Faces, (box, ("Face5",)))
         assert_success_contains(self, result, "2mm", "1 face")
 
+    def test_continue_selection_drops_out_of_range_faces(self):
+        box = make_box_object("B")
+        doc = make_mock_doc([box])
+        mock_FreeCAD.ActiveDocument = doc
+        self.handler.selector.complete_selection.return_value = {
+            "selection_data": {"elements": [0, 1, 6, 7]},
+        }
+
+        self.handler.shell_solid({
+            'object_name': 'B', 'thickness': 2,
+            '_continue_selection': True,
+            '_operation_id': 'op_test_001',
+        })
+
+        shell = doc.Objects[-1]
+        self.assertEqual(shell.Faces, (box, ("Face1", "Face6")))
+
     def test_auto_shell_closed_uses_offset_and_cut_not_thickness_source(self):
         """auto_shell_closed=True previously created a Part::Thickness and
         set .Source on it - Part::Thickness has no Source property at all
@@ -1495,6 +1560,15 @@ class TestShellSolid(unittest.TestCase):
         assert_success_contains(self, result, "2mm", "no opening")
 
 
+class TestFaceNames(unittest.TestCase):
+    def test_table_and_fallback_names(self):
+        self.assertEqual(_face_names([1, 5, 1024, 1025, 5000]),
+                         ("Face1", "Face5", "Face1024", "Face1025", "Face5000"))
+
+    def test_table_entries_are_shared(self):
+        self.assertIs(_face_names([7])[0], _face_names([7])[0])
+
+
 class TestAddThickness(unittest.TestCase):
     def setUp(self):
         reset_mocks()
@@ -1526,6 +1600,30 @@ class TestDraftFaces(unittest.TestCase):
         kwargs = self.handler.selector.request_selection.call_args.kwargs
         self.assertEqual(kwargs.get("tool_name"), "draft_faces")
         self.assertEqual(kwargs.get("angle"), 5)
+        # Resolved target is pinned for the completion call
+        self.assertEqual(kwargs.get("document"), doc.Name)
+        self.assertEqual(kwargs.get("target"), "B")
+
+    def test_continue_selection_uses_pinned_document(self):
+        """Completion resolves the object recorded at request time, even if
+        another document has become active in between."""
+        box = make_box_object("B")
+        doc = make_mock_doc([box])
+        body = make_body("Body", group=[box])
+        mock_FreeCAD.listDocuments.return_value = {"Pinned": doc}
+        mock_FreeCAD.ActiveDocument = make_mock_doc([])
+        self.handler.selector.complete_selection.return_value = {
+            "selection_data": {"elements": [2]},
+            "context": {"document": "Pinned", "target": "B"},
+        }
+
+        result = self.handler.draft_faces({
+            'object_name': 'B', 'angle': 5,
+            '_continue_selection': True, '_operation_id': 'op',
+        })
+
+        body.newObject.assert_called_once_with("PartDesign::Draft", "Draft")
+        assert_success_contains(self, result, "1 selected faces")
 
     def test_object_without_faces_errors(self):
         obj = make_part_object("X")
@@ -434,6 +434,39 @@ class TestPrimitivesNoDocument(unittest.TestCase):
         mock_FreeCAD.newDocument.assert_not_called()
 
 
+class TestDeferRecompute(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(PrimitivesHandler)
+        self.handler._pending_recompute.clear()
+
+    def tearDown(self):
+        self.handler._pending_recompute.clear()
+
+    def test_recomputes_by_default(self):
+        doc = make_mock_doc()
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.create_box({'length': 10, 'width': 10, 'height': 10})
+
+        doc.recompute.assert_called_once()
+        self.assertNotIn("deferred", result)
+
+    def test_deferred_primitives_share_one_recompute(self):
+        doc = make_mock_doc()
+        mock_FreeCAD.ActiveDocument = doc
+        mock_FreeCAD.listDocuments.return_value = {'Doc': doc}
+
+        self.handler.create_box({'defer_recompute': True})
+        self.handler.create_cylinder({'defer_recompute': True})
+        result = self.handler.create_wedge({'defer_recompute': True})
+
+        doc.recompute.assert_not_called()
+        assert_success_contains(self, result, "recompute deferred")
+        self.assertEqual(self.handler.flush_recomputes(), 1)
+        doc.recompute.assert_called_once()
+
+
 class TestUnknownArgKeys(unittest.TestCase):
     """Misspelled/unknown keys must be rejected immediately, not silently defaulted."""
 
@@ -15,9 +15,10 @@ Verify_sketch is exercised in test_open_wire_diagnosis.py — not
 duplicated here.
 """
 
+import json
 import math
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, call
 
 from tests.unit._freecad_mocks import (
     mock_FreeCAD,
@@ -32,32 +33,36 @@ from tests.unit._freecad_mocks import (
     assert_success_contains,
 )
 
-from handlers.sketch_ops import SketchOpsHandler
+from handlers.sketch_ops import SketchOpsHandler, _polygon_unit_vertices
 
 
 def _make_real_sketch_mock(name="Sketch"):
     """Sketch that survives addGeometry and addConstraint calls.
 
     addGeometry returns sequential geo ids; addConstraint returns
-    sequential constraint indices. The handler-side recompute() does
-    nothing on the doc mock, but ConstraintCount and GeometryCount
-    track real call counts so close_sketch can report them.
+    sequential constraint indices. Like the real Sketcher API, passing a
+    list adds every item and returns a tuple of the new indices. The
+    handler-side recompute() does nothing on the doc mock, but
+    ConstraintCount and GeometryCount track real item counts so
+    close_sketch can report them.
     """
     s = make_sketch(name)
     geo_counter = [0]
     con_counter = [0]
 
-    def add_geom(_):
-        idx = geo_counter[0]
-        geo_counter[0] += 1
-        s.GeometryCount = geo_counter[0]
+    def _add(counter, attr, item):
+        if isinstance(item, (list, tuple)):
+            return tuple(_add(counter, attr, i) for i in item)
+        idx = counter[0]
+        counter[0] += 1
+        setattr(s, attr, counter[0])
         return idx
 
-    def add_constraint(_):
-        idx = con_counter[0]
-        con_counter[0] += 1
-        s.ConstraintCount = con_counter[0]
-        return idx
+    def add_geom(item):
+        return _add(geo_counter, 'GeometryCount', item)
+
+    def add_constraint(item):
+        return _add(con_counter, 'ConstraintCount', item)
 
     s.addGeometry = MagicMock(side_effect=add_geom)
     s.addConstraint = MagicMock(side_effect=add_constraint)
@@ -189,8 +194,9 @@ class TestAddCircle(unittest.TestCase):
 
         assert_success_contains(self, result, "S", "center (5,10)",
                                 "radius 3", "geo_id=0")
-        # 3 constraint calls: DistanceX, DistanceY, Radius
-        self.assertEqual(s.addConstraint.call_count, 3)
+        # DistanceX, DistanceY, Radius in a single batch
+        s.addConstraint.assert_called_once()
+        self.assertEqual(s.ConstraintCount, 3)
 
 
 class TestAddRectangle(unittest.TestCase):
@@ -211,10 +217,12 @@ class TestAddRectangle(unittest.TestCase):
         })
 
         assert_success_contains(self, result, "20x15", "geo_ids=[0,1,2,3]")
-        # 4 line segments (one per side)
-        self.assertEqual(s.addGeometry.call_count, 4)
-        # 12 constraints
-        self.assertEqual(s.addConstraint.call_count, 12)
+        # 4 line segments (one per side), added in a single batch
+        self.assertEqual(s.addGeometry.call_count, 1)
+        self.assertEqual(s.GeometryCount, 4)
+        # 12 constraints, also in a single batch
+        self.assertEqual(s.addConstraint.call_count, 1)
+        self.assertEqual(s.ConstraintCount, 12)
 
     def test_unconstrained_rectangle_skips_constraints(self):
         s = _make_real_sketch_mock("S")
@@ -227,10 +235,61 @@ class TestAddRectangle(unittest.TestCase):
             'constrain': False,
         })
 
-        self.assertEqual(s.addGeometry.call_count, 4)
+        self.assertEqual(s.GeometryCount, 4)
         self.assertEqual(s.addConstraint.call_count, 0)
 
 
+class TestAddRectangles(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+
+    def test_many_rectangles_one_geometry_and_one_constraint_call(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.add_rectangles({
+            'sketch_name': 'S',
+            'rectangles': [[0, 0, 10, 5], [20, 0, 4, 4], [0, 10, 2, 8]],
+        })
+
+        assert_success_contains(self, result, "3 rectangle(s)", "36 constraints",
+                                "geo_ids=[0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11]")
+        s.addGeometry.assert_called_once()
+        s.addConstraint.assert_called_once()
+        # Second rectangle is pinned through its own bottom edge (geo_id 4)
+        self.assertIn(call('DistanceX', -1, 1, 4, 1, 20),
+                      mock_Sketcher.Constraint.call_args_list)
+        doc.recompute.assert_called_once()
+
+    def test_unconstrained_skips_constraints(self):
+        s = _make_real_sketch_mock("S")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        self.handler.add_rectangles({
+            'sketch_name': 'S', 'rectangles': [[0, 0, 1, 1]], 'constrain': False,
+        })
+
+        self.assertEqual(s.GeometryCount, 4)
+        s.addConstraint.assert_not_called()
+
+    def test_malformed_row_adds_nothing(self):
+        s = _make_real_sketch_mock("S")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        result = self.handler.add_rectangles({
+            'sketch_name': 'S', 'rectangles': [[0, 0, 1, 1], [0, 0, 1]],
+        })
+
+        self.assertIn("rectangles[1]", result)
+        s.addGeometry.assert_not_called()
+
+    def test_empty_rejected(self):
+        result = self.handler.add_rectangles({'sketch_name': 'S', 'rectangles': []})
+        self.assertIn("non-empty list", result)
+
+
 class TestAddArc(unittest.TestCase):
     def setUp(self):
         reset_mocks()
@@ -255,6 +314,197 @@ class TestAddArc(unittest.TestCase):
         self.assertAlmostEqual(ac_call.args[2], math.pi / 2, places=6)
 
 
+class TestAddGeometryBatch(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+
+    def test_mixed_primitives_one_geometry_and_one_constraint_call(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.add_geometry_batch({
+            'sketch_name': 'S',
+            'primitives': [
+                {'type': 'line', 'x1': 0, 'y1': 0, 'x2': 5, 'y2': 0},
+                {'type': 'circle', 'x': 1, 'y': 2, 'radius': 3},
+                {'type': 'arc', 'radius': 4, 'start_angle': 0, 'end_angle': 180},
+                {'type': 'rectangle', 'width': 20, 'height': 15},
+            ],
+        })
+
+        assert_success_contains(self, result, "4 primitive(s)",
+                                "geo_ids=[0, 1, 2, 3, 4, 5, 6]")
+        # line + circle + arc + 4 rectangle sides
+        s.addGeometry.assert_called_once()
+        self.assertEqual(s.GeometryCount, 7)
+        # circle (3) + rectangle (12); lines and arcs add none
+        s.addConstraint.assert_called_once()
+        self.assertEqual(s.ConstraintCount, 15)
+        # Circle constraints reference the circle's own geo_id
+        self.assertIn(call('Radius', 1, 3), mock_Sketcher.Constraint.call_args_list)
+        doc.recompute.assert_called_once()
+
+    def test_unconstrained_rectangle_skips_constraints(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.add_geometry_batch({
+            'sketch_name': 'S',
+            'primitives': [{'type': 'rectangle', 'constrain': False}],
+        })
+
+        self.assertEqual(s.GeometryCount, 4)
+        s.addConstraint.assert_not_called()
+
+    def test_unknown_type_adds_nothing(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.add_geometry_batch({
+            'sketch_name': 'S',
+            'primitives': [{'type': 'line'}, {'type': 'spline'}],
+        })
+
+        self.assertIn("index 1", result)
+        self.assertIn("'spline'", result)
+        s.addGeometry.assert_not_called()
+
+    def test_lines_rows_added_after_primitives(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.add_geometry_batch({
+            'sketch_name': 'S',
+            'primitives': [{'type': 'circle', 'radius': 2}],
+            'lines': [[0, 0, 5, 0], [5, 0, 5, 5], [5, 5, 0, 0]],
+        })
+
+        assert_success_contains(self, result, "4 primitive(s)", "geo_ids=[0, 1, 2, 3]")
+        s.addGeometry.assert_called_once()
+        end = mock_Part.LineSegment.call_args_list[-1].args[1]
+        self.assertEqual((end.x, end.y), (0, 0))
+        doc.recompute.assert_called_once()
+
+    def test_malformed_line_row_adds_nothing(self):
+        s = _make_real_sketch_mock("S")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        result = self.handler.add_geometry_batch({
+            'sketch_name': 'S', 'lines': [[0, 0, 5, 0], [1, 2, 3]],
+        })
+
+        self.assertIn("lines[1]", result)
+        s.addGeometry.assert_not_called()
+
+    def test_empty_primitives_rejected(self):
+        result = self.handler.add_geometry_batch({'sketch_name': 'S', 'primitives': []})
+        self.assertIn("non-empty list", result)
+
+
+class TestBatch(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+        SketchOpsHandler._batch_sketches.clear()
+        SketchOpsHandler._pending_recompute.clear()
+
+    def tearDown(self):
+        SketchOpsHandler._batch_sketches.clear()
+        SketchOpsHandler._pending_recompute.clear()
+
+    def test_adds_inside_batch_recompute_once_at_end(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        assert_success_contains(self, self.handler.begin_batch({'sketch_name': 'S'}),
+                                "Batch started", "S")
+        self.handler.add_line({'sketch_name': 'S'})
+        self.handler.add_circle({'sketch_name': 'S'})
+        self.handler.add_rectangle({'sketch_name': 'S'})
+        doc.recompute.assert_not_called()
+
+        result = self.handler.end_batch({'sketch_name': 'S'})
+        assert_success_contains(self, result, "Ended batch on S", "6 geometries")
+        self.assertNotIn("no batch was active", result)
+        doc.recompute.assert_called_once()
+
+        # Outside the batch each add recomputes again
+        self.handler.add_arc({'sketch_name': 'S'})
+        self.assertEqual(doc.recompute.call_count, 2)
+
+    def test_external_geometry_inside_batch_skips_recompute(self):
+        s = _make_real_sketch_mock("S")
+        s.ExternalGeometryCount = 3
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.begin_batch({'sketch_name': 'S'})
+        result = self.handler.add_external_geometry({
+            'sketch_name': 'S', 'object_name': 'Box', 'edge_name': 'Edge1',
+        })
+
+        assert_success_contains(self, result, "Box.Edge1", "-4")
+        s.addExternal.assert_called_once_with('Box', 'Edge1')
+        doc.recompute.assert_not_called()
+
+    def test_batch_only_covers_its_own_sketch(self):
+        s1 = _make_real_sketch_mock("S1")
+        s2 = _make_real_sketch_mock("S2")
+        doc = make_mock_doc([s1, s2])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.begin_batch({'sketch_name': 'S1'})
+        self.handler.add_line({'sketch_name': 'S2'})
+        doc.recompute.assert_called_once()
+
+    def test_end_without_begin_still_recomputes(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.end_batch({'sketch_name': 'S'})
+        self.assertIn("no batch was active", result)
+        doc.recompute.assert_called_once()
+
+    def test_batched_adds_are_deferred_not_dropped(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.begin_batch({'sketch_name': 'S'})
+        self.handler.add_line({'sketch_name': 'S'})
+        self.assertIn(doc, SketchOpsHandler._pending_recompute)
+
+        # An operation that settles the document pays for the adds
+        self.handler.settle(doc)
+        doc.recompute.assert_called_once()
+
+    def test_flush_recomputes_ends_batches(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+        mock_FreeCAD.listDocuments.return_value = {'Doc': doc}
+
+        self.handler.begin_batch({'sketch_name': 'S'})
+        self.handler.add_line({'sketch_name': 'S'})
+        self.assertEqual(self.handler.flush_recomputes(), 1)
+        doc.recompute.assert_called_once()
+
+        self.handler.add_circle({'sketch_name': 'S'})
+        self.assertEqual(doc.recompute.call_count, 2)
+
+    def test_missing_sketch(self):
+        mock_FreeCAD.ActiveDocument = make_mock_doc([])
+        result = self.handler.begin_batch({'sketch_name': 'Nope'})
+        self.assertIn("Sketch not found", result)
+
+
 class TestAddPolygon(unittest.TestCase):
     def setUp(self):
         reset_mocks()
@@ -278,9 +528,37 @@ class TestAddPolygon(unittest.TestCase):
             'sketch_name': 'S', 'sides': 6, 'radius': 10,
         })
 
-        assert_success_contains(self, result, "S", "6")
-        # 6 line segments for hexagon
-        self.assertEqual(s.addGeometry.call_count, 6)
+        assert_success_contains(self, result, "S", "6", "geo_ids=[0, 1, 2, 3, 4, 5]")
+        # 6 line segments for hexagon, added in one batch
+        s.addGeometry.assert_called_once()
+        self.assertEqual(s.GeometryCount, 6)
+        # 6 coincident corners + 5 equal-length, also one batch
+        s.addConstraint.assert_called_once()
+        self.assertEqual(s.ConstraintCount, 11)
+
+    def test_vertices_lie_on_circle_at_equal_steps(self):
+        s = _make_real_sketch_mock("S")
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.add_polygon({
+            'sketch_name': 'S', 'sides': 12, 'radius': 7, 'x': 3, 'y': -2,
+        })
+
+        starts = [c.args[0] for c in mock_Part.LineSegment.call_args_list]
+        self.assertEqual(len(starts), 12)
+        for i, p in enumerate(starts):
+            angle = -math.pi / 2 + 2 * math.pi * i / 12
+            self.assertAlmostEqual(p.x, 3 + 7 * math.cos(angle), places=9)
+            self.assertAlmostEqual(p.y, -2 + 7 * math.sin(angle), places=9)
+
+    def test_unit_vertices_cached_per_side_count(self):
+        hexagon = _polygon_unit_vertices(6)
+        self.assertIs(_polygon_unit_vertices(6), hexagon)
+        self.assertAlmostEqual(hexagon[0][0], 0.0, places=12)
+        self.assertAlmostEqual(hexagon[0][1], -1.0, places=12)
+        # Very large side counts are computed but not kept
+        self.assertIsNot(_polygon_unit_vertices(500), _polygon_unit_vertices(500))
 
     def test_exactly_3_sides_makes_triangle(self):
         """sides==3 is the boundary — must be accepted (the guard is `sides < 3`).
@@ -292,7 +570,7 @@ class TestAddPolygon(unittest.TestCase):
             'sketch_name': 'S', 'sides': 3, 'radius': 5,
         })
         assert_success_contains(self, result, "3")
-        self.assertEqual(s.addGeometry.call_count, 3)
+        self.assertEqual(s.GeometryCount, 3)
 
 
 class TestAddSlot(unittest.TestCase):
@@ -321,7 +599,11 @@ class TestAddSlot(unittest.TestCase):
             'sketch_name': 'S', 'length': 7, 'width': 6,
         })
         self.assertNotIn("must be greater", result)
-        self.assertTrue(s.addGeometry.called)
+        s.addGeometry.assert_called_once()
+        self.assertEqual(s.GeometryCount, 4)
+        s.addConstraint.assert_called_once()
+        self.assertEqual(s.ConstraintCount, 8)
+        self.assertIn("geo_ids=[0,1,2,3]", result)
 
 
 # ---------------------------------------------------------------------------
@@ -562,6 +844,56 @@ class TestAddConstraint(unittest.TestCase):
         assert_success_contains(self, result, "DoF=3", "FullyConstrained=False")
 
 
+class TestAddConstraints(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+
+    def test_batch_added_in_one_call_with_one_recompute(self):
+        s = _make_real_sketch_mock("S")
+        s.DoF = 0
+        doc = make_mock_doc([s])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.add_constraints({
+            'sketch_name': 'S',
+            'constraints': [
+                {'constraint_type': 'horizontal', 'geo_id1': 0},
+                {'constraint_type': 'Radius', 'geo_id1': 1, 'value': 4},
+                {'constraint_type': 'Distance', 'geo_id1': 0,
+                 'expression': 'Dimensions.Width'},
+            ],
+        })
+
+        assert_success_contains(self, result, "Added 3 constraints",
+                                "indices=[0, 1, 2]", "DoF=0")
+        s.addConstraint.assert_called_once()
+        self.assertEqual(s.ConstraintCount, 3)
+        s.setExpression.assert_called_once_with('Constraints[2]', 'Dimensions.Width')
+        doc.recompute.assert_called_once()
+        s.solve.assert_called_once()
+
+    def test_invalid_entry_adds_nothing(self):
+        s = _make_real_sketch_mock("S")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        result = self.handler.add_constraints({
+            'sketch_name': 'S',
+            'constraints': [
+                {'constraint_type': 'Horizontal', 'geo_id1': 0},
+                {'constraint_type': 'Radius', 'geo_id1': 1},
+            ],
+        })
+
+        self.assertIn("constraints[1]", result)
+        self.assertIn("requires a value", result)
+        s.addConstraint.assert_not_called()
+
+    def test_empty_list_rejected(self):
+        result = self.handler.add_constraints({'sketch_name': 'S', 'constraints': []})
+        self.assertIn("non-empty list", result)
+
+
 # ---------------------------------------------------------------------------
 # delete_constraint
 # ---------------------------------------------------------------------------
@@ -593,6 +925,88 @@ class TestDeleteConstraint(unittest.TestCase):
         assert_success_contains(self, result, "Deleted constraint 3", "S")
 
 
+# ---------------------------------------------------------------------------
+# list_constraints
+# ---------------------------------------------------------------------------
+
+class TestListConstraints(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+
+    def _sketch_with_constraints(self, touched):
+        s = _make_real_sketch_mock("S")
+        c = MagicMock(Type='Horizontal', First=0, FirstPos=0,
+                      Second=-2000, Third=-2000, Value=0)
+        c.Name = ''
+        s.Constraints = [c, c]
+        s.ConstraintCount = 2
+        s.DoF = 3
+        s.isTouched = MagicMock(return_value=touched)
+        return s
+
+    def test_untouched_sketch_not_resolved(self):
+        s = self._sketch_with_constraints(touched=False)
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        result = json.loads(self.handler.list_constraints({'sketch_name': 'S'}))
+
+        self.assertEqual([c["index"] for c in result["constraints"]], [0, 1])
+        self.assertEqual(result["degrees_of_freedom"], 3)
+        s.solve.assert_not_called()
+
+    def test_touched_sketch_resolved_before_reporting(self):
+        s = self._sketch_with_constraints(touched=True)
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+
+        self.handler.list_constraints({'sketch_name': 'S'})
+
+        s.solve.assert_called_once()
+
+
+# ---------------------------------------------------------------------------
+# verify_sketch
+# ---------------------------------------------------------------------------
+
+class TestVerifySketch(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        self.handler = make_handler(SketchOpsHandler)
+
+    def _verify(self, touched, dof=0, state=(), solve_code=0):
+        s = _make_real_sketch_mock("S")
+        s.TypeId = 'Sketcher::SketchObject'
+        s.Shape = None
+        s.DoF = dof
+        s.State = list(state)
+        s.solve.return_value = solve_code
+        s.isTouched = MagicMock(return_value=touched)
+        s.getConstruction = MagicMock(return_value=False)
+        s.getOpenVertices = MagicMock(return_value=[])
+        s.detectMissingPointOnPointConstraints = MagicMock(return_value=0)
+        mock_FreeCAD.ActiveDocument = make_mock_doc([s])
+        return s, self.handler.verify_sketch({'sketch_name': 'S'})
+
+    def test_untouched_sketch_not_resolved(self):
+        s, result = self._verify(touched=False, dof=2)
+        s.solve.assert_not_called()
+        self.assertIn("2 degrees of freedom", result)
+
+    def test_touched_sketch_resolved_and_dof_read_from_sketch(self):
+        s, result = self._verify(touched=True, dof=0, solve_code=0)
+        s.solve.assert_called_once()
+        self.assertIn("Fully constrained: Yes", result)
+
+    def test_failed_solve_reports_conflict(self):
+        _, result = self._verify(touched=True, dof=0, solve_code=-3)
+        self.assertIn("Over-constrained", result)
+
+    def test_invalid_after_recompute_reports_conflict(self):
+        s, result = self._verify(touched=False, state=['Invalid'])
+        s.solve.assert_not_called()
+        self.assertIn("Over-constrained", result)
+
+
 class TestCreateSketchNoDocument(unittest.TestCase):
     """create_sketch with no active document must return an error, not crash."""
 
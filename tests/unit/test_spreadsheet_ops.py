@@ -52,6 +52,14 @@ class TestColumnConversionHelpers(unittest.TestCase):
         for n in (1, 25, 26, 27, 28, 52, 53, 702, 703):
             self.assertEqual(_col_to_num(_num_to_col(n)), n)
 
+    def test_two_and_three_letter_edges(self):
+        self.assertEqual(_num_to_col(702), 'ZZ')
+        self.assertEqual(_num_to_col(703), 'AAA')
+        self.assertEqual(_num_to_col(16384), 'XFD')
+        self.assertEqual(_num_to_col(0), '')
+        for n in range(1, 20000):
+            self.assertEqual(_col_to_num(_num_to_col(n)), n)
+
 
 class TestCreateSpreadsheet(unittest.TestCase):
     def setUp(self):
@@ -132,6 +140,52 @@ class TestSetCell(unittest.TestCase):
         self.assertEqual(sheet._cells_data['A1'], '25')
 
 
+class TestDeferredWrites(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        SpreadsheetOpsHandler._pending_recompute.clear()
+        self.handler = make_handler(SpreadsheetOpsHandler)
+
+    def tearDown(self):
+        SpreadsheetOpsHandler._pending_recompute.clear()
+
+    def test_deferred_writes_share_one_recompute(self):
+        sheet = make_spreadsheet("Params")
+        doc = make_mock_doc([sheet])
+        mock_FreeCAD.ActiveDocument = doc
+
+        for i in range(1, 4):
+            result = self.handler.set_cell({
+                'spreadsheet_name': 'Params', 'cell': f'A{i}', 'value': i,
+                'defer_recompute': True,
+            })
+            assert_success_contains(self, result, "recompute deferred")
+        self.handler.set_alias({
+            'spreadsheet_name': 'Params', 'cell': 'A1', 'alias': 'w',
+            'defer_recompute': True,
+        })
+        doc.recompute.assert_not_called()
+
+        # A read settles the pending recompute before returning values
+        self.handler.get_cell({'spreadsheet_name': 'Params', 'cell': 'A1'})
+        doc.recompute.assert_called_once()
+
+    def test_plain_write_after_deferred_writes_recomputes_once(self):
+        sheet = make_spreadsheet("Params")
+        doc = make_mock_doc([sheet])
+        mock_FreeCAD.ActiveDocument = doc
+
+        self.handler.set_cell({
+            'spreadsheet_name': 'Params', 'cell': 'A1', 'value': 1,
+            'defer_recompute': True,
+        })
+        self.handler.set_cell({
+            'spreadsheet_name': 'Params', 'cell': 'A2', 'value': 2,
+        })
+        doc.recompute.assert_called_once()
+        self.assertNotIn(doc, SpreadsheetOpsHandler._pending_recompute)
+
+
 class TestGetCell(unittest.TestCase):
     def setUp(self):
         reset_mocks()
@@ -296,6 +350,21 @@ class TestSetCellRange(unittest.TestCase):
         self.assertEqual(sheet._cells_data['D2'], '3')
         self.assertEqual(sheet._cells_data['D3'], '6')
 
+    def test_ragged_rows_cross_z_to_aa(self):
+        """Rows of different lengths starting at Y share one column table."""
+        sheet = make_spreadsheet("Params")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        result = self.handler.set_cell_range({
+            'spreadsheet_name': 'Params',
+            'start_cell': 'Y9',
+            'values': [['a'], ['b', 'c', 'd'], 'e'],
+        })
+
+        assert_success_contains(self, result, "Set 5 cells")
+        self.assertEqual(sheet._cells_data,
+                         {'Y9': 'a', 'Y10': 'b', 'Z10': 'c', 'AA10': 'd', 'Y11': 'e'})
+
 
 class TestGetCellRange(unittest.TestCase):
     """get_cell_range had zero test coverage before this class."""
@@ -360,6 +429,33 @@ class TestGetCellRange(unittest.TestCase):
 
         self.assertEqual(result['values'], [['']])
 
+    def test_only_used_cells_are_read(self):
+        sheet = make_spreadsheet("Params")
+        sheet.set('B3', '7')
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+        sheet.get.reset_mock()
+
+        result = json.loads(self.handler.get_cell_range({
+            'spreadsheet_name': 'Params', 'start_cell': 'A1', 'end_cell': 'J10',
+        }))
+
+        self.assertEqual(result['values'][2][1], '7')
+        self.assertEqual(sum(v != '' for row in result['values'] for v in row), 1)
+        sheet.get.assert_called_once_with('B3')
+
+    def test_reads_every_cell_when_used_cells_unavailable(self):
+        sheet = make_spreadsheet("Params")
+        sheet.set('B1', '7')
+        sheet.getUsedCells.side_effect = RuntimeError("no used-cell list")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        result = json.loads(self.handler.get_cell_range({
+            'spreadsheet_name': 'Params', 'start_cell': 'A1', 'end_cell': 'B1',
+        }))
+
+        self.assertEqual(result['values'], [['', '7']])
+        self.assertEqual(sheet.get.call_count, 2)
+
     def test_invalid_start_cell_errors(self):
         sheet = make_spreadsheet("Params")
         doc = make_mock_doc([sheet])
@@ -453,6 +549,45 @@ class TestListAliases(unittest.TestCase):
         })
 
 
+    def test_parsed_xml_without_aliases_skips_per_cell_fallback(self):
+        sheet = make_spreadsheet("Params")
+        sheet.cells.Content = '<cells><Cell address="A1" content="5"/></cells>'
+        sheet.getUsedCells = MagicMock(return_value=['A1'])
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        payload = json.loads(self.handler.list_aliases({'spreadsheet_name': 'Params'}))
+
+        self.assertEqual(payload['aliases'], {})
+        sheet.getUsedCells.assert_not_called()
+        sheet.getAlias.assert_not_called()
+
+    def test_unparseable_xml_falls_back_to_used_cells(self):
+        sheet = make_spreadsheet("Params")
+        sheet.cells.Content = 'not xml'
+        sheet.getUsedCells = MagicMock(return_value=['AC7'])
+        sheet.setAlias('AC7', 'depth')
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        payload = json.loads(self.handler.list_aliases({'spreadsheet_name': 'Params'}))
+
+        self.assertEqual(payload['aliases'], {'AC7': 'depth'})
+
+
+    def test_truncated_xml_discards_partial_parse(self):
+        """A parse error part-way through must not return the aliases read
+        so far as if they were complete."""
+        sheet = make_spreadsheet("Params")
+        sheet.cells.Content = '<cells><Cell address="A1" alias="w"/><Cell addr'
+        sheet.getUsedCells = MagicMock(return_value=['A1', 'B4'])
+        sheet.setAlias('A1', 'w')
+        sheet.setAlias('B4', 'h')
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        payload = json.loads(self.handler.list_aliases({'spreadsheet_name': 'Params'}))
+
+        self.assertEqual(payload['aliases'], {'A1': 'w', 'B4': 'h'})
+
+
 class TestCsvRoundTrip(unittest.TestCase):
     def setUp(self):
         reset_mocks()
@@ -473,6 +608,27 @@ class TestCsvRoundTrip(unittest.TestCase):
         self.assertEqual(sheet._cells_data.get('A1'), 'Smith, John')
         self.assertEqual(sheet._cells_data.get('B1'), '42')
 
+    def test_import_skips_empty_fields_on_empty_cells(self):
+        sheet = make_spreadsheet("S")
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        result = self.handler.import_csv({
+            'spreadsheet_name': 'S', 'csv_data': 'a,,b\n,,\n',
+        })
+
+        assert_success_contains(self, result, "Imported 6 cells")
+        self.assertEqual(sheet.set.call_count, 2)
+        self.assertEqual(sheet._cells_data, {'A1': 'a', 'C1': 'b'})
+
+    def test_import_empty_field_still_clears_existing_cell(self):
+        sheet = make_spreadsheet("S")
+        sheet._cells_data['B1'] = 'stale'
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        self.handler.import_csv({'spreadsheet_name': 'S', 'csv_data': 'a,\n'})
+
+        self.assertEqual(sheet._cells_data['B1'], '')
+
     def test_export_quotes_field_with_comma(self):
         """csv.writer must quote a comma-containing field so the CSV re-imports
         into the correct columns; the old delimiter.join did not."""
@@ -488,6 +644,17 @@ class TestCsvRoundTrip(unittest.TestCase):
         payload = json.loads(result)
         self.assertIn('"a,b"', payload['csv'])
 
+    def test_export_rows_do_not_leak_into_each_other(self):
+        sheet = make_spreadsheet("S")
+        sheet._cells_data.update({'A1': 'x', 'B1': 'y', 'B2': 'z'})
+        mock_FreeCAD.ActiveDocument = make_mock_doc([sheet])
+
+        payload = json.loads(self.handler.export_csv({
+            'spreadsheet_name': 'S', 'start_cell': 'A1', 'end_cell': 'B3',
+        }))
+
+        self.assertEqual(payload['csv'].splitlines(), ['x,y', ',z', ','])
+
     def test_truncation_check_failure_is_surfaced_not_silenced(self):
         """M12: a bare except around the getUsedRange() truncation check
         made truncated silently stay False whenever the CHECK ITSELF
@@ -89,6 +89,57 @@ class TestMoveObject(unittest.TestCase):
         assert_success_contains(self, result, "Moved MyBox")
         self.assertEqual(box.Placement.Base.x, 5.0)
 
+    def test_placement_written_back_as_a_whole(self):
+        """Like FreeCAD, reading Placement returns a copy, so the move only
+        sticks if the edited copy is assigned back to obj.Placement."""
+        stored = [_Placement(_Vec(1, 2, 3))]
+
+        def _read(_self):
+            p = stored[0]
+            return _Placement(_Vec(p.Base.x, p.Base.y, p.Base.z), p.Rotation)
+
+        def _write(_self, value):
+            stored.append(value)
+            stored[0] = value
+
+        box = make_box_object("B")
+        type(box).Placement = property(_read, _write)
+        mock_FreeCAD.ActiveDocument = make_mock_doc([box])
+
+        self.handler.move_object({'object_name': 'B', 'x': 10, 'y': 0, 'z': 0})
+
+        self.assertEqual(len(stored), 2)  # initial + one write
+        self.assertEqual((stored[0].Base.x, stored[0].Base.y, stored[0].Base.z),
+                         (11, 2, 3))
+
+
+class TestDeferredTransforms(unittest.TestCase):
+    def setUp(self):
+        reset_mocks()
+        TransformsHandler._pending_recompute.clear()
+        self.handler = make_handler(TransformsHandler)
+
+    def tearDown(self):
+        TransformsHandler._pending_recompute.clear()
+
+    def test_move_and_rotate_defer_to_one_flush(self):
+        box = make_box_object("B")
+        box.Placement = _Placement(_Vec(0, 0, 0))
+        doc = make_mock_doc([box])
+        mock_FreeCAD.ActiveDocument = doc
+        mock_FreeCAD.listDocuments.return_value = {'Doc': doc}
+
+        moved = self.handler.move_object({
+            'object_name': 'B', 'x': 1, 'defer_recompute': True})
+        rotated = self.handler.rotate_object({
+            'object_name': 'B', 'angle': 45, 'defer_recompute': True})
+
+        assert_success_contains(self, moved, "Moved B", "recompute deferred")
+        assert_success_contains(self, rotated, "Rotated B", "recompute deferred")
+        doc.recompute.assert_not_called()
+        self.assertEqual(self.handler.flush_recomputes(), 1)
+        doc.recompute.assert_called_once()
+
 
 class TestRotateObject(unittest.TestCase):
     def setUp(self):
@@ -121,6 +172,18 @@ class TestRotateObject(unittest.TestCase):
         })
         assert_error_contains(self, result, "not found")
 
+    def test_zero_angle_is_a_no_op(self):
+        box = make_box_object("B")
+        rotation = box.Placement.Rotation
+        doc = make_mock_doc([box])
+        mock_FreeCAD.ActiveDocument = doc
+
+        result = self.handler.rotate_object({'object_name': 'B', 'angle': 0})
+
+        assert_success_contains(self, result, "no change")
+        self.assertIs(box.Placement.Rotation, rotation)
+        doc.recompute.assert_not_called()
+
     def test_invalid_axis_rejected_instead_of_silent_default(self):
         """An unrecognized axis used to silently rotate around Z while the
         success message still echoed the requested axis string, e.g.
@@ -96,6 +96,83 @@ class TestHideShowObject:
         assert "not found" in result.lower()
 
 
+class TestSetView:
+    def test_canonical_name(self):
+        with patch(_GUI_PATH) as gui:
+            result = make_handler().set_view({"view_type": "top"})
+        gui.runCommand.assert_called_once_with("Std_ViewTop", 0)
+        assert result == "View set to top"
+
+    def test_mixed_case_name(self):
+        with patch(_GUI_PATH) as gui:
+            result = make_handler().set_view({"view_type": "Iso"})
+        gui.runCommand.assert_called_once_with("Std_ViewIsometric", 0)
+        assert result == "View set to iso"
+
+    def test_unknown_name(self):
+        with patch(_GUI_PATH) as gui:
+            result = make_handler().set_view({"view_type": "sideways"})
+        gui.runCommand.assert_not_called()
+        assert result.startswith("Unknown view type: sideways")
+
+
+class TestZoom:
+    def test_zoom_in_uses_active_document_once(self):
+        with patch(_GUI_PATH) as gui:
+            result = make_handler().zoom_in({})
+        gui.ActiveDocument.activeView.return_value.zoomIn.assert_called_once()
+        gui.activeDocument.assert_not_called()
+        assert result == "Zoomed in"
+
+    def test_zoom_out_without_document(self):
+        with patch(_GUI_PATH) as gui:
+            gui.ActiveDocument = None
+            assert make_handler().zoom_out({}) == "No active document"
+
+
+class TestSetObjectsVisibility:
+    def test_hides_all_named_objects(self):
+        doc = make_mock_doc()
+        box, cylinder = doc.Objects
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = doc
+            result = make_handler().set_objects_visibility(
+                {"object_names": ["Box", "MyCylinder"], "visible": False})
+        assert result.startswith("2 object(s) hidden")
+        assert box.ViewObject.Visibility is False
+        assert cylinder.ViewObject.Visibility is False
+
+    def test_shows_and_reports_missing(self):
+        doc = make_mock_doc()
+        box = doc.Objects[0]
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = doc
+            result = make_handler().set_objects_visibility(
+                {"object_names": ["Box", "Ghost"], "visible": True})
+        assert result == "1 object(s) shown: Box; not found: Ghost"
+        assert box.ViewObject.Visibility is True
+
+    def test_requires_names(self):
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = make_mock_doc()
+            result = make_handler().set_objects_visibility({"visible": True})
+        assert "object_names" in result
+
+    def test_leaves_deferred_recompute_pending(self):
+        doc = make_mock_doc()
+        handler = make_handler()
+        handler._pending_recompute.add(doc)
+        try:
+            with patch(_FREECAD_PATH) as fc:
+                fc.ActiveDocument = doc
+                handler.set_objects_visibility(
+                    {"object_names": ["Box"], "visible": False})
+            doc.recompute.assert_not_called()
+            assert doc in handler._pending_recompute
+        finally:
+            handler._pending_recompute.discard(doc)
+
+
 class TestDeleteObject:
     def test_delete_by_internal_name(self):
         with patch(_FREECAD_PATH) as fc:
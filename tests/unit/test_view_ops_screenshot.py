@@ -24,6 +24,7 @@ sys.modules.setdefault("FreeCADGui", MagicMock())
 sys.modules.setdefault("Part", MagicMock())
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "..", "AICopilot"))
+from handlers import view_ops  # noqa: E402
 from handlers.view_ops import ViewOpsHandler  # noqa: E402
 
 # Patch targets inside the handler module
@@ -35,6 +36,13 @@ _FREECAD_PATH = "handlers.view_ops.FreeCAD"
 # Helpers
 # ---------------------------------------------------------------------------
 
+# Minimal JPEG header: SOI, a 16-byte APP0 segment, then SOF0 for 40x30
+JPEG_40x30 = (
+    b"\xff\xd8"
+    + b"\xff\xe0\x00\x10" + b"JFIF\x00" + b"\x00" * 9
+    + b"\xff\xc0\x00\x11\x08\x00\x1e\x00\x28\x03" + b"\x00" * 9
+)
+
 # 1×1 transparent PNG
 PNG_1x1 = base64.b64decode(
     "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNk+M9QDwADhgGAWjR9awAAAABJRU5ErkJggg=="
@@ -221,8 +229,8 @@ class TestDarwinScreenshot:
 
     def _mock_screencapture_writes(self, png_bytes):
         def _run(cmd, timeout=None, capture_output=None):
-            # cmd is ["screencapture", "-x", tmp_path]
-            with open(cmd[2], "wb") as f:
+            # cmd is ["screencapture", "-x", [-t jpg,] tmp_path]
+            with open(cmd[-1], "wb") as f:
                 f.write(png_bytes)
             proc = MagicMock()
             proc.returncode = 0
@@ -286,6 +294,312 @@ class TestDarwinScreenshot:
         assert "screencapture failed" in result["error"]
 
 
+class TestSceneObserver:
+    """With the document observer registered, the scene signature is a
+    generation counter and a cache hit walks no objects at all."""
+
+    def setup_method(self):
+        view_ops._face_count_cache.clear()
+        self._observer = view_ops._scene_observer
+        view_ops._scene_observer = None
+
+    def teardown_method(self):
+        view_ops._scene_observer = self._observer
+
+    def test_registers_once_with_app_and_gui(self):
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH) as gui:
+            assert view_ops._watch_scene() is True
+            assert view_ops._watch_scene() is True
+        fc.addDocumentObserver.assert_called_once_with(view_ops._scene_observer)
+        gui.addDocumentObserver.assert_called_once_with(view_ops._scene_observer)
+
+    def test_reload_unregisters_previous_observer(self):
+        """_reload_handlers re-executes the module file; the fresh module
+        must drop the old module's observer rather than stack another."""
+        import importlib.util
+        observer = view_ops._SceneObserver()
+        view_ops._scene_observer = observer
+        fc, gui = MagicMock(), MagicMock()
+        spec = importlib.util.spec_from_file_location(view_ops.__name__, view_ops.__file__)
+        fresh = importlib.util.module_from_spec(spec)
+        with patch.dict(sys.modules, {"FreeCAD": fc, "FreeCADGui": gui}):
+            spec.loader.exec_module(fresh)
+        fc.removeDocumentObserver.assert_called_once_with(observer)
+        gui.removeDocumentObserver.assert_called_once_with(observer)
+        gui.Selection.removeObserver.assert_called_once_with(observer)
+        assert fresh._scene_observer is None
+
+    def test_registration_failure_falls_back_to_hashes(self):
+        with patch(_FREECAD_PATH) as fc:
+            fc.addDocumentObserver.side_effect = RuntimeError("no observers")
+            fc.ActiveDocument.Objects = []
+            assert view_ops._watch_scene() is False
+            key, shapes = view_ops._visible_scene()
+        assert shapes == []
+        assert key[1] == ()
+
+    def test_hit_skips_object_walk_until_an_edit(self):
+        shape = MagicMock()
+        shape.countElement.return_value = 6
+        obj = MagicMock(Visibility=True, Shape=shape)
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH):
+            fc.ActiveDocument.Name = "Doc"
+            fc.ActiveDocument.Objects = [obj]
+            assert view_ops._estimate_scene_faces() == 6
+            shape.countElement.return_value = 8
+            assert view_ops._estimate_scene_faces() == 6  # no edit seen
+            view_ops._scene_observer.slotChangedObject(obj, "Length")
+            assert view_ops._estimate_scene_faces() == 8
+        shape.hashCode.assert_not_called()
+
+
+class TestSaveTimeScaling:
+    """Measured saveImage() time per megapixel drives the next request's size."""
+
+    def setup_method(self):
+        view_ops._save_ms_per_mpx = None
+
+    def teardown_method(self):
+        view_ops._save_ms_per_mpx = None
+
+    def test_no_history_keeps_full_size(self):
+        assert view_ops._save_time_scale(1920, 1080) == 1.0
+
+    def test_fast_renders_keep_full_size(self):
+        view_ops._record_save_time(100, 1000, 1000)
+        assert view_ops._save_time_scale(1000, 1000) == 1.0
+
+    def test_slow_renders_scale_pixel_count_to_budget(self):
+        # 8x over budget at 1 MP -> sqrt(1/8) per side -> 1/8 the pixels
+        view_ops._record_save_time(view_ops._SAVE_TARGET_MS * 8, 1000, 1000)
+        assert abs(view_ops._save_time_scale(1000, 1000) - 8 ** -0.5) < 1e-9
+
+    def test_scale_has_a_floor(self):
+        view_ops._record_save_time(view_ops._SAVE_TARGET_MS * 1000, 1000, 1000)
+        assert view_ops._save_time_scale(1000, 1000) == view_ops._SAVE_MIN_SCALE
+
+    def test_rate_is_smoothed(self):
+        view_ops._record_save_time(1000, 1000, 1000)
+        view_ops._record_save_time(2000, 1000, 1000)
+        expected = (1 - view_ops._SAVE_EWMA_ALPHA) * 1000 + view_ops._SAVE_EWMA_ALPHA * 2000
+        assert abs(view_ops._save_ms_per_mpx - expected) < 1e-9
+
+    def test_take_screenshot_applies_scale_and_notes_it(self):
+        view_ops._save_ms_per_mpx = view_ops._SAVE_TARGET_MS * 4 / 0.48  # 4x over at 800x600
+        captured = {}
+        mock_view = MagicMock()
+
+        def _save(path, w, h):
+            captured["w"], captured["h"] = w, h
+            with open(path, "wb") as f:
+                f.write(PNG_1x1)
+
+        mock_view.saveImage.side_effect = _save
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH) as gui, patch(_PLATFORM_PATH) as plat:
+            fc.GuiUp = True
+            plat.system.return_value = "Linux"
+            gui.activeDocument.return_value = make_mock_doc(mock_view)
+            result = json.loads(make_handler().take_screenshot({}))
+
+        assert captured == {"w": 400, "h": 300}
+        assert "800x600 to 400x300" in result["note"]
+        assert "recent renders were slow" in result["note"]
+
+
+class TestScreenshotFormat:
+    def test_jpeg_saved_with_jpg_suffix(self):
+        seen = {}
+        mock_view = MagicMock()
+
+        def _save(path, w, h):
+            seen["path"] = path
+            with open(path, "wb") as f:
+                f.write(JPEG_40x30)
+
+        mock_view.saveImage.side_effect = _save
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH) as gui, patch(_PLATFORM_PATH) as plat:
+            fc.GuiUp = True
+            plat.system.return_value = "Linux"
+            gui.activeDocument.return_value = make_mock_doc(mock_view)
+            result = json.loads(make_handler().take_screenshot({"format": "jpeg"}))
+
+        assert seen["path"].endswith(".jpg")
+        assert result["mime_type"] == "image/jpeg"
+        assert base64.b64decode(result["image_data"]) == JPEG_40x30
+
+    def test_unknown_format_rejected(self):
+        result = json.loads(make_handler().take_screenshot({"format": "gif"}))
+        assert result["success"] is False
+        assert "gif" in result["error"]
+
+    def test_darwin_jpeg_uses_type_flag_and_reads_jpeg_size(self):
+        seen = {}
+
+        def _run(cmd, timeout=None, capture_output=None):
+            seen["cmd"] = cmd
+            with open(cmd[-1], "wb") as f:
+                f.write(JPEG_40x30)
+            return MagicMock(returncode=0, stderr=b"")
+
+        with patch(_FREECAD_PATH) as fc, patch(_PLATFORM_PATH) as plat, \
+             patch("subprocess.run", side_effect=_run):
+            fc.GuiUp = True
+            fc.ActiveDocument = MagicMock()
+            plat.system.return_value = "Darwin"
+            result = json.loads(make_handler().take_screenshot({"format": "jpg"}))
+
+        assert seen["cmd"][:4] == ["screencapture", "-x", "-t", "jpg"]
+        assert result["mime_type"] == "image/jpeg"
+        assert (result["width"], result["height"]) == (40, 30)
+
+
+class TestScreenshotCache:
+    """Unchanged scene + camera + size returns the previous render."""
+
+    def setup_method(self):
+        view_ops._screenshot_cache.clear()
+        # register the observer against the patched App/Gui modules below
+        self._observer = (view_ops._scene_observer, view_ops._scene_observer_gui)
+        view_ops._scene_observer, view_ops._scene_observer_gui = None, False
+
+    def teardown_method(self):
+        view_ops._screenshot_cache.clear()
+        view_ops._scene_observer, view_ops._scene_observer_gui = self._observer
+
+    def _run(self, view, calls, gui_observer_fails=False):
+        """Run calls against one handler: dicts are screenshot args,
+        callables get the handler (for interleaved view edits)."""
+        results = []
+        handler = make_handler()
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH) as gui, patch(_PLATFORM_PATH) as plat, \
+                patch.dict(sys.modules, {"pivy": MagicMock()}):
+            fc.GuiUp = True
+            plat.system.return_value = "Linux"
+            gui.activeDocument.return_value = make_mock_doc(view)
+            if gui_observer_fails:
+                gui.addDocumentObserver.side_effect = RuntimeError("no Gui observers")
+            for call in calls:
+                if callable(call):
+                    call(handler)
+                else:
+                    results.append(json.loads(handler.take_screenshot(call)))
+        return results
+
+    def test_repeat_call_served_from_cache(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        first, second = self._run(view, [{}, {}])
+        assert view.saveImage.call_count == 1
+        assert "cached" not in first
+        assert second["cached"] is True
+        assert second["image_data"] == first["image_data"]
+
+    def test_camera_change_renders_again(self):
+        view = make_mock_view()
+        view.getCamera.side_effect = ["cam-1", "cam-2"]
+        self._run(view, [{}, {}])
+        assert view.saveImage.call_count == 2
+
+    def test_size_change_renders_again(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        self._run(view, [{}, {"width": 640, "height": 480}])
+        assert view.saveImage.call_count == 2
+
+    def test_clip_plane_forces_render(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        before, clipped, again = self._run(view, [
+            {}, lambda h: h.add_clip_plane({"axis": "z", "depth": 5}), {}, {}])
+        assert view.saveImage.call_count == 2
+        assert "cached" not in clipped
+        assert again["cached"] is True
+
+    def test_clip_plane_removal_forces_render(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        self._run(view, [
+            lambda h: h.add_clip_plane({}), {},
+            lambda h: h.remove_clip_plane({}), {}])
+        assert view.saveImage.call_count == 2
+
+    def test_selection_change_forces_render(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        self._run(view, [
+            {}, lambda h: view_ops._scene_observer.addSelection("Doc", "Box", ""), {}])
+        assert view.saveImage.call_count == 2
+
+    def test_no_cache_without_gui_observer(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        first, second = self._run(view, [{}, {}], gui_observer_fails=True)
+        assert view.saveImage.call_count == 2
+        assert "cached" not in second
+
+    def test_nocache_forces_render(self):
+        view = make_mock_view()
+        view.getCamera.return_value = "cam-1"
+        self._run(view, [{}, {"nocache": True}])
+        assert view.saveImage.call_count == 2
+
+
+class TestScreenshotTmpDir:
+    """The scratch PNG goes to tmpfs on Linux, the default tempdir elsewhere."""
+
+    def test_linux_uses_writable_shm(self, tmp_path):
+        with patch(_PLATFORM_PATH) as plat, patch.object(view_ops, "_SHM_DIR", str(tmp_path)):
+            plat.system.return_value = "Linux"
+            assert view_ops._screenshot_tmp_dir() == str(tmp_path)
+
+    def test_linux_without_shm_uses_default(self, tmp_path):
+        with patch(_PLATFORM_PATH) as plat, \
+                patch.object(view_ops, "_SHM_DIR", str(tmp_path / "missing")):
+            plat.system.return_value = "Linux"
+            assert view_ops._screenshot_tmp_dir() is None
+
+    def test_other_platforms_use_default(self, tmp_path):
+        with patch(_PLATFORM_PATH) as plat, patch.object(view_ops, "_SHM_DIR", str(tmp_path)):
+            plat.system.return_value = "Darwin"
+            assert view_ops._screenshot_tmp_dir() is None
+
+    def test_save_image_writes_into_tmp_dir(self, tmp_path):
+        seen = {}
+        mock_view = MagicMock()
+
+        def _save(path, w, h):
+            seen["dir"] = os.path.dirname(path)
+            with open(path, "wb") as f:
+                f.write(PNG_1x1)
+
+        mock_view.saveImage.side_effect = _save
+        with patch(_FREECAD_PATH) as fc, patch(_GUI_PATH) as gui, patch(_PLATFORM_PATH) as plat, \
+                patch.object(view_ops, "_SHM_DIR", str(tmp_path)):
+            fc.GuiUp = True
+            plat.system.return_value = "Linux"
+            gui.activeDocument.return_value = make_mock_doc(mock_view)
+            result = json.loads(make_handler().take_screenshot({}))
+
+        assert result["success"] is True
+        assert seen["dir"] == str(tmp_path)
+        assert list(tmp_path.iterdir()) == []  # scratch file cleaned up
+
+
+class TestEncodeFileBase64:
+    """Chunked encoding must match a one-shot b64encode of the whole file."""
+
+    def test_multi_chunk_file_matches_one_shot(self, tmp_path):
+        data = os.urandom(view_ops._B64_CHUNK * 2 + 7)  # odd tail forces padding
+        p = tmp_path / "big.png"
+        p.write_bytes(data)
+        assert view_ops._encode_file_base64(str(p)) == base64.b64encode(data).decode("ascii")
+
+    def test_empty_file(self, tmp_path):
+        p = tmp_path / "empty.png"
+        p.write_bytes(b"")
+        assert view_ops._encode_file_base64(str(p)) == ""
+
+
 class TestReadPngDimensions:
     """_read_png_dimensions is the module-level helper M7's fix depends on
     for real (not requested) capture dimensions."""
@@ -296,6 +610,16 @@ class TestReadPngDimensions:
         p.write_bytes(PNG_1x1)
         assert _read_png_dimensions(str(p)) == (1, 1)
 
+    def test_reads_jpeg_frame_header(self, tmp_path):
+        p = tmp_path / "test.jpg"
+        p.write_bytes(JPEG_40x30)
+        assert view_ops._read_jpeg_dimensions(str(p)) == (40, 30)
+
+    def test_png_is_not_a_jpeg(self, tmp_path):
+        p = tmp_path / "test.png"
+        p.write_bytes(PNG_1x1)
+        assert view_ops._read_jpeg_dimensions(str(p)) is None
+
     def test_non_png_file_returns_none(self, tmp_path):
         from handlers.view_ops import _read_png_dimensions
         p = tmp_path / "not_a_png.png"
@@ -311,3 +635,111 @@ class TestReadPngDimensions:
         p = tmp_path / "truncated.png"
         p.write_bytes(PNG_1x1[:10])  # PNG signature but no IHDR chunk
         assert _read_png_dimensions(str(p)) is None
+
+
+# ---------------------------------------------------------------------------
+# _estimate_scene_faces caching
+# ---------------------------------------------------------------------------
+
+class TestEstimateSceneFaces:
+    def _doc(self, *shapes):
+        doc = MagicMock()
+        doc.Name = "Doc"
+        doc.Objects = []
+        for shape in shapes:
+            obj = MagicMock()
+            obj.Shape = shape
+            obj.ViewObject.Visibility = True
+            doc.Objects.append(obj)
+        return doc
+
+    def _shape(self, hash_code, faces):
+        shape = MagicMock()
+        shape.hashCode.return_value = hash_code
+        shape.countElement.return_value = faces
+        return shape
+
+    def setup_method(self):
+        view_ops._face_count_cache.clear()
+        # exercise the shape-hash signature, not the observer generation
+        self._observer = view_ops._scene_observer
+        view_ops._scene_observer = False
+
+    def teardown_method(self):
+        view_ops._scene_observer = self._observer
+
+    def test_unchanged_scene_served_from_cache(self):
+        a, b = self._shape(1, 6), self._shape(2, 4)
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = self._doc(a, b)
+            assert view_ops._estimate_scene_faces() == 10
+            # Faces would now count differently, but the hashes are unchanged
+            a.countElement.return_value = 0
+            assert view_ops._estimate_scene_faces() == 10
+
+    def test_recomputed_shape_misses_cache(self):
+        a = self._shape(1, 6)
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = self._doc(a)
+            assert view_ops._estimate_scene_faces() == 6
+            fc.ActiveDocument = self._doc(self._shape(99, 12))
+            assert view_ops._estimate_scene_faces() == 12
+
+    def test_counts_without_building_faces_list(self):
+        shape = self._shape(1, 7)
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = self._doc(shape)
+            assert view_ops._estimate_scene_faces() == 7
+        shape.countElement.assert_called_once_with("Face")
+
+    def test_falls_back_to_faces_without_count_element(self):
+        shape = MagicMock(spec=["hashCode", "Faces"])
+        shape.hashCode.return_value = 1
+        shape.Faces = [object()] * 3
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = self._doc(shape)
+            assert view_ops._estimate_scene_faces() == 3
+
+    def test_app_visibility_skips_view_object(self):
+        shown, hidden = self._shape(1, 5), self._shape(2, 9)
+        doc = self._doc(shown, hidden)
+        doc.Objects[0].Visibility = True
+        doc.Objects[1].Visibility = False
+        # ViewObject says the opposite; the App property must win
+        doc.Objects[0].ViewObject.Visibility = False
+        doc.Objects[1].ViewObject.Visibility = True
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = doc
+            assert view_ops._estimate_scene_faces() == 5
+
+    def test_server_visibility_snapshot_wins(self):
+        shown, hidden = self._shape(1, 5), self._shape(2, 9)
+        doc = self._doc(shown, hidden)
+        doc.Objects[0].Name, doc.Objects[1].Name = "A", "B"
+        doc.Objects[1].Visibility = True  # stale App read; snapshot says hidden
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = doc
+            assert view_ops._estimate_scene_faces({"A": True, "B": False}) == 5
+
+    def test_hidden_view_object_excluded_without_app_visibility(self):
+        shown, hidden = self._shape(1, 5), self._shape(2, 9)
+        doc = self._doc(shown, hidden)
+        doc.Objects[1].ViewObject.Visibility = False
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = doc
+            assert view_ops._estimate_scene_faces() == 5
+
+    def test_stops_counting_past_huge_threshold(self):
+        heavy = self._shape(1, view_ops._FACE_THRESH_HUGE)
+        rest = self._shape(2, 10)
+        with patch(_FREECAD_PATH) as fc:
+            fc.ActiveDocument = self._doc(heavy, rest)
+            assert view_ops._estimate_scene_faces() == view_ops._FACE_THRESH_HUGE
+        rest.countElement.assert_not_called()
+
+    def test_cache_is_bounded(self):
+        with patch(_FREECAD_PATH) as fc:
+            for i in range(view_ops._FACE_CACHE_SIZE + 5):
+                fc.ActiveDocument = self._doc(self._shape(i, 1))
+                view_ops._estimate_scene_faces()
+        assert len(view_ops._face_count_cache) == view_ops._FACE_CACHE_SIZE